@@ -0,0 +1,330 @@
+import asyncio
+import functools
+from contextlib import asynccontextmanager, nullcontext
+
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (TimeoutException, 
+                                        NoSuchElementException)
+
+from . import utils, wait, interact, polling, scripts, element
+
+
+async def run(func, *args, **kwargs):
+    '''run a blocking driver call in the running event loop's default
+    executor, and return its result.
+
+    Driver commands are plain blocking http requests: running them in the
+    executor keeps the event loop free while a command is in flight. Waits
+    themselves sleep on the event loop and never hold a thread.
+    '''
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(None,
+                                      functools.partial(func, *args, **kwargs))
+
+
+class AsyncPoller(polling.Poller):
+    '''
+    asyncio version of polling.Poller: until() and until_not() are coroutines
+    running conditions in the executor and sleeping with asyncio.sleep(), 
+    the wait bookkeeping being polling.Poller's (see Poller._polling()).
+    '''
+
+    async def until(self, method, message = ''):
+        '''poll method until it returns a truthy value, and return it'''
+        return await self._poll(method, message, negate = False)
+
+    async def until_not(self, method, message = ''):
+        '''poll method until it returns a falsy value (or raises an ignored
+        exception, returning True)'''
+        return await self._poll(method, message, negate = True)
+
+    async def _poll(self, method, message, negate):
+        steps = self._polling(message, negate)
+
+        try:
+            for _ in steps:
+                try:
+                    value = await run(method, self.driver)
+                except Exception as e:
+                    await asyncio.sleep(steps.throw(e))
+                else:
+                    await asyncio.sleep(steps.send(value))
+
+        except StopIteration as stop:
+            return stop.value
+
+
+class AsyncWait(wait.Wait):
+    '''
+    asyncio version of wait.Wait, where all waits are coroutines. Multiple
+    sessions/pages can wait concurrently on a single event loop.
+
+    Example:
+        wait = AsyncWait(driver, 10)
+        element = await wait.until.element_to_be_clickable(id = 'someid')
+
+        # wait on two sessions at the same time
+        await asyncio.gather(
+            AsyncWait(driver_a, 10).until.title_is('A'),
+            AsyncWait(driver_b, 10).until.title_is('B'))
+    '''
+
+    def _waits(self):
+        return AsyncWaitUntil, AsyncWaitUntilNot
+
+    async def __call__(self, timeout = None):
+        '''implicitly wait, see wait.Wait.__call__()'''
+
+        timeout = timeout or self.timeout
+
+        return await run(self.implicit.set, self.driver, timeout)
+
+    def implicitly(self, timeout):
+        '''async context manager temporarily setting the implicit wait
+
+        Example:
+            async with wait.implicitly(0):
+                elements = await run(driver.find_elements, By.ID, 'error')
+        '''
+        return implicitly(self.implicit, self.driver, timeout)
+
+
+@asynccontextmanager
+async def implicitly(state, driver, timeout):
+    '''asyncio version of wait.ImplicitWait.override()'''
+    previous = state.timeout
+    await run(state.set, driver, timeout)
+
+    try:
+        yield
+    finally:
+        if previous is not None:
+            await run(state.set, driver, previous)
+
+
+class AsyncWaitUntil(wait.WaitUntil):
+    '''
+    asyncio version of wait.WaitUntil: every condition method returns a
+    coroutine, polling with asyncio.sleep() in between polls.
+
+    in_browser mode (as well as network_idle() and dom_stable()) evaluates
+    the page with a single script per poll: long running in-browser wait
+    scripts would otherwise hold an executor thread for the entire wait.
+    '''
+
+    async def __call__(self, condition, timeout = None, message = '',
+                       **kwargs):
+        async with self._no_implicit_wait():
+            return await self._waiter(timeout, kwargs).until(condition,
+                                                             message)
+
+    def _no_implicit_wait(self):
+        if self.implicit.timeout:
+            return implicitly(self.implicit, self.driver, 0)
+
+        return nullcontext()
+
+    def _poller(self):
+        return AsyncPoller
+
+    async def _located(self, name, locator, condition, kwargs):
+        if kwargs.pop('in_browser', self.in_browser):
+            by, value = locator
+            specs = [[wait.IN_BROWSER_CHECKS[name], by, value]]
+            result = await self._evaluate(specs, 'all', **kwargs)
+
+            return result['values'][0]
+
+        return await self(condition, **kwargs)
+
+    async def _match(self, mode, conditions, kwargs, ready_state = None):
+        specs = self._specs(conditions, ready_state)
+        mode = self._mode(mode)
+        kwargs.pop('in_browser', None)
+
+        result = await self._evaluate(specs, mode, **kwargs)
+
+        return self._matched(result, conditions)
+
+    async def _evaluate(self, specs, mode, timeout = None, message = '',
+                        **kwargs):
+        '''poll in-browser check specs using a single script per poll'''
+
+        negate = self.negate
+        condition = lambda driver: driver.execute_script(scripts.EVALUATE,
+                                                         specs, mode, negate)
+
+        # negation is handled by the script itself
+        return await self._waiter(timeout, kwargs).until(condition, message)
+
+
+    async def _count(self, op, number, locator, return_elements, kwargs):
+        condition, kwargs = self._count_condition(op, number, locator,
+                                                  return_elements, kwargs)
+
+        # negation is handled by the script itself
+        result = await AsyncWaitUntil.__call__(self, condition, **kwargs)
+
+        return self._counted(result, return_elements)
+
+    async def _quiet(self, kind, quiet_ms, max_inflight, kwargs):
+        '''poll in-browser network/dom activity using a single script per
+        poll, see wait.WaitUntil.network_idle()'''
+
+        kwargs.pop('in_browser', None)
+        timeout = kwargs.pop('timeout', None)
+        message = kwargs.pop('message', '')
+
+        negate = self.negate
+        condition = lambda driver: driver.execute_script(scripts.IS_QUIET, 
+                                                         kind, quiet_ms,
+                                                         max_inflight, negate)
+
+        # negation is handled by the script itself
+        return await self._waiter(timeout, kwargs).until(condition, message)
+
+
+class AsyncWaitUntilNot(AsyncWaitUntil):
+    '''asyncio version of wait.WaitUntilNot'''
+
+    negate = True
+
+    async def __call__(self, condition, timeout = None, message = '',
+                       **kwargs):
+        async with self._no_implicit_wait():
+            return await self._waiter(timeout, kwargs).until_not(condition,
+                                                                 message)
+
+
+class AsyncInteractions(interact.Interactions):
+    '''
+    asyncio version of interact.Interactions, where all interactions are
+    coroutines. Element waits are awaited through AsyncWait, and driver
+    commands run in the event loop executor.
+    '''
+
+    def __init__(self, driver, timeout):
+        self.driver = driver
+        self.timeout = timeout
+        self.wait = AsyncWait(driver, timeout)
+
+    async def click_on_svg_element(self, css):
+        return await run(super().click_on_svg_element, css)
+
+    async def click_button_with_text(self, text):
+        return await run(super().click_button_with_text, text)
+
+    async def click_link_with_text(self, text):
+        return await run(super().click_link_with_text, text)
+
+    async def type_in_active_input_element(self, text):
+        return await run(super().type_in_active_input_element, text)
+
+    async def double_click(self, element = None, locator = None, **kwargs):
+        return await run(super().double_click, element, locator, **kwargs)
+
+    async def hover(self, element = None,
+                    x_offset = 0, y_offset = 0, locator = None, **kwargs):
+        return await run(super().hover, element, x_offset, y_offset, locator,
+                         **kwargs)
+
+    async def select_from_drop_down(self, option, locator = None, 
+                                    match = 'text', deselect_others = True,
+                                    **kwargs):
+        locator = utils.translate_arguments(locator, **kwargs)
+
+        condition = element.SelectCondition(list(locator), option, match,
+                                            deselect_others)
+        try:
+            result = await self.wait.until(condition)
+        except TimeoutException as e:
+            raise TimeoutException(condition.message) from e
+
+        return condition.selected(result)
+
+    async def drop_down_options(self, locator = None, **kwargs):
+        locator = list(utils.translate_arguments(locator, **kwargs))
+
+        condition = lambda driver: driver.execute_script(scripts.OPTIONS,
+                                                         locator)
+        result = await self.wait.until(condition, 
+                                       message = 'Select not found: %s' 
+                                                 % locator)
+
+        return [element.SelectOption(**option) 
+                for option in result['options']]
+
+    async def type_and_enter(self, value, locator = None, **kwargs):
+        locator = utils.translate_arguments(locator, **kwargs)
+
+        element = await self.wait.until.visibility_of_element_located(locator)
+        return await run(element.send_keys, value, Keys.RETURN)
+
+    async def send_return(self, locator = None, **kwargs):
+        locator = utils.translate_arguments(locator, **kwargs)
+
+        element = await self.wait.until.visibility_of_element_located(locator)
+        return await run(element.send_keys, Keys.RETURN)
+
+    async def send_tab(self, locator = None, **kwargs):
+        locator = utils.translate_arguments(locator, **kwargs)
+
+        element = await self.wait.until.visibility_of_element_located(locator)
+        return await run(element.send_keys, Keys.TAB)
+
+    async def drag_and_drop(self, source, dest):
+        source = await self.wait.until.visibility_of_element_located(source)
+        dest = await self.wait.until.visibility_of_element_located(dest)
+        await self.drag_and_drop_element(source, dest)
+
+    async def drag_and_drop_element(self, source, dest):
+        return await run(super().drag_and_drop_element, source, dest)
+
+    async def scroll_into_view(self, element = None, locator = None,
+                               **kwargs):
+        if not element:
+            locator = utils.translate_arguments(locator, **kwargs)
+
+            element = await self.wait.until.visibility_of_element_located(
+                                                                    locator)
+
+        return await run(super().scroll_into_view, element)
+
+    async def iter_virtual_list(self, items, container = None, key = None,
+                                limit = None, settle_ms = 100, patience = 3,
+                                dedupe_window = 10000, 
+                                dedupe_by_text = False):
+        '''async generator version of 
+        interact.Interactions.iter_virtual_list()
+
+        Example:
+            async for batch in interact.iter_virtual_list(
+                                                (By.CSS_SELECTOR, 'tr'),
+                                                (By.ID, 'log-viewer'),
+                                                key = 'data-row'):
+                ...
+        '''
+        reader = interact.VirtualListReader(limit, patience, dedupe_window,
+                                            dedupe_by_text)
+        container = list(container) if container else None
+        scroll = False
+
+        while not reader.done:
+            wait.Deadline.check()
+
+            result = await run(self.driver.execute_async_script,
+                               scripts.VIRTUAL_LIST, container, list(items),
+                               key, scroll, settle_ms)
+            if result is None:
+                raise NoSuchElementException('Virtual list container not '
+                                             'found: %s' % (container,))
+
+            batch = reader.read(result)
+            if batch:
+                yield batch
+
+            scroll = True
+
+    async def jquery_click(self, css):
+        return await run(super().jquery_click, css)
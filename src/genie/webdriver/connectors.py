@@ -5,8 +5,10 @@ from selenium import webdriver
 
 from pyats.connections import BaseConnection
 
+from .delegation import DriverDelegation
 
-class WebDriverConnector(BaseConnection):
+
+class WebDriverConnector(DriverDelegation, BaseConnection):
 
     def __init__(self, *args, **kwargs):
         '''__init__
@@ -75,17 +77,6 @@ class WebDriverConnector(BaseConnection):
         except Exception:
             return False
 
-    def __getattr__(self, attr):
-        # redirect get attribute to self.driver
-        if hasattr(self.driver, attr):
-            return getattr(self.driver, attr)
-        else:
-            raise AttributeError("'%s' object has no attribute '%s" 
-                                 % (type(self).__name__, attr))
-
-    def __dir__(self):
-        return sorted(super().__dir__() + dir(self.driver))
-
     @property
     def execute(self):
         # chain this execute to driver's execute
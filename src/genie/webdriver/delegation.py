@@ -0,0 +1,76 @@
+import types
+import inspect
+
+# attribute types of driver classes that are plain methods: their bound
+# method can be kept as long as the driver instance is the same
+METHOD_TYPES = (types.FunctionType,
+                types.MethodDescriptorType,
+                types.WrapperDescriptorType)
+
+# {driver class: {attribute name: whether it is a plain method}}
+_methods = {}
+
+
+def is_method(driver, attr):
+    '''whether attr of driver is a plain method of its class (not shadowed by
+    an instance attribute), resolved once per driver class'''
+
+    cls = type(driver)
+    methods = _methods.get(cls)
+
+    if methods is None:
+        methods = _methods[cls] = {}
+
+    method = methods.get(attr)
+
+    if method is None:
+        method = methods[attr] = isinstance(
+                                    inspect.getattr_static(cls, attr, None),
+                                    METHOD_TYPES)
+
+    return method and attr not in getattr(driver, '__dict__', ())
+
+
+class DriverDelegation(object):
+    '''
+    Mixin forwarding the attributes missing on its instances to their driver
+    (eg, page.find_element_by_id(...), connection.current_url).
+
+    Each missing attribute is looked up once on the driver. Plain methods of
+    the driver class are also kept on the instance as bound methods: later
+    accesses are regular attribute lookups that never reach __getattr__.
+    Other attributes (properties, instance attributes) are forwarded on
+    every access, as their value may change. Kept methods are dropped when
+    the driver is replaced.
+    '''
+
+    @property
+    def driver(self):
+        return self.__dict__.get('_driver')
+
+    @driver.setter
+    def driver(self, driver):
+        for attr in self.__dict__.pop('_delegated', ()):
+            self.__dict__.pop(attr, None)
+
+        self.__dict__['_driver'] = driver
+
+    def __getattr__(self, attr):
+        # redirect get attribute to self.driver
+        driver = self.__dict__.get('_driver')
+
+        try:
+            value = getattr(driver, attr)
+        except AttributeError:
+            raise AttributeError("'%s' object has no attribute '%s'"
+                                 % (type(self).__name__, attr)) from None
+
+        if is_method(driver, attr):
+            self.__dict__[attr] = value
+            self.__dict__.setdefault('_delegated', set()).add(attr)
+
+        return value
+
+    def __dir__(self):
+        # dir() sorts the listing itself
+        return list(set(super().__dir__()).union(dir(self.driver)))
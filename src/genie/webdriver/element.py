@@ -1,16 +1,284 @@
-from . import utils
+import re
+import copy
+import inspect
+from collections import namedtuple
+from collections.abc import Sequence
+
+from . import utils, wait, scripts
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import (StaleElementReferenceException,
+                                        NoSuchElementException,
+                                        TimeoutException)
 
 __all__ = ['PageElement', 'TextBox', 'Button', 'RadioButton', 
-           'Checkbox', 'Selector']
+           'Checkbox', 'Selector', 'ElementCache', 'PageElements', 
+           'ElementList', 'Snapshot', 'snapshot', 'Form', 'BoundForm',
+           'Table', 'BoundTable', 'form_value', 'SelectOption',
+           'SelectCondition', 'Component', 'ScopedDriver']
+
+# TextBox input modes, and the value length from which 'auto' sets values
+# with a script instead of typing them
+INPUT_MODES = ('keys', 'js', 'auto')
+INPUT_AUTO_LENGTH = 256
+
+# how SelectCondition matches options
+SELECT_MATCHES = ('text', 'value', 'regex')
+
+# compiled pattern flags SelectCondition translates to javascript RegExp
+# flags (re.UNICODE is implied by str patterns, and javascript matches 
+# unicode text as well)
+SELECT_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's'}
+
+# one <select> option, read by Selector.options()
+SelectOption = namedtuple('SelectOption', ['index', 'value', 'text',
+                                           'selected', 'disabled'])
+
+# fields readable by snapshot()
+SNAPSHOT_FIELDS = ('displayed', 'enabled', 'selected', 'text', 'value', 
+                   'tag_name', 'rect')
+
+
+class Snapshot(object):
+    '''
+    Immutable record of the properties of an element, read at once by 
+    snapshot(). Only the requested fields are set: reading any other field
+    raises AttributeError.
+
+    Attributes
+        present (bool): whether the element was found. When not, all
+                        requested fields are None
+        displayed (bool): element is visible
+        enabled (bool): element is not disabled
+        selected (bool): element is checked/selected
+        text (str): visible text
+        value (str): value property (eg, inputs)
+        tag_name (str): lower case tag name
+        rect (dict): x, y, width and height, in document coordinates
+        attributes (dict): requested html attributes
+    '''
+
+    __slots__ = ('present', 'attributes') + SNAPSHOT_FIELDS
+
+    def __init__(self, present, values):
+        object.__setattr__(self, 'present', present)
+
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is immutable' % type(self).__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError('%s is immutable' % type(self).__name__)
+
+    def to_dict(self):
+        return {name: getattr(self, name) 
+                for name in self.__slots__ if hasattr(self, name)}
+
+    def __eq__(self, other):
+        if not isinstance(other, Snapshot):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, 
+                           ', '.join('%s=%r' % item 
+                                     for item in self.to_dict().items()))
+
+
+def snapshot(driver, target, fields = None, attributes = ()):
+    '''read many properties of an element in a single script call.
+
+    Arguments
+        driver (obj): driver to read with
+        target (obj): WebElement, or [by, value] locator (first match)
+        fields (iterable): SNAPSHOT_FIELDS to read, default to all of them
+        attributes (iterable): html attribute names to read
+
+    Returns
+        Snapshot
+    '''
+    fields = tuple(SNAPSHOT_FIELDS if fields is None else fields)
+
+    unknown = set(fields) - set(SNAPSHOT_FIELDS)
+    if unknown:
+        raise ValueError('Unsupported snapshot fields: %s. Supported fields '
+                         'are: %s' % (sorted(unknown), SNAPSHOT_FIELDS))
+
+    wait.Deadline.check()
+
+    values = driver.execute_script(scripts.SNAPSHOT, target, list(fields),
+                                   list(attributes))
+
+    if values is None:
+        values = dict.fromkeys(fields)
+        if attributes:
+            values['attributes'] = dict.fromkeys(attributes)
+
+        return Snapshot(False, values)
+
+    return Snapshot(True, values)
+
+
+def form_value(kind, value):
+    '''convert a value to set to an element of FORM_KIND kind to its script
+    form (see scripts.FILL_JS)'''
+    if kind in ('checkbox', 'radio'):
+        return bool(value)
+
+    if kind == 'select' and isinstance(value, (list, tuple)):
+        return [str(text) for text in value]
+
+    return str(value)
+
+
+class SelectCondition(object):
+    '''
+    Wait condition selecting the options of a <select> in a single script 
+    call per poll (see scripts.SELECT), once the select is displayed. 
+    Returns the script result: use selected() to get the texts of the
+    selected options, raising NoSuchElementException if some options to 
+    select are missing from the displayed select.
+
+    Arguments
+        target (obj): WebElement, or [by, value] locator (first match)
+        options (str/list): option (or list of options) to select: texts, 
+                            values or regular expressions, according to match
+        match (str): 'text' (exact option text), 'value' or 'regex'
+                     (searched in the option text, compiled patterns 
+                     flags being limited to re.I, re.M and re.S)
+        deselect_others (bool): multiple selects only: deselect options not
+                                matching, else add to the current selection
+
+    Example:
+        condition = SelectCondition([By.ID, 'vlans'], ['^VLAN 1\\d$'], 
+                                    match = 'regex')
+        selected = condition.selected(wait.until(condition))
+    '''
+
+    def __init__(self, target, options, match = 'text', 
+                 deselect_others = True):
+        if match not in SELECT_MATCHES:
+            raise ValueError('Unsupported match %r, expected one of: %s'
+                             % (match, SELECT_MATCHES))
+
+        if not isinstance(options, (list, tuple)):
+            options = [options]
+
+        self.target = target
+        self.match = match
+        self.patterns = [option.pattern if isinstance(option, re.Pattern)
+                         else str(option) for option in options]
+        self.flags = [self._flags(option) for option in options]
+        self.deselect_others = deselect_others
+        self.missing = []
+
+    @staticmethod
+    def _flags(option):
+        '''javascript RegExp flags of a compiled pattern option'''
+        if not isinstance(option, re.Pattern):
+            return ''
+
+        flags = option.flags & ~re.UNICODE
+        unsupported = flags & ~sum(SELECT_FLAGS)
+        if unsupported:
+            raise ValueError('Unsupported flags %r of pattern %r, expected '
+                             're.I, re.M or re.S' % (re.RegexFlag(unsupported),
+                                                    option.pattern))
+
+        return ''.join(js for flag, js in SELECT_FLAGS.items() 
+                       if flags & flag)
+
+    def __call__(self, driver):
+        result = driver.execute_script(scripts.SELECT, self.target, 
+                                       self.match, self.patterns,
+                                       self.deselect_others, self.flags)
+
+        if result is not None:
+            self.missing[:] = result.get('missing', [])
+
+        return result
+
+    def selected(self, result):
+        '''texts of the options selected by this condition, given the wait
+        result: the select being displayed, missing options are not waited
+        for and raise NoSuchElementException'''
+        if self.missing:
+            raise NoSuchElementException(self.message)
+
+        return result['selected']
+
+    @property
+    def message(self):
+        '''timeout message describing what was not found'''
+        if self.missing:
+            return 'Options not found: %s' % ', '.join(self.missing)
+
+        return 'Select not found: %s' % (self.target,)
+
+
+class ElementCache(object):
+    '''
+    Per page instance cache of the WebElements resolved by element 
+    descriptors, keyed by descriptor: repeated descriptor accesses reuse the
+    element instead of finding/waiting for it again.
+
+    Enabled through WebPage.ELEMENT_CACHE. The page invalidates it when it
+    navigates (open(), get(), back(), forward(), refresh()). Descriptors 
+    waiting for a state (eg, clickable for buttons) check in a single script
+    call (waiting using the page wait) that a cached element is still 
+    attached and in that state before reusing it: stale elements are found
+    again, as are the ones going stale while descriptors use them. Cached 
+    elements only needing to be present are reused without any check.
+    '''
+
+    def __init__(self):
+        self.elements = {}
+
+    def get(self, descriptor):
+        return self.elements.get(descriptor)
+
+    def set(self, descriptor, element):
+        self.elements[descriptor] = element
+
+    def scope(self, key):
+        '''child cache of the elements of a component (see Component), 
+        dropped along with the elements of this cache'''
+        child = self.elements.get(key)
+
+        if not isinstance(child, ElementCache):
+            child = self.elements[key] = ElementCache()
+
+        return child
+
+    def invalidate(self, descriptor = None):
+        '''drop the cached element of descriptor, or all of them'''
+        if descriptor is None:
+            self.elements.clear()
+        else:
+            self.elements.pop(descriptor, None)
+
+    def __len__(self):
+        return len(self.elements)
+
 
 class PageElement(object):
     '''
     Descriptor class to allow enhancement to WebPage classes by adding 
     additional functionality without explicitly writing a lot of code
     '''
+
+    # how Form fills/reads this element (see scripts.FORM), None if it can't
+    FORM_KIND = 'value'
+
+    # whether this descriptor resolves to a single, cacheable element (see
+    # WebPage.prefetch())
+    CACHEABLE = True
     
     def __init__(self, locator = None, **kwargs):
         self.locator = utils.translate_arguments(locator, **kwargs)
@@ -21,35 +289,254 @@ class PageElement(object):
                                   'subclassing')
 
     def __get__(self, obj, owner):
+        if obj is None:
+            return self
+
+        return self._element(obj, self._find, 'presence')
+
+    def snapshot(self, obj, fields = None, attributes = ()):
+        '''read many properties of this descriptor's element on page obj in
+        a single script call, see element.snapshot(). Uses the cached
+        element, if any.
+
+        Example:
+            state = LoginPage.login_button.snapshot(page, 
+                                                    fields = ('displayed',
+                                                              'enabled'))
+        '''
+        return self._on_target(obj, lambda target: snapshot(obj.driver, 
+                                                            target, fields,
+                                                            attributes))
+
+    def ensure(self, obj, value):
+        '''bring this descriptor's element on page obj to value unless it
+        already is, checking and applying it in a single script call (see
+        scripts.ENSURE), and return whether anything changed.
+
+        Waits (using the page wait) for the element to be displayed and
+        enabled, and for selector options to be present. Values are strings
+        for text fields, booleans for checkboxes and radio buttons, and the
+        visible option text (or list of texts) for selectors. Uses the
+        cached element, if any.
+
+        Example:
+            LoginPage.remember_me.ensure(page, True)
+            LoginPage.language.ensure(page, 'English')
+        '''
+        if self.FORM_KIND is None:
+            raise TypeError('%s does not support ensure()' 
+                            % type(self).__name__)
+
+        value = form_value(self.FORM_KIND, value)
+        missing = []
+
+        def condition(driver, target):
+            result = driver.execute_script(scripts.ENSURE, target,
+                                           self.FORM_KIND, value)
+
+            if result is None or result.get('missing'):
+                missing[:] = result['missing'] if result else []
+                return None
+
+            return result
+
+        def run(target):
+            try:
+                result = obj.wait.until(lambda driver: condition(driver, 
+                                                                 target))
+            except TimeoutException as e:
+                if missing:
+                    message = 'Options not found: %s' % ', '.join(missing)
+                else:
+                    message = 'Element not ready: %s' % (self.locator,)
+
+                raise TimeoutException(message) from e
+
+            return result['changed']
+
+        return self._on_target(obj, run)
+
+    def _find(self, obj):
+        # descriptors going through obj.wait are capped by the active
+        # deadline there, direct driver lookups only need the check.
+        wait.Deadline.check()
+
         return obj.driver.find_element(*self.locator)
 
+    def _wait_visible(self, obj):
+        return obj.wait.until.visibility_of_element_located(self.locator)
+
+    def _wait_clickable(self, obj):
+        return obj.wait.until.element_to_be_clickable(self.locator)
+
+    @staticmethod
+    def _cache(obj):
+        cache = getattr(obj, 'element_cache', None)
+
+        return cache if isinstance(cache, ElementCache) else None
+
+    def _element(self, obj, find, check):
+        '''return this descriptor's element on obj, from obj's element cache
+        when enabled and the cached element passes check (see _checked()), 
+        or using find(obj).
+
+        Cached elements only needing to be present are returned as is, 
+        without any browser call: elements going stale while used are found
+        again by _use() and _on_target().'''
+
+        cache = self._cache(obj)
+        if cache is None:
+            return find(obj)
+
+        element = cache.get(self)
+        if element is not None and check != 'presence':
+            element = self._checked(obj, cache, element, check)
+
+        if element is None:
+            element = find(obj)
+            cache.set(self, element)
+
+        return element
+
+    def _checked(self, obj, cache, element, check):
+        '''wait (using obj.wait) for a cached element to pass check (see
+        scripts.CHECK_ELEMENT: 'presence', 'visibility' or 'clickable'), in
+        a single script call per poll, and return it. Returns None, dropping
+        it from cache, when it went stale.'''
+
+        def condition(driver):
+            state = driver.execute_script(scripts.CHECK_ELEMENT, check, 
+                                          element)
+            if state == 'stale':
+                raise StaleElementReferenceException()
+
+            return state
+
+        try:
+            obj.wait.until(condition, 
+                           message = 'Element not ready: %s' 
+                                     % (self.locator,))
+        except StaleElementReferenceException:
+            cache.invalidate(self)
+            return None
+
+        return element
+
+    def _target(self, obj):
+        '''[by, value] locator of this descriptor on obj for injected 
+        scripts: a chained locator when obj is a component.'''
+        if isinstance(obj, Component):
+            return obj.scoped(self.locator)
+
+        return list(self.locator)
+
+    def _on_target(self, obj, action):
+        '''return action(target) for scripts taking an element or locator
+        target: the cached element when any, else (or when it went stale) 
+        this descriptor's [by, value] locator.'''
+
+        cache = self._cache(obj)
+        element = cache.get(self) if cache is not None else None
+
+        if element is None:
+            return action(self._target(obj))
+
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            cache.invalidate(self)
+            return action(self._target(obj))
+
+    def _use(self, obj, find, check, action):
+        '''return action(element) on this descriptor's element, re-finding it
+        once if the cached element went stale.'''
+
+        cache = self._cache(obj)
+        cached = cache is not None and cache.get(self) is not None
+
+        try:
+            return action(self._element(obj, find, check))
+        except StaleElementReferenceException:
+            if not cached:
+                raise
+
+        cache.invalidate(self)
+        return action(self._element(obj, find, check))
+
 
 class TextBox(PageElement):
+    '''
+    Text input/textarea descriptor. GET returns its value, SET replaces it.
 
-    def __init__(self, locator = None, value = None, **kwargs):
+    input_mode decides how values are set:
+        keys: clear() and send_keys(), typing character by character
+        js:   set the value at once with a script, firing input/change events
+        auto: js for values longer than INPUT_AUTO_LENGTH, keys otherwise
+
+    When not provided, the page INPUT_MODE applies (default to keys).
+    '''
+
+    def __init__(self, locator = None, value = None, input_mode = None,
+                 **kwargs):
         if value:
             self.locator = (By.XPATH,
                             ".//input[@type='text' and @value='%s']" % value)
         else:
             self.locator = utils.translate_arguments(locator, **kwargs)
 
+        if input_mode is not None and input_mode not in INPUT_MODES:
+            raise ValueError('Unsupported input_mode %r, expected one of: %s'
+                             % (input_mode, INPUT_MODES))
+
+        self.input_mode = input_mode
+
+    def _input_mode(self, obj, value):
+        mode = self.input_mode
+
+        if mode is None:
+            mode = getattr(obj, 'INPUT_MODE', None)
+            if mode not in INPUT_MODES:
+                mode = 'keys'
+
+        if mode == 'auto':
+            mode = 'js' if len(value) > INPUT_AUTO_LENGTH else 'keys'
+
+        return mode
 
     def __set__(self, obj, value):
-        element = obj.wait.until.visibility_of_element_located(self.locator)
-        element.clear()
-        element.send_keys(str(value))
+        value = str(value)
+
+        if self._input_mode(obj, value) == 'js':
+            def fill(element):
+                obj.driver.execute_script(scripts.SET_VALUE, element, value)
+        else:
+            def fill(element):
+                element.clear()
+                element.send_keys(value)
+
+        self._use(obj, self._wait_visible, 'visibility', fill)
 
     def __get__(self, obj, owner):
-        element = obj.wait.until.visibility_of_element_located(self.locator)
-        return element.get_attribute('value')
+        if obj is None:
+            return self
+
+        return self._use(obj, self._wait_visible, 'visibility',
+                         lambda element: element.get_attribute('value'))
 
 class Button(PageElement):
 
+    FORM_KIND = None
+
     def __get__(self, obj, owner):
-        return obj.wait.until.element_to_be_clickable(self.locator)
+        if obj is None:
+            return self
+
+        return self._element(obj, self._wait_clickable, 'clickable')
 
 class RadioButton(PageElement):
 
+    FORM_KIND = 'radio'
+
     def __init__(self, locator = None, value = None, **kwargs):
 
         if value:
@@ -59,16 +546,21 @@ class RadioButton(PageElement):
             self.locator = utils.translate_arguments(locator, **kwargs)
 
     def __get__(self, obj, owner):
-        element = obj.wait.until.element_to_be_clickable(self.locator)
+        if obj is None:
+            return self
 
-        return element.is_selected()
+        return self._use(obj, self._wait_clickable, 'clickable',
+                         lambda element: element.is_selected())
 
     def __set__(self, obj, value):
         if value:
-            element = obj.wait.until.element_to_be_clickable(self.locator)
-            element.click()
+            self._use(obj, self._wait_clickable, 'clickable',
+                      lambda element: element.click())
 
 class Checkbox(PageElement):
+
+    FORM_KIND = 'checkbox'
+
     def __init__(self, locator = None, value = None, **kwargs):
         if value:
             self.locator = (By.XPATH,
@@ -77,24 +569,666 @@ class Checkbox(PageElement):
             self.locator = utils.translate_arguments(locator, **kwargs)
 
     def __get__(self, obj, owner):
-        element = obj.wait.until.element_to_be_clickable(self.locator)
-        return element.is_selected()
+        if obj is None:
+            return self
+
+        return self._use(obj, self._wait_clickable, 'clickable',
+                         lambda element: element.is_selected())
 
     def __set__(self, obj, check):
-        element = obj.wait.until.element_to_be_clickable(self.locator)
+        def toggle(element):
+            checked = element.is_selected()
+            if (checked and not check) or (not checked and check):
+                # click to toggle
+                element.click()
 
-        checked = element.is_selected()
-        if (checked and not check) or (not checked and check):
-            # click to toggle
-            element.click()
+        self._use(obj, self._wait_clickable, 'clickable', toggle)
 
 class Selector(PageElement):
+    '''
+    <select> descriptor. GET returns a selenium Select object.
+
+    options() and select() read and select options with a single script
+    call, whatever the number of options, instead of one call per option.
+    '''
+
+    FORM_KIND = 'select'
 
     def __get__(self, obj, owner):
-        element = obj.wait.until.element_to_be_clickable(self.locator)
+        if obj is None:
+            return self
+
+        element = self._element(obj, self._wait_clickable, 'clickable')
 
         # return a selector instance
         return Select(element)
 
     def __set__(self, *args):
         raise TypeError('Use the returned to select object to set values')
+
+    def options(self, obj):
+        '''return all options of this select on page obj as a list of
+        SelectOption(index, value, text, selected, disabled), read in a 
+        single script call once present (using the page wait).
+
+        Example:
+            vlans = [option.text for option in VlanPage.vlan.options(page)]
+        '''
+        def run(target):
+            condition = lambda driver: driver.execute_script(scripts.OPTIONS,
+                                                             target)
+            return obj.wait.until(condition, 
+                                  message = 'Select not found: %s' 
+                                            % (self.locator,))
+
+        return [SelectOption(**option) 
+                for option in self._on_target(obj, run)['options']]
+
+    def select(self, obj, options, match = 'text', deselect_others = True):
+        '''select options of this select on page obj in a single script
+        call, and return the texts of the selected options. See 
+        SelectCondition for arguments.
+
+        Example:
+            VlanPage.vlan.select(page, '10', match = 'value')
+            VlanPage.interfaces.select(page, ['^Gi0/', '^Te'], 
+                                       match = 'regex')
+        '''
+        def run(target):
+            condition = SelectCondition(target, options, match, 
+                                        deselect_others)
+            try:
+                result = obj.wait.until(condition)
+            except TimeoutException as e:
+                raise TimeoutException(condition.message) from e
+
+            return condition.selected(result)
+
+        return self._on_target(obj, run)
+
+
+class ElementList(Sequence):
+    '''
+    Lazy sequence of all the elements matching a locator, returned by 
+    PageElements descriptors.
+
+    Elements are only located on first indexing, slicing or iteration, and
+    kept until refresh(). len() and bulk reads (texts(), values(), hrefs(),
+    attributes(), properties()) are evaluated inside the browser in a single
+    script call, always against the current page, and never transfer element
+    references.
+
+    Arguments
+        driver (obj): driver to locate the elements with
+        locator (tuple): locator of the elements
+    '''
+
+    def __init__(self, driver, locator):
+        self.driver = driver
+        self.locator = locator
+        self._elements = None
+
+    @property
+    def elements(self):
+        '''located WebElements, located on first use'''
+        if self._elements is None:
+            wait.Deadline.check()
+            self._elements = self.driver.find_elements(*self.locator)
+
+        return self._elements
+
+    def refresh(self):
+        '''forget the located elements, locating them again on next use'''
+        self._elements = None
+
+    def __len__(self):
+        if self._elements is not None:
+            return len(self._elements)
+
+        # count only, comparison always holds
+        result = self.driver.execute_script(scripts.COUNT, *self.locator,
+                                            'ge', 0, 0, False)
+        return result['count']
+
+    def __getitem__(self, index):
+        return self.elements[index]
+
+    def __iter__(self):
+        return iter(self.elements)
+
+    def _read(self, field, name = None):
+        return self.driver.execute_script(scripts.READ_ALL, *self.locator,
+                                          field, name)
+
+    def texts(self):
+        '''return the visible text of all elements'''
+        return self._read('text')
+
+    def values(self):
+        '''return the value of all elements (eg, inputs)'''
+        return self._read('property', 'value')
+
+    def hrefs(self):
+        '''return the (absolute) href of all elements (eg, links)'''
+        return self._read('property', 'href')
+
+    def attributes(self, name):
+        '''return the html attribute name of all elements'''
+        return self._read('attribute', name)
+
+    def properties(self, name):
+        '''return the javascript property name of all elements'''
+        return self._read('property', name)
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self.locator)
+
+
+class PageElements(PageElement):
+    '''
+    Descriptor for all the elements matching a locator, eg: table rows or
+    cards. GET returns a lazy ElementList.
+
+    Example:
+        class Inventory(WebPage):
+            rows = PageElements(css = 'table#devices tbody tr')
+
+        page.rows.texts()     # all row texts, in a single call
+        len(page.rows)        # counted in the browser
+        page.rows[0].click()  # elements located on first indexing
+    '''
+
+    FORM_KIND = None
+    CACHEABLE = False
+
+    def __set__(self, obj, value):
+        raise NotImplementedError('PageElements does not support set')
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+
+        return ElementList(obj.driver, tuple(self._target(obj)))
+
+
+class Form(object):
+    '''
+    Descriptor grouping field descriptors (TextBox, Checkbox, RadioButton,
+    Selector, PageElement) of a page, to fill and read them all at once: 
+    a single script sets all values, dispatching input/change events, and
+    returns the resulting state of the whole form.
+
+    Fields are either names of field descriptors of the page, or field 
+    descriptors passed as keyword arguments. SET fills the form from a dict,
+    GET returns a BoundForm, whose values property reads the whole form.
+
+    Field values are strings for text fields, booleans for checkboxes and
+    radio buttons, and the visible option text for selectors (a list of
+    texts for multiple selectors). The script waits (using the page wait)
+    for all fields and select options to be present, and for the fields to
+    fill to be displayed and enabled, as their own setters would.
+
+    Example:
+        class ProvisionPage(WebPage):
+            hostname = TextBox(id = 'hostname')
+
+            device = Form('hostname',
+                          enabled = Checkbox(id = 'enabled'),
+                          platform = Selector(id = 'platform'))
+
+        page.device = dict(hostname = 'R1', enabled = True, 
+                           platform = 'IOS-XE')
+        page.device.values
+        {'hostname': 'R1', 'enabled': True, 'platform': 'IOS-XE'}
+    '''
+
+    def __init__(self, *names, **fields):
+        self.names = names
+        self.fields = {}
+
+        for name, field in fields.items():
+            self._add(name, field)
+
+    def _add(self, name, field):
+        if not isinstance(field, PageElement) or field.FORM_KIND is None:
+            raise TypeError("Form field '%s' must be a fillable page element, "
+                            "got: %r" % (name, field))
+
+        self.fields[name] = field
+
+    def __set_name__(self, owner, name):
+        # resolve named fields from the page class, keeping their order
+        fields = self.fields
+        self.fields = {}
+
+        for field in self.names:
+            self._add(field, inspect.getattr_static(owner, field))
+
+        self.fields.update(fields)
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+
+        return BoundForm(self, obj)
+
+    def __set__(self, obj, values):
+        BoundForm(self, obj).fill(values)
+
+    def specs(self, page = None):
+        '''[name, kind, by, value] field lists, see scripts.FORM'''
+        return [[name, field.FORM_KIND, *field._target(page)]
+                for name, field in self.fields.items()]
+
+    def convert(self, values):
+        '''check and convert values to set to their script form'''
+        unknown = set(values) - set(self.fields)
+        if unknown:
+            raise ValueError('Unknown form fields: %s' % sorted(unknown))
+
+        return {name: form_value(self.fields[name].FORM_KIND, value)
+                for name, value in values.items()}
+
+
+class BoundForm(object):
+    '''
+    Form bound to a page instance, returned by Form descriptors.
+
+    Arguments
+        form (Form): form descriptor
+        page (WebPage): page instance
+    '''
+
+    def __init__(self, form, page):
+        self.form = form
+        self.page = page
+
+    @property
+    def fields(self):
+        return list(self.form.fields)
+
+    @property
+    def values(self):
+        '''read the state of the whole form, as a {field: value} dict'''
+        return self._run(None)
+
+    def fill(self, values = None, **kwargs):
+        '''set the given field values in a single script call, and return
+        the resulting state of the whole form'''
+        values = dict(values or {}, **kwargs)
+
+        return self._run(self.form.convert(values))
+
+    def _run(self, values):
+        specs = self.form.specs(self.page)
+        missing, pending = [], []
+
+        def condition(driver):
+            result = driver.execute_script(scripts.FORM, specs, values)
+
+            missing[:] = result.get('missing', [])
+            pending[:] = result.get('pending', [])
+
+            if missing or pending:
+                return None
+
+            return result['values']
+
+        try:
+            return self.page.wait.until(condition)
+        except TimeoutException as e:
+            if missing:
+                message = 'Form fields not found: %s' % ', '.join(missing)
+            else:
+                message = 'Form fields not ready: %s' % ', '.join(pending)
+
+            raise TimeoutException(message) from e
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self.fields)
+
+
+class Table(PageElement):
+    '''
+    Descriptor for a html <table>, serialized inside the browser: GET returns
+    a BoundTable reading all cell texts with a single script call, as rows
+    or as columns, or streaming the rows in chunks of chunk_size rows.
+
+    Arguments
+        locator (tuple): locator of the <table> element
+        chunk_size (int): default number of rows fetched per call by
+                          BoundTable.iter_rows()
+
+    Example:
+        class Interfaces(WebPage):
+            table = Table(id = 'interfaces')
+
+        page.table.headers          # ['Interface', 'Status', ...]
+        page.table.rows()           # [('Gi0/0', 'up', ...), ...]
+        page.table.columns()        # {'Interface': ['Gi0/0', ...], ...}
+
+        for row in page.table.iter_rows(chunk_size = 5000):
+            ...
+    '''
+
+    FORM_KIND = None
+    CACHEABLE = False
+
+    def __init__(self, locator = None, chunk_size = 1000, **kwargs):
+        super().__init__(locator, **kwargs)
+        self.chunk_size = chunk_size
+
+    def __set__(self, obj, value):
+        raise NotImplementedError('Table does not support set')
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+
+        return BoundTable(obj, tuple(self._target(obj)), self.chunk_size)
+
+
+class BoundTable(object):
+    '''
+    Table bound to a page instance, returned by Table descriptors. Every
+    read is a single script call (see scripts.TABLE), waiting for the table
+    to be present using the page wait. Cells are read as their visible text.
+
+    Headers come from the last <thead> row, else from a leading row of <th>
+    cells. Tables without headers use column indexes instead.
+
+    Arguments
+        page (WebPage): page instance
+        locator (tuple): locator of the <table> element
+        chunk_size (int): default number of rows fetched per call by
+                          iter_rows()
+    '''
+
+    def __init__(self, page, locator, chunk_size = 1000):
+        self.page = page
+        self.locator = locator
+        self.chunk_size = chunk_size
+
+    def _fetch(self, start = 0, stop = None, layout = 'rows'):
+        by, value = self.locator
+
+        def condition(driver):
+            return driver.execute_script(scripts.TABLE, by, value, start,
+                                         stop, layout)
+
+        return self.page.wait.until(condition, 
+                                    message = 'Table not found: %s' 
+                                              % (self.locator,))
+
+    @staticmethod
+    def _headers(result, width):
+        headers = result['headers']
+
+        return list(headers) if headers is not None else list(range(width))
+
+    @property
+    def headers(self):
+        '''column headers, None for tables without headers'''
+        return self._fetch(0, 0)['headers']
+
+    @property
+    def header_index(self):
+        '''{header: column index} mapping of row tuples'''
+        return {header: index 
+                for index, header in enumerate(self.headers or ())}
+
+    def __len__(self):
+        '''number of body rows'''
+        return self._fetch(0, 0)['total']
+
+    def rows(self, start = 0, stop = None):
+        '''return body rows [start, stop) as a list of cell text tuples'''
+        return [tuple(row) for row in self._fetch(start, stop)['rows']]
+
+    def records(self, start = 0, stop = None):
+        '''return body rows [start, stop) as a list of {header: text} dicts'''
+        result = self._fetch(start, stop)
+        width = max(map(len, result['rows']), default = 0)
+        headers = self._headers(result, width)
+
+        return [dict(zip(headers, row)) for row in result['rows']]
+
+    def columns(self, start = 0, stop = None):
+        '''return body rows [start, stop) as {header: [cell texts]} columns.
+        Missing cells of short rows are None.'''
+        result = self._fetch(start, stop, layout = 'columns')
+        headers = self._headers(result, len(result['columns']))
+
+        return dict(zip(headers, result['columns']))
+
+    def iter_rows(self, chunk_size = None):
+        '''generator yielding all body rows as cell text tuples, fetching
+        them chunk_size rows per script call'''
+        chunk_size = chunk_size or self.chunk_size
+        start = 0
+
+        while True:
+            result = self._fetch(start, start + chunk_size)
+
+            for row in result['rows']:
+                yield tuple(row)
+
+            start += chunk_size
+            if not result['rows'] or start >= result['total']:
+                return
+
+    def __iter__(self):
+        return self.iter_rows()
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self.locator)
+
+
+class Component(PageElement):
+    '''
+    Descriptor for a section of a page (navbar, modal, table row...), whose
+    subclasses declare child element descriptors located relative to the
+    component root element. GET returns the component bound to the page 
+    (or parent component), on which child descriptors are used the same way
+    as on a page. Components nest.
+
+    Locating a child is a single injected script resolving the whole chain
+    of nested components (crossing shadow roots when shadow is set) and the
+    child locator at once. Component root elements found along the way are
+    cached while they are not stale: later lookups start from there.
+
+    Bound components forward any other attribute (timeout, INPUT_MODE...)
+    to their parent, use a wait configured like the page one (never in 
+    browser), and a child element cache when the page caches elements.
+
+    Arguments
+        locator (tuple): locator of the component root element, relative to
+                         the parent component if any
+        shadow (bool): children live in the shadow root of the root element
+                       (css based locators only: xpath does not cross 
+                       shadow roots)
+
+    Example:
+        class NavBar(Component):
+            search = TextBox(name = 'q')
+            logout = Button(css = 'a.logout')
+
+        class Home(WebPage):
+            navbar = NavBar(id = 'nav')
+
+        page.navbar.search = 'R1'
+        page.navbar.logout.click()
+    '''
+
+    FORM_KIND = None
+
+    def __init__(self, locator = None, shadow = False, **kwargs):
+        super().__init__(locator, **kwargs)
+        self.shadow = shadow
+        self.parent = None
+        self.driver = None
+        self.root = None
+        self._wait = None
+
+    def __getattr__(self, name):
+        # only called for missing attributes: bound components forward them
+        parent = self.__dict__.get('parent')
+        if parent is None:
+            raise AttributeError("'%s' object has no attribute '%s'" 
+                                 % (type(self).__name__, name))
+
+        return getattr(parent, name)
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+
+        # bound components live on the instance they are bound to: they
+        # reference it as their parent, so it must not be kept alive 
+        # elsewhere
+        bound = obj.__dict__.setdefault('_components', {})
+
+        try:
+            return bound[self]
+        except KeyError:
+            bound[self] = self._bind(obj)
+            return bound[self]
+
+    def __set__(self, obj, value):
+        raise NotImplementedError('Component does not support set')
+
+    def _bind(self, parent):
+        bound = copy.copy(self)
+        bound.parent = parent
+        bound.driver = ScopedDriver(bound)
+
+        return bound
+
+    @property
+    def page(self):
+        '''the page this component is bound to'''
+        if isinstance(self.parent, Component):
+            return self.parent.page
+
+        return self.parent
+
+    @property
+    def wait(self):
+        if self._wait is None:
+            until = self.page.wait.until
+            self._wait = wait.Wait(self.driver, until.timeout,
+                                   poll_strategy = until.poll_strategy,
+                                   recorder = until.recorder,
+                                   timings = until.timings,
+                                   owner = self.page)
+
+        return self._wait
+
+    @property
+    def element_cache(self):
+        cache = self._cache(self.parent)
+
+        return cache.scope(self) if cache is not None else None
+
+    def invalidate(self):
+        '''drop the cached root element of this component'''
+        self.root = None
+
+    def scopes(self):
+        '''bound components from the outermost one to this one'''
+        scopes = [self]
+
+        while isinstance(scopes[0].parent, Component):
+            scopes.insert(0, scopes[0].parent)
+
+        return scopes
+
+    def chain(self, locator, cached = True):
+        '''return the chain locating locator within this component (see
+        scripts.FIND_ELEMENTS_JS), starting from the innermost cached root 
+        element when cached, and the components it locates'''
+
+        scopes = self.scopes()
+        base = None
+
+        if cached:
+            for index in reversed(range(len(scopes))):
+                if scopes[index].root is not None:
+                    base = scopes[index]
+                    scopes = scopes[index + 1:]
+                    break
+
+        steps = [[*scope.locator, scope.shadow] for scope in scopes]
+        steps.append([*locator, False])
+
+        if base is None:
+            return [None, False, steps], scopes
+
+        return [base.root, base.shadow, steps], scopes
+
+    def scoped(self, locator):
+        '''[CHAIN, chain] locator of locator within this component, for 
+        injected scripts. Always resolved from the document: it never goes
+        stale.'''
+        return [utils.CHAIN, self.chain(locator, cached = False)[0]]
+
+    def find_all(self, locator):
+        '''return all elements matching locator within this component, 
+        located with a single script call, caching the root elements of the
+        components along the way'''
+
+        chain, scopes = self.chain(locator)
+
+        try:
+            result = self.page.driver.execute_script(scripts.RESOLVE, chain)
+        except StaleElementReferenceException:
+            for scope in self.scopes():
+                scope.invalidate()
+
+            chain, scopes = self.chain(locator)
+            result = self.page.driver.execute_script(scripts.RESOLVE, chain)
+
+        if result is None:
+            return []
+
+        for scope, element in zip(scopes, result['path']):
+            scope.root = element
+
+        return result['found']
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self.locator)
+
+
+class ScopedDriver(object):
+    '''
+    Driver of a bound Component: find_element() and find_elements() locate
+    elements within the component (see Component.find_all()), any other 
+    attribute is the page driver's.
+
+    Arguments
+        component (Component): bound component
+    '''
+
+    def __init__(self, component):
+        self.component = component
+
+    def __getattr__(self, name):
+        return getattr(self.component.page.driver, name)
+
+    def find_elements(self, by = By.ID, value = None):
+        if by == utils.CHAIN:
+            result = self.component.page.driver.execute_script(
+                                                        scripts.RESOLVE, value)
+            return result['found'] if result else []
+
+        return self.component.find_all((by, value))
+
+    def find_element(self, by = By.ID, value = None):
+        found = self.find_elements(by, value)
+
+        if not found:
+            raise NoSuchElementException('Unable to locate %s within %r'
+                                         % ((by, value), self.component))
+
+        return found[0]
@@ -1,9 +1,81 @@
+from collections import namedtuple, OrderedDict
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+from . import utils, wait, element, scripts
+
+# one item of a virtualized list, see Interactions.iter_virtual_list()
+ListItem = namedtuple('ListItem', ['key', 'text'])
+
+
+class VirtualListReader(object):
+    '''
+    Book keeping of Interactions.iter_virtual_list(): dedupes the items read
+    from successive scripts.VIRTUAL_LIST results, and decides when to stop.
+
+    Only the keys of the last dedupe_window items are remembered, keeping
+    memory bounded whatever the length of the list: virtualized lists render
+    contiguous windows of items, so duplicates are always recent ones.
+
+    Arguments
+        limit (int): stop after this many items, if any
+        patience (int): stop after this many reads in a row neither 
+                        scrolling nor finding new items (end of the list)
+        dedupe_window (int): number of most recent item keys remembered
+        by_text (bool): items without key are keyed by their text, else 
+                        raise ValueError: identical items (eg, repeated log
+                        lines) would be dropped as duplicates
+    '''
+
+    def __init__(self, limit = None, patience = 3, dedupe_window = 10000,
+                 by_text = False):
+        self.limit = limit
+        self.patience = patience
+        self.dedupe_window = dedupe_window
+        self.by_text = by_text
+        self.seen = OrderedDict()
+        self.count = 0
+        self.idle = 0
+        self.done = False
+
+    def read(self, result):
+        '''return the new ListItems of a scripts.VIRTUAL_LIST result'''
+        new = []
+
+        for key, text in result['items']:
+            if key is None:
+                if not self.by_text:
+                    raise ValueError('List item without key attribute: %r '
+                                     '(dedupe_by_text = True keys items by '
+                                     'their text)' % text)
+                key = text
+
+            if key in self.seen:
+                continue
+
+            self.seen[key] = None
+            if len(self.seen) > self.dedupe_window:
+                self.seen.popitem(last = False)
+
+            new.append(ListItem(key, text))
+
+        if self.limit is not None:
+            new = new[:self.limit - self.count]
+            self.done = self.count + len(new) >= self.limit
+
+        self.count += len(new)
+
+        if new or result['scrolled']:
+            self.idle = 0
+        else:
+            self.idle += 1
+            self.done = self.done or self.idle >= self.patience
+
+        return new
 
-from . import utils, wait
 
 class Interactions(object):
 
@@ -93,18 +165,48 @@ class Interactions(object):
         else:
             actionChains.move_to_element(element).perform()
 
-    def select_from_drop_down(self, option, locator = None, **kwargs):
-        '''select text from drop down list
+    def select_from_drop_down(self, option, locator = None, match = 'text',
+                              deselect_others = True, **kwargs):
+        '''select option(s) from drop down list, in a single script call
+        once the list is visible, and return the selected option texts
 
         Arguments
-            option (text): text to match for selection
+            option (text): text to match for selection, or list of them 
+                           (multiple selects)
             locator (tuple): selenium locator tuple or kwargs describing the location
+            match (str): match option 'text', 'value' or 'regex' (searched 
+                         in the option text)
+            deselect_others (bool): deselect other options of multiple
+                                    selects
         '''
         locator = utils.translate_arguments(locator, **kwargs)
 
-        element = self.wait.until.visibility_of_element_located(locator)
-        select = Select(element)
-        select.select_by_visible_text(option)
+        condition = element.SelectCondition(list(locator), option, match,
+                                            deselect_others)
+        try:
+            result = self.wait.until(condition)
+        except TimeoutException as e:
+            raise TimeoutException(condition.message) from e
+
+        return condition.selected(result)
+
+    def drop_down_options(self, locator = None, **kwargs):
+        '''return all options of a drop down list as a list of
+        element.SelectOption(index, value, text, selected, disabled), read 
+        in a single script call once present
+
+        Arguments
+            locator (tuple): selenium locator tuple or kwargs describing the location
+        '''
+        locator = list(utils.translate_arguments(locator, **kwargs))
+
+        condition = lambda driver: driver.execute_script(scripts.OPTIONS,
+                                                         locator)
+        result = self.wait.until(condition, 
+                                 message = 'Select not found: %s' % locator)
+
+        return [element.SelectOption(**option) 
+                for option in result['options']]
 
     def type_and_enter(self, value, locator = None, **kwargs):
         '''send text + enter key to located element
@@ -181,6 +283,62 @@ class Interactions(object):
         self.driver.execute_script("arguments[0].scrollIntoView(true);", 
                                    element)
 
+    def iter_virtual_list(self, items, container = None, key = None,
+                          limit = None, settle_ms = 100, patience = 3,
+                          dedupe_window = 10000, dedupe_by_text = False):
+        '''generator reading a virtualized (or infinite scroll) list, where
+        only the items around the visible window are rendered: scrolls its
+        container inside the browser, viewport by viewport, and yields the
+        newly rendered items of each scroll as a list of ListItem(key, text),
+        in a single script call per batch.
+
+        Stops at the end of the list (patience reads in a row neither 
+        scrolling nor finding new items: raise it, or settle_ms, for lists
+        loading more items from the network) or after limit items.
+
+        Arguments
+            items (tuple): locator of the list items, relative to container
+            container (tuple): locator of the scrolling container, default
+                               to the page itself
+            key (str): attribute uniquely identifying items (eg, 
+                       'data-index'), required unless dedupe_by_text
+            limit (int): maximum number of items to yield
+            settle_ms (int): milliseconds to let the list render after each
+                             scroll
+            patience (int): reads without progress before giving up
+            dedupe_window (int): number of most recent keys remembered to
+                                 dedupe items
+            dedupe_by_text (bool): key items without key attribute by their
+                                   text, dropping identical items
+
+        Example:
+            for batch in interact.iter_virtual_list((By.CSS_SELECTOR, 'tr'),
+                                                    (By.ID, 'log-viewer'),
+                                                    key = 'data-row'):
+                for item in batch:
+                    process(item.text)
+        '''
+        reader = VirtualListReader(limit, patience, dedupe_window,
+                                   dedupe_by_text)
+        container = list(container) if container else None
+        scroll = False
+
+        while not reader.done:
+            wait.Deadline.check()
+
+            result = self.driver.execute_async_script(scripts.VIRTUAL_LIST,
+                                                      container, list(items),
+                                                      key, scroll, settle_ms)
+            if result is None:
+                raise NoSuchElementException('Virtual list container not '
+                                             'found: %s' % (container,))
+
+            batch = reader.read(result)
+            if batch:
+                yield batch
+
+            scroll = True
+
     def jquery_click(self, css):
         '''perform a jquery click on provided css element
 
@@ -0,0 +1,242 @@
+import time
+import random
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+# selenium's default WebDriverWait poll frequency (seconds)
+DEFAULT_POLL_FREQUENCY = 0.5
+
+
+class PollStrategy(object):
+    '''
+    Base class for polling strategies, deciding how long to sleep between two
+    consecutive polls of a wait condition.
+
+    Strategies are stateless and can be shared between waits/pages: each wait
+    calls intervals() to get its own sequence of sleep intervals.
+    '''
+
+    def intervals(self):
+        '''generator yielding the seconds to sleep after each poll'''
+        raise NotImplementedError('Subclasses must implement intervals()')
+
+
+class FixedPolling(PollStrategy):
+    '''poll at a fixed interval, same as WebDriverWait(poll_frequency)
+
+    Arguments
+        interval (float): seconds between polls
+    '''
+
+    def __init__(self, interval = DEFAULT_POLL_FREQUENCY):
+        self.interval = interval
+
+    def intervals(self):
+        while True:
+            yield self.interval
+
+    def __repr__(self):
+        return '%s(interval=%s)' % (type(self).__name__, self.interval)
+
+
+class ExponentialBackoff(PollStrategy):
+    '''poll quickly at first, multiplying the interval by factor after each
+    poll up to maximum. Each interval is randomized by +/- jitter (ratio) so
+    that parallel sessions do not poll the grid in lockstep.
+
+    Arguments
+        initial (float): seconds before the 2nd poll
+        factor (float): interval multiplier after each poll
+        maximum (float): maximum seconds between polls
+        jitter (float): randomization ratio applied to each interval
+    '''
+
+    def __init__(self, initial = 0.1, factor = 2, maximum = 2.0,
+                 jitter = 0.1):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+        self.jitter = jitter
+
+    def intervals(self):
+        interval = self.initial
+
+        while True:
+            yield interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            interval = min(interval * self.factor, self.maximum)
+
+    def __repr__(self):
+        return ('%s(initial=%s, factor=%s, maximum=%s, jitter=%s)'
+                % (type(self).__name__, self.initial, self.factor,
+                   self.maximum, self.jitter))
+
+
+class FastThenSlow(PollStrategy):
+    '''poll at a fast interval for the first fast_period seconds, then at a
+    slow interval: most conditions are met quickly, and the ones that are not
+    are usually slow.
+
+    Arguments
+        fast (float): seconds between polls during fast_period
+        fast_period (float): seconds to poll fast for
+        slow (float): seconds between polls afterwards
+    '''
+
+    def __init__(self, fast = 0.1, fast_period = 1.0, slow = 1.0):
+        self.fast = fast
+        self.fast_period = fast_period
+        self.slow = slow
+
+    def intervals(self):
+        elapsed = 0
+
+        while elapsed < self.fast_period:
+            elapsed += self.fast
+            yield self.fast
+
+        while True:
+            yield self.slow
+
+    def __repr__(self):
+        return '%s(fast=%s, fast_period=%s, slow=%s)' % (type(self).__name__,
+                                                         self.fast,
+                                                         self.fast_period,
+                                                         self.slow)
+
+
+class PollCounters(object):
+    '''
+    Poll accounting for waits, allowing to tune grid load against latency.
+
+    Attributes
+        waits (int): number of waits performed
+        polls (int): total number of polls spent across all waits
+        timeouts (int): number of waits that timed out
+        last (int): number of polls spent by the last wait
+    '''
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.waits = 0
+        self.polls = 0
+        self.timeouts = 0
+        self.last = 0
+
+    def record(self, polls, timed_out = False):
+        '''account for a single finished wait'''
+        self.waits += 1
+        self.polls += polls
+        self.timeouts += int(timed_out)
+        self.last = polls
+
+    @property
+    def average(self):
+        '''average number of polls per wait'''
+        return self.polls / self.waits if self.waits else 0
+
+    def __repr__(self):
+        return ('%s(waits=%s, polls=%s, timeouts=%s, last=%s)'
+                % (type(self).__name__, self.waits, self.polls,
+                   self.timeouts, self.last))
+
+
+class Poller(object):
+    '''
+    Drop-in replacement for selenium WebDriverWait(), sleeping between polls
+    according to a PollStrategy and counting the polls spent.
+
+    Arguments
+        driver (obj): driver passed to conditions
+        timeout (int): seconds to wait for
+        strategy (PollStrategy): poll interval strategy
+        poll_frequency (float): when provided, overrides strategy with a
+                                FixedPolling(poll_frequency)
+        ignored_exceptions (iterable): exception class (or classes) ignored
+                                       during polls, in addition to
+                                       NoSuchElementException
+        counters (PollCounters): counters to account the wait in
+    '''
+
+    def __init__(self, driver, timeout, strategy, poll_frequency = None,
+                 ignored_exceptions = None, counters = None):
+        self.driver = driver
+        self.timeout = timeout
+        self.strategy = strategy
+        self.counters = counters
+        self.polls = 0
+
+        if poll_frequency:
+            self.strategy = FixedPolling(poll_frequency)
+
+        self.ignored_exceptions = (NoSuchElementException,)
+        if ignored_exceptions:
+            try:
+                self.ignored_exceptions += tuple(iter(ignored_exceptions))
+            except TypeError:
+                # a single exception class, as WebDriverWait accepts
+                self.ignored_exceptions += (ignored_exceptions,)
+
+    def until(self, method, message = ''):
+        '''poll method until it returns a truthy value, and return it'''
+        return self._poll(method, message, negate = False)
+
+    def until_not(self, method, message = ''):
+        '''poll method until it returns a falsy value (or raises an ignored
+        exception, returning True)'''
+        return self._poll(method, message, negate = True)
+
+    def _poll(self, method, message, negate):
+        steps = self._polling(message, negate)
+
+        try:
+            for _ in steps:
+                try:
+                    value = method(self.driver)
+                except Exception as e:
+                    time.sleep(steps.throw(e))
+                else:
+                    time.sleep(steps.send(value))
+
+        except StopIteration as stop:
+            return stop.value
+
+    def _polling(self, message, negate):
+        '''bookkeeping of a wait, shared by the sync and async polling 
+        loops (see aio.AsyncPoller), which only run the polls and sleep.
+
+        A generator yielding None when the next poll is due, then sent its
+        result (or thrown the exception it raised), and yielding the seconds
+        to sleep before the next poll. Returns (StopIteration) the wait 
+        result, raises TimeoutException once timed out, and accounts the 
+        polls spent into counters.'''
+
+        end_time = time.monotonic() + self.timeout
+        intervals = self.strategy.intervals()
+        self.polls = 0
+        timed_out = False
+
+        try:
+            while True:
+                self.polls += 1
+
+                try:
+                    value = yield
+                    if bool(value) is not negate:
+                        return value
+
+                except self.ignored_exceptions:
+                    if negate:
+                        return True
+
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    raise TimeoutException(message)
+
+                yield min(next(intervals), remaining)
+
+        finally:
+            if self.counters is not None:
+                self.counters.record(self.polls, timed_out)
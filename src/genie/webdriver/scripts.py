@@ -0,0 +1,968 @@
+# javascript sources injected into the browser by this package.
+#
+# sources ending in _JS are snippets (function definitions) meant to be
+# concatenated into a full script. The remaining constants are complete
+# scripts, ready for driver.execute_script()/execute_async_script().
+
+# find(by, value, root)
+#   locate all elements matching a selenium (By.<Type>, 'value') locator pair,
+#   relative to root (defaults to document). Returns an array. by can also be
+#   'chain' (utils.CHAIN), value being a resolve_chain() chain.
+#
+# resolve_chain(chain, root)
+#   resolve nested locators at once. chain is [base, shadow, steps]: steps
+#   are [by, value, shadow] lists, each one located (first match) within the
+#   previous one, or its shadow root when shadow is set, starting from base 
+#   (an element, or null for root). All matches of the last step are found.
+#   Returns {path, found}, path being the elements of all other steps, or 
+#   null when any of them was not found.
+FIND_ELEMENTS_JS = '''
+function resolve_chain(chain, root) {
+    var scope = chain[0] || root || document;
+    if (chain[0] && chain[1]) {
+        scope = scope.shadowRoot;
+    }
+    var steps = chain[2], path = [];
+    for (var s = 0; s < steps.length - 1; s++) {
+        var el = scope ? find(steps[s][0], steps[s][1], scope)[0] : null;
+        if (!el) {
+            return null;
+        }
+        path.push(el);
+        scope = steps[s][2] ? el.shadowRoot : el;
+    }
+    if (!scope) {
+        return null;
+    }
+    var last = steps[steps.length - 1];
+    return {path: path, found: find(last[0], last[1], scope)};
+}
+
+function find(by, value, root) {
+    root = root || document;
+    var doc = root.ownerDocument || root;
+    var found = [];
+    switch (by) {
+        case 'xpath':
+            var snapshot = doc.evaluate(value, root, null,
+                                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+                                        null);
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                found.push(snapshot.snapshotItem(i));
+            }
+            return found;
+        case 'id':
+            return Array.from(root.querySelectorAll('#' + CSS.escape(value)));
+        case 'name':
+            return Array.from(root.querySelectorAll(
+                                    '[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            return Array.from(root.querySelectorAll('.' + CSS.escape(value)));
+        case 'tag name':
+        case 'css selector':
+            return Array.from(root.querySelectorAll(value));
+        case 'link text':
+        case 'partial link text':
+            var links = root.querySelectorAll('a');
+            for (var j = 0; j < links.length; j++) {
+                var text = (links[j].innerText || '').trim();
+                if (by === 'link text' ? text === value
+                                       : text.indexOf(value) !== -1) {
+                    found.push(links[j]);
+                }
+            }
+            return found;
+        case 'chain':
+            var resolved = resolve_chain(value, root);
+            return resolved ? resolved.found : [];
+    }
+    throw new Error('unsupported locator strategy: ' + by);
+}
+'''
+
+# execute_script(RESOLVE, chain)
+#   resolve_chain() from document, returning {path, found} or null.
+RESOLVE = FIND_ELEMENTS_JS + '''
+return resolve_chain(arguments[0]);
+'''
+
+# visible(el)
+#   approximation of selenium's is_displayed(): rendered with a non-zero size,
+#   and not hidden through css visibility/opacity.
+VISIBLE_JS = '''
+function visible(el) {
+    if (!el.isConnected) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse' ||
+        parseFloat(style.opacity) === 0) {
+        return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+'''
+
+# check(kind, by, value)
+#   evaluate one locator based expected condition. Returns a truthy value
+#   (the matched element, or true) when the condition holds, null otherwise.
+#   check_element(kind, el) evaluates it on an element (or null) instead.
+#   The 'document' kind checks the document instead of a locator: it holds
+#   once document.readyState reached value, unless LEAVE marked the
+#   document as being left.
+CHECK_JS = FIND_ELEMENTS_JS + VISIBLE_JS + '''
+function check(kind, by, value) {
+    if (kind === 'document') {
+        var states = ['loading', 'interactive', 'complete'];
+        return !document.__genieLeaving &&
+               states.indexOf(document.readyState) >= states.indexOf(value)
+               ? true : null;
+    }
+    var found = find(by, value);
+    return check_element(kind, found.length ? found[0] : null);
+}
+
+function check_element(kind, el) {
+    switch (kind) {
+        case 'presence':
+            return el;
+        case 'visibility':
+            return el && visible(el) ? el : null;
+        case 'clickable':
+            return el && visible(el) && !el.disabled ? el : null;
+        case 'invisibility':
+            return el ? (visible(el) ? null : el) : true;
+    }
+    throw new Error('unsupported condition: ' + kind);
+}
+'''
+
+# execute_script(CHECK_ELEMENT, kind, element)
+#   evaluate a check() kind on an already located element, eg: a cached 
+#   one. Returns 'stale' when the element is no longer attached to the 
+#   document, true when the check holds, null otherwise.
+CHECK_ELEMENT = CHECK_JS + '''
+var el = arguments[1];
+if (!el.isConnected) {
+    return 'stale';
+}
+return check_element(arguments[0], el) ? true : null;
+'''
+
+# check_all(specs, mode, negate)
+#   evaluate a list of [kind, by, value] checks at once. When negate is set,
+#   each check is inverted. Returns {matched: [indexes], values: [...]} when
+#   'any'/'all' (mode) of the checks hold, null otherwise.
+CHECK_ALL_JS = CHECK_JS + '''
+function check_all(specs, mode, negate) {
+    var matched = [], values = [];
+    for (var i = 0; i < specs.length; i++) {
+        var result = check(specs[i][0], specs[i][1], specs[i][2]);
+        if (negate) {
+            result = result ? null : true;
+        }
+        values.push(result || null);
+        if (result) {
+            matched.push(i);
+        }
+    }
+    var holds = mode === 'any' ? matched.length > 0
+                               : matched.length === specs.length;
+    return holds ? {matched: matched, values: values} : null;
+}
+'''
+
+# execute_script(EVALUATE, specs, mode, negate)
+#   single evaluation of check_all(), for python side polling.
+EVALUATE = CHECK_ALL_JS + '''
+return check_all(arguments[0], arguments[1], arguments[2]);
+'''
+
+# execute_async_script(OBSERVE, specs, mode, negate, timeout_ms)
+#   resolves as soon as check_all() holds by re-evaluating on every DOM
+#   mutation. A slow interval backs the observer up for changes that do not
+#   mutate the DOM, such as css transitions. Resolves with
+#   {status: 'ok', value: <check_all() result>} or {status: 'timeout'} once
+#   timeout_ms has elapsed.
+OBSERVE = CHECK_ALL_JS + '''
+var specs = arguments[0], mode = arguments[1], negate = arguments[2],
+    timeout = arguments[3], done = arguments[arguments.length - 1];
+
+function evaluate() {
+    return check_all(specs, mode, negate);
+}
+
+var finished = false, pending = false,
+    observer = null, interval = null, timer = null;
+
+function finish(outcome) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+        clearInterval(interval);
+        clearTimeout(timer);
+    }
+    done(outcome);
+}
+
+function poll() {
+    pending = false;
+    try {
+        var result = evaluate();
+        if (result) {
+            finish({status: 'ok', value: result});
+        }
+    } catch (e) {
+        finish({status: 'error', message: String(e)});
+    }
+}
+
+function schedule() {
+    if (!pending) {
+        pending = true;
+        setTimeout(poll, 0);
+    }
+}
+
+poll();
+if (!finished) {
+    observer = new MutationObserver(schedule);
+    observer.observe(document, {childList: true, subtree: true,
+                                attributes: true, characterData: true});
+    interval = setInterval(schedule, 250);
+    timer = setTimeout(function () { finish({status: 'timeout'}); }, timeout);
+}
+'''
+
+# execute_script(LEAVE, url)
+#   mark the current document as being left for url (relative to the 
+#   current location), before driver.get() under the 'none' pageLoadStrategy
+#   returns right away. Unless only the fragment changes, 'document' checks
+#   then never hold on it, even while it lingers until the next document 
+#   replaces it.
+LEAVE = '''
+var url = new URL(arguments[0], location.href);
+if (url.href.split('#')[0] !== location.href.split('#')[0] || !url.hash) {
+    document.__genieLeaving = true;
+}
+'''
+
+# execute_script(ROUTE, url)
+#   change the route of a single page application to url (relative to the
+#   current location) through the History API, without loading a new 
+#   document: url is pushed onto the session history, and a popstate event
+#   lets the application router render it. Returns false, without 
+#   navigating, when url is on another origin than the current document.
+ROUTE = '''
+var url = new URL(arguments[0], location.href);
+if (url.origin !== location.origin) {
+    return false;
+}
+history.pushState(null, '', url.href);
+window.dispatchEvent(new PopStateEvent('popstate', {state: null}));
+return true;
+'''
+
+# execute_script(COUNT, by, value, op, number, limit, negate)
+#   count the elements matching a locator and compare the count to number
+#   ('eq', 'ge' or 'lt' op). When the comparison holds (or, when negate is
+#   set, does not hold), returns {count: <count>, elements: <first limit
+#   elements>}, null otherwise: element references are only transferred once
+#   the condition holds, and only when asked for.
+COUNT = FIND_ELEMENTS_JS + '''
+var found = find(arguments[0], arguments[1]), count = found.length,
+    op = arguments[2], number = arguments[3], limit = arguments[4];
+var holds;
+switch (op) {
+    case 'eq':
+        holds = count === number;
+        break;
+    case 'ge':
+        holds = count >= number;
+        break;
+    case 'lt':
+        holds = count < number;
+        break;
+    default:
+        throw new Error('unsupported comparison: ' + op);
+}
+if (arguments[5]) {
+    holds = !holds;
+}
+return holds ? {count: count, elements: found.slice(0, limit)} : null;
+'''
+
+# execute_script(READ_ALL, by, value, field, name)
+#   read a field of all elements matching a locator at once, without
+#   transferring any element reference. field is one of 'text' (visible
+#   text), 'attribute' (getAttribute(name)) or 'property' (el[name]).
+READ_ALL = FIND_ELEMENTS_JS + '''
+var field = arguments[2], name = arguments[3];
+return find(arguments[0], arguments[1]).map(function (el) {
+    switch (field) {
+        case 'text':
+            return (el.innerText || '').trim();
+        case 'attribute':
+            return el.getAttribute(name);
+        case 'property':
+            var value = el[name];
+            return value === undefined ? null : value;
+    }
+    throw new Error('unsupported field: ' + field);
+});
+'''
+
+# execute_script(SNAPSHOT, target, fields, attributes)
+#   read many properties of a single element at once. target is either an
+#   element, or a [by, value] locator pair (first match). Returns an object
+#   holding the requested fields, plus an attributes object when attribute
+#   names are requested, or null if no element matched.
+SNAPSHOT = FIND_ELEMENTS_JS + VISIBLE_JS + '''
+var target = arguments[0], fields = arguments[1], attributes = arguments[2];
+var el = Array.isArray(target) ? find(target[0], target[1])[0] : target;
+if (!el) {
+    return null;
+}
+var result = {};
+for (var i = 0; i < fields.length; i++) {
+    switch (fields[i]) {
+        case 'displayed':
+            result.displayed = visible(el);
+            break;
+        case 'enabled':
+            result.enabled = !el.disabled;
+            break;
+        case 'selected':
+            result.selected = !!(el.checked || el.selected);
+            break;
+        case 'text':
+            result.text = (el.innerText || '').trim();
+            break;
+        case 'value':
+            result.value = el.value === undefined ? null : el.value;
+            break;
+        case 'tag_name':
+            result.tag_name = el.tagName.toLowerCase();
+            break;
+        case 'rect':
+            var rect = el.getBoundingClientRect();
+            result.rect = {x: rect.left + window.scrollX,
+                           y: rect.top + window.scrollY,
+                           width: rect.width, height: rect.height};
+            break;
+        default:
+            throw new Error('unsupported snapshot field: ' + fields[i]);
+    }
+}
+if (attributes.length) {
+    result.attributes = {};
+    for (var j = 0; j < attributes.length; j++) {
+        result.attributes[attributes[j]] = el.getAttribute(attributes[j]);
+    }
+}
+return result;
+'''
+
+# execute_script(PREFETCH, locators)
+#   locate many [by, value] locator pairs at once (first match each). Returns
+#   an array holding, for each locator, null when nothing matched, else
+#   {element, ready}: ready when the element is displayed and enabled.
+PREFETCH = FIND_ELEMENTS_JS + VISIBLE_JS + '''
+return arguments[0].map(function (locator) {
+    var el = find(locator[0], locator[1])[0];
+    if (!el) {
+        return null;
+    }
+    return {element: el, ready: visible(el) && !el.disabled};
+});
+'''
+
+# execute_async_script(VIRTUAL_LIST, container, items, key, scroll,
+#                      settle_ms)
+#   read the rendered items of a virtualized/infinite scroll list, first
+#   scrolling its container down by (nearly) a viewport when scroll is set,
+#   and reading once the next frame is rendered and settle_ms elapsed. 
+#   container is a [by, value] locator (first match), or null for the page
+#   itself. items is a [by, value] locator of the items, relative to the 
+#   container. Returns {items, scrolled}, items being [key, text] pairs 
+#   (key being the key attribute value, null without key) and scrolled 
+#   whether the container moved. Returns null when no container matched.
+VIRTUAL_LIST = FIND_ELEMENTS_JS + '''
+var container = arguments[0], items = arguments[1], key = arguments[2],
+    scroll = arguments[3], settle_ms = arguments[4],
+    done = arguments[arguments.length - 1];
+var root = document;
+var scroller = document.scrollingElement || document.documentElement;
+if (container) {
+    root = scroller = find(container[0], container[1])[0];
+    if (!root) {
+        done(null);
+        return;
+    }
+}
+
+function read(scrolled) {
+    done({
+        scrolled: scrolled,
+        items: find(items[0], items[1], root).map(function (el) {
+            return [key ? el.getAttribute(key) : null,
+                    (el.innerText || '').trim()];
+        })
+    });
+}
+
+if (!scroll) {
+    read(false);
+    return;
+}
+var before = scroller.scrollTop;
+scroller.scrollTop = before + Math.max(scroller.clientHeight * 0.9, 1);
+var scrolled = scroller.scrollTop !== before;
+requestAnimationFrame(function () {
+    setTimeout(function () {
+        read(scrolled);
+    }, settle_ms);
+});
+'''
+
+# fire(el, type)
+#   dispatch a bubbling event of type on el.
+#
+# set_value(el, value)
+#   set the value of an input/textarea at once, through its native value
+#   setter: frameworks tracking the value property (eg, react) otherwise
+#   ignore the change. Dispatches input and change events, like typing.
+SET_VALUE_JS = '''
+function fire(el, type) {
+    el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+
+function set_value(el, value) {
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el),
+                                                 'value');
+    if (setter && setter.set) {
+        setter.set.call(el, value);
+    } else {
+        el.value = value;
+    }
+    fire(el, 'input');
+    fire(el, 'change');
+}
+'''
+
+# execute_script(SET_VALUE, element, value)
+#   set_value() of a single element.
+SET_VALUE = SET_VALUE_JS + '''
+set_value(arguments[0], arguments[1]);
+'''
+
+# option_texts(options)
+#   trimmed texts of a list of <option> elements.
+#
+# fill(el, kind, value)
+#   set the value of a form element of kind 'value' (text inputs,
+#   textareas...), 'checkbox', 'radio' or 'select' (value being the option
+#   text, or a list of texts), dispatching input and change events. Elements
+#   already holding value are left untouched. Returns whether el changed.
+#
+# read(el, kind)
+#   current value of a form element of kind, in the same form.
+FILL_JS = SET_VALUE_JS + '''
+function option_texts(options) {
+    return Array.prototype.map.call(options, function (option) {
+        return option.text.trim();
+    });
+}
+
+function fill(el, kind, value) {
+    switch (kind) {
+        case 'checkbox':
+            if (el.checked === value) {
+                return false;
+            }
+            el.click();
+            return true;
+        case 'radio':
+            if (!value || el.checked) {
+                return false;
+            }
+            el.click();
+            return true;
+        case 'select':
+            var wanted = [].concat(value), changed = false;
+            for (var j = 0; j < el.options.length; j++) {
+                var option = el.options[j];
+                var selected = wanted.indexOf(option.text.trim()) !== -1;
+                if (option.selected !== selected) {
+                    option.selected = selected;
+                    changed = true;
+                }
+            }
+            if (changed) {
+                fire(el, 'input');
+                fire(el, 'change');
+            }
+            return changed;
+    }
+    if (el.value === value) {
+        return false;
+    }
+    set_value(el, value);
+    return true;
+}
+
+function read(el, kind) {
+    switch (kind) {
+        case 'checkbox':
+        case 'radio':
+            return el.checked;
+        case 'select':
+            var selected = option_texts(el.selectedOptions);
+            return el.multiple ? selected : (selected[0] || null);
+    }
+    return el.value === undefined ? null : el.value;
+}
+
+function missing_options(el, value) {
+    var texts = option_texts(el.options);
+    return [].concat(value).filter(function (text) {
+        return texts.indexOf(text) === -1;
+    });
+}
+'''
+
+# execute_script(FORM, fields, values)
+#   read (values is null) or fill then read a whole form at once. fields are
+#   [name, kind, by, value] lists, kind being one of fill()'s kinds, and
+#   values maps field names to the value to set. Returns {missing: [...]}
+#   without changing anything when a field (or select option) is not found,
+#   {pending: [...]} when a field to fill is not displayed and enabled yet,
+#   {values: {name: value}} otherwise.
+FORM = FIND_ELEMENTS_JS + VISIBLE_JS + FILL_JS + '''
+var fields = arguments[0], values = arguments[1];
+var elements = {}, missing = [], pending = [];
+
+for (var i = 0; i < fields.length; i++) {
+    var name = fields[i][0], kind = fields[i][1];
+    var el = find(fields[i][2], fields[i][3])[0];
+    if (!el) {
+        missing.push(name);
+        continue;
+    }
+    elements[name] = el;
+    if (!values || !values.hasOwnProperty(name)) {
+        continue;
+    }
+    if (kind === 'select') {
+        missing_options(el, values[name]).forEach(function (text) {
+            missing.push(name + ': ' + text);
+        });
+    }
+    if (!visible(el) || el.disabled) {
+        pending.push(name);
+    }
+}
+if (missing.length) {
+    return {missing: missing};
+}
+if (pending.length) {
+    return {pending: pending};
+}
+
+if (values) {
+    for (var k = 0; k < fields.length; k++) {
+        if (values.hasOwnProperty(fields[k][0])) {
+            fill(elements[fields[k][0]], fields[k][1], values[fields[k][0]]);
+        }
+    }
+}
+
+var result = {};
+for (var m = 0; m < fields.length; m++) {
+    result[fields[m][0]] = read(elements[fields[m][0]], fields[m][1]);
+}
+return {values: result};
+'''
+
+# execute_script(ENSURE, target, kind, value)
+#   bring a single form element to value (see fill()) unless it already is,
+#   once it is displayed and enabled. target is either an element, or a
+#   [by, value] locator pair (first match). Returns null while the element
+#   is not found/displayed/enabled, {missing: [...]} (changing nothing) when
+#   select options are not found, {changed, value} otherwise.
+ENSURE = FIND_ELEMENTS_JS + VISIBLE_JS + FILL_JS + '''
+var target = arguments[0], kind = arguments[1], value = arguments[2];
+var el = Array.isArray(target) ? find(target[0], target[1])[0] : target;
+if (!el || !visible(el) || el.disabled) {
+    return null;
+}
+if (kind === 'select') {
+    var missing = missing_options(el, value);
+    if (missing.length) {
+        return {missing: missing};
+    }
+}
+var changed = fill(el, kind, value);
+return {changed: changed, value: read(el, kind)};
+'''
+
+# execute_script(OPTIONS, target)
+#   read all the options of a <select> at once. target is either an element,
+#   or a [by, value] locator pair (first match). Returns {multiple, options}
+#   with options as {index, value, text, selected, disabled} objects, or null
+#   if no element matched.
+OPTIONS = FIND_ELEMENTS_JS + '''
+var target = arguments[0];
+var el = Array.isArray(target) ? find(target[0], target[1])[0] : target;
+if (!el) {
+    return null;
+}
+return {
+    multiple: el.multiple,
+    options: Array.prototype.map.call(el.options, function (option) {
+        return {index: option.index, value: option.value,
+                text: option.text.trim(), selected: option.selected,
+                disabled: option.disabled};
+    })
+};
+'''
+
+# execute_script(SELECT, target, match, patterns, deselect_others, flags)
+#   select the options of a <select> matching patterns at once, once it is
+#   displayed. target is either an element, or a [by, value] locator pair 
+#   (first match). match is 'text' (exact trimmed text), 'value' or 'regex'
+#   (RegExp tested against the text, built with the RegExp flags of the
+#   same index in the optional flags list). Single selects select the first match
+#   of their single pattern, multiple selects all matches of all patterns,
+#   deselecting the others if deselect_others. Disabled options never match.
+#   Returns null while the element is not found/displayed, {missing: [...]}
+#   (changing nothing) when patterns matched nothing, {changed, selected}
+#   (selected option texts) otherwise.
+SELECT = FIND_ELEMENTS_JS + VISIBLE_JS + FILL_JS + '''
+var target = arguments[0], match = arguments[1], patterns = arguments[2];
+var deselect_others = arguments[3], flags = arguments[4] || [];
+var el = Array.isArray(target) ? find(target[0], target[1])[0] : target;
+if (!el || !visible(el)) {
+    return null;
+}
+if (!el.multiple && patterns.length > 1) {
+    throw new Error('cannot select several options of a single select');
+}
+
+function matches(option, pattern) {
+    switch (match) {
+        case 'value':
+            return option.value === pattern;
+        case 'regex':
+            return pattern.test(option.text.trim());
+    }
+    return option.text.trim() === pattern;
+}
+
+var wanted = [], missing = [];
+for (var i = 0; i < patterns.length; i++) {
+    var pattern = match === 'regex' ? new RegExp(patterns[i], flags[i] || '')
+                                  : patterns[i];
+    var found = false;
+    for (var j = 0; j < el.options.length; j++) {
+        var option = el.options[j];
+        if (option.disabled || !matches(option, pattern)) {
+            continue;
+        }
+        found = true;
+        if (wanted.indexOf(option) === -1) {
+            wanted.push(option);
+        }
+        if (!el.multiple) {
+            break;
+        }
+    }
+    if (!found) {
+        missing.push(patterns[i]);
+    }
+}
+if (missing.length) {
+    return {missing: missing};
+}
+
+var changed = false;
+for (var k = 0; k < el.options.length; k++) {
+    var selected = wanted.indexOf(el.options[k]) !== -1 || 
+                   (el.multiple && !deselect_others && el.options[k].selected);
+    if (el.options[k].selected !== selected) {
+        el.options[k].selected = selected;
+        changed = true;
+    }
+}
+if (changed) {
+    fire(el, 'input');
+    fire(el, 'change');
+}
+return {changed: changed, selected: option_texts(el.selectedOptions)};
+'''
+
+# execute_script(TABLE, by, value, start, stop, layout)
+#   serialize the cell texts of a <table> (first locator match), returning
+#   {headers, total, rows} for body rows [start, stop) (stop null for all),
+#   or {headers, total, columns} when layout is 'columns'. headers come from
+#   the last <thead> row, else from a leading row of <th> cells, and are null
+#   when there is none. Returns null when no table matched.
+TABLE = FIND_ELEMENTS_JS + '''
+var table = find(arguments[0], arguments[1])[0];
+if (!table) {
+    return null;
+}
+var start = arguments[2], stop = arguments[3], layout = arguments[4];
+
+function texts(row) {
+    return Array.prototype.map.call(row.cells, function (cell) {
+        return (cell.innerText || '').trim();
+    });
+}
+
+var headers = null, body = [];
+if (table.tHead && table.tHead.rows.length) {
+    headers = texts(table.tHead.rows[table.tHead.rows.length - 1]);
+}
+for (var i = 0; i < table.tBodies.length; i++) {
+    // row by row: push.apply() overflows the stack on huge tables
+    var rows = table.tBodies[i].rows;
+    for (var r = 0; r < rows.length; r++) {
+        body.push(rows[r]);
+    }
+}
+if (!table.tBodies.length) {
+    body = Array.prototype.slice.call(table.rows);
+}
+if (!headers && body.length && Array.prototype.every.call(body[0].cells,
+        function (cell) { return cell.tagName === 'TH'; })) {
+    headers = texts(body.shift());
+}
+
+var rows = body.slice(start, stop === null ? undefined : stop).map(texts);
+if (layout !== 'columns') {
+    return {headers: headers, total: body.length, rows: rows};
+}
+// pad short rows with nulls, keeping columns aligned
+var width = headers ? headers.length : 0, columns = [];
+rows.forEach(function (row) {
+    width = Math.max(width, row.length);
+});
+for (var c = 0; c < width; c++) {
+    columns.push(rows.map(function (row) {
+        return c < row.length ? row[c] : null;
+    }));
+}
+return {headers: headers, total: body.length, columns: columns};
+'''
+
+# activity()
+#   install (once per document) and return the page activity tracker:
+#   {inflight, network, dom, listeners}. fetch() and XMLHttpRequest are
+#   instrumented to count pending requests, and a MutationObserver records DOM
+#   changes. network/dom are the timestamps (ms) of the last activity, and
+#   listeners are called on every activity.
+#
+# quiet_left(kind, quiet, max_inflight)
+#   milliseconds left before 'network' or 'dom' (kind) activity has been
+#   quiet for quiet ms, 0 when already quiet.
+ACTIVITY_JS = '''
+function activity() {
+    var state = window.__genie_activity;
+    if (state) {
+        return state;
+    }
+    state = window.__genie_activity = {inflight: 0, network: 0,
+                                       dom: Date.now(), listeners: []};
+
+    function notify() {
+        var listeners = state.listeners.slice();
+        for (var i = 0; i < listeners.length; i++) {
+            listeners[i]();
+        }
+    }
+
+    function started() {
+        state.inflight++;
+        state.network = Date.now();
+        notify();
+    }
+
+    function ended() {
+        state.inflight = Math.max(state.inflight - 1, 0);
+        state.network = Date.now();
+        notify();
+    }
+
+    var fetch = window.fetch;
+    if (fetch) {
+        window.fetch = function () {
+            var pending;
+            started();
+            try {
+                pending = fetch.apply(this, arguments);
+            } catch (e) {
+                ended();
+                throw e;
+            }
+            return pending.then(function (response) {
+                ended();
+                return response;
+            }, function (error) {
+                ended();
+                throw error;
+            });
+        };
+    }
+
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', ended);
+        try {
+            return send.apply(this, arguments);
+        } catch (e) {
+            this.removeEventListener('loadend', ended);
+            ended();
+            throw e;
+        }
+    };
+
+    new MutationObserver(function () {
+        state.dom = Date.now();
+        notify();
+    }).observe(document, {childList: true, subtree: true,
+                          attributes: true, characterData: true});
+
+    return state;
+}
+
+function quiet_left(kind, quiet, max_inflight) {
+    var state = activity(), last;
+    if (kind === 'dom') {
+        last = state.dom;
+    } else if (kind === 'network') {
+        var inflight = state.inflight +
+                       (document.readyState === 'complete' ? 0 : 1);
+        if (inflight > max_inflight) {
+            return quiet;
+        }
+        // resources loaded outside of fetch/xhr (or before instrumenting)
+        last = state.network;
+        var origin = performance.timeOrigin || performance.timing.navigationStart;
+        var entries = performance.getEntriesByType('resource');
+        for (var i = 0; i < entries.length; i++) {
+            last = Math.max(last, origin + entries[i].responseEnd);
+        }
+    } else {
+        throw new Error('unsupported activity: ' + kind);
+    }
+    return Math.max(quiet - (Date.now() - last), 0);
+}
+'''
+
+# execute_script(IS_QUIET, kind, quiet, max_inflight, negate)
+#   single evaluation of quiet_left(), for python side polling: true when
+#   quiet (or, when negate is set, when not quiet).
+IS_QUIET = ACTIVITY_JS + '''
+var left = quiet_left(arguments[0], arguments[1], arguments[2]);
+return arguments[3] ? left > 0 : left === 0;
+'''
+
+# execute_async_script(QUIET, kind, quiet, max_inflight, negate, timeout_ms)
+#   resolves with {status: 'ok', value: true} the moment quiet_left() reaches
+#   0 (or, when negate is set, as soon as there is activity), re-checking on
+#   every activity and when the quiet period is due. Resolves with
+#   {status: 'timeout'} once timeout_ms has elapsed.
+QUIET = ACTIVITY_JS + '''
+var kind = arguments[0], quiet = arguments[1], max_inflight = arguments[2],
+    negate = arguments[3], timeout = arguments[4],
+    done = arguments[arguments.length - 1];
+
+var state = activity(), finished = false, timer = null, deadline = null;
+
+function finish(outcome) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    var index = state.listeners.indexOf(check);
+    if (index !== -1) {
+        state.listeners.splice(index, 1);
+    }
+    clearTimeout(timer);
+    clearTimeout(deadline);
+    done(outcome);
+}
+
+function check() {
+    if (finished) {
+        return;
+    }
+    var left;
+    try {
+        left = quiet_left(kind, quiet, max_inflight);
+    } catch (e) {
+        finish({status: 'error', message: String(e)});
+        return;
+    }
+    if (negate ? left > 0 : left === 0) {
+        finish({status: 'ok', value: true});
+        return;
+    }
+    // re-check when the quiet period is due, activity re-checks sooner
+    clearTimeout(timer);
+    timer = setTimeout(check, negate ? 250 : left);
+}
+
+state.listeners.push(check);
+deadline = setTimeout(function () { finish({status: 'timeout'}); }, timeout);
+check();
+'''
+
+# execute_script(NAVIGATION_TIMING, top)
+#   read the Navigation Timing entry of the current document, and summarize
+#   its Resource Timing entries: count, total transfer size and the top
+#   slowest ones. Times are ms since navigation start, 0 when not reached yet
+#   (eg, load before the load event). navigation is null when the browser 
+#   reports no navigation entry.
+NAVIGATION_TIMING = '''
+var top = arguments[0];
+var navigation = performance.getEntriesByType('navigation')[0] || null;
+var resources = performance.getEntriesByType('resource');
+
+function transfer_size(entry) {
+    // 0 for cached and cross-origin resources without Timing-Allow-Origin
+    return entry.transferSize || 0;
+}
+
+var slowest = resources.slice().sort(function (a, b) {
+    return b.duration - a.duration;
+}).slice(0, top);
+
+return {
+    navigation: navigation && {
+        url: navigation.name,
+        type: navigation.type,
+        ttfb: navigation.responseStart,
+        dom_content_loaded: navigation.domContentLoadedEventEnd,
+        load: navigation.loadEventEnd,
+        transfer_size: transfer_size(navigation)
+    },
+    resources: {
+        count: resources.length,
+        transfer_size: resources.reduce(function (total, entry) {
+            return total + transfer_size(entry);
+        }, 0),
+        slowest: slowest.map(function (entry) {
+            return {name: entry.name, initiator_type: entry.initiatorType,
+                    duration: entry.duration,
+                    transfer_size: transfer_size(entry)};
+        })
+    }
+};
+'''
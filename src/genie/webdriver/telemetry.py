@@ -0,0 +1,493 @@
+import json
+import time
+import inspect
+import functools
+from collections import namedtuple
+
+from selenium.common.exceptions import TimeoutException
+
+from . import utils, polling, scripts
+
+# histogram bucket upper bounds, in seconds
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float('inf'))
+
+# wait outcomes
+SATISFIED = 'satisfied'
+TIMED_OUT = 'timed_out'
+FAILED = 'failed'
+
+# number of slowest resources kept per page load, and per page class
+SLOWEST_RESOURCES = 5
+
+# one Resource Timing entry: url, initiator type (img, script, fetch...),
+# duration (seconds) and transfer size (bytes)
+ResourceTiming = namedtuple('ResourceTiming', ['name', 'initiator_type',
+                                               'duration', 'transfer_size'])
+
+
+class Histogram(object):
+    '''
+    Fixed bucket histogram of durations (seconds).
+
+    Arguments
+        buckets (tuple): sorted bucket upper bounds, last one should be inf
+    '''
+
+    def __init__(self, buckets = BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def to_dict(self):
+        return dict(count = self.count,
+                    total = self.total,
+                    mean = self.mean,
+                    min = self.min,
+                    max = self.max,
+                    buckets = {('le_%s' % bound): count
+                               for bound, count in zip(self.buckets,
+                                                       self.counts)})
+
+
+class WaitStats(object):
+    '''
+    Aggregated telemetry of one wait condition, on one locator, from one page
+    class.
+
+    Attributes
+        satisfied (int): number of waits where the condition was met
+        timed_out (int): number of waits that timed out
+        failed (int): number of waits that raised any other error
+        polls (int): total number of polls spent
+        elapsed (Histogram): time-to-satisfy of satisfied waits
+        wasted (float): total seconds spent in timed out/failed waits
+    '''
+
+    def __init__(self, page, condition, locator, buckets = BUCKETS):
+        self.page = page
+        self.condition = condition
+        self.locator = locator
+        self.satisfied = 0
+        self.timed_out = 0
+        self.failed = 0
+        self.polls = 0
+        self.elapsed = Histogram(buckets)
+        self.wasted = 0.0
+
+    def add(self, elapsed, polls, outcome):
+        self.polls += polls
+
+        if outcome == SATISFIED:
+            self.satisfied += 1
+            self.elapsed.add(elapsed)
+        else:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.wasted += elapsed
+
+    @property
+    def total(self):
+        '''total seconds spent waiting, all outcomes included'''
+        return self.elapsed.total + self.wasted
+
+    def to_dict(self):
+        return dict(page = self.page,
+                    condition = self.condition,
+                    locator = self.locator,
+                    satisfied = self.satisfied,
+                    timed_out = self.timed_out,
+                    failed = self.failed,
+                    polls = self.polls,
+                    total = self.total,
+                    wasted = self.wasted,
+                    elapsed = self.elapsed.to_dict())
+
+
+class WaitRecorder(object):
+    '''
+    In-memory collection of wait telemetry, fed by WaitUntil condition
+    methods when provided as their recorder.
+
+    Example:
+        recorder = WaitRecorder()
+        wait = Wait(driver, 10, recorder = recorder)
+
+        # ... run the tests ...
+
+        # eg, at the end of a pyATS job
+        recorder.dump('wait_telemetry.json')
+    '''
+
+    def __init__(self, buckets = BUCKETS):
+        self.buckets = buckets
+        self.stats = {}
+
+    def record(self, page, condition, locator, elapsed, polls, outcome):
+        '''record a single finished wait
+
+        Arguments
+            page (str): page class name the wait came from, if any
+            condition (str): condition method name
+            locator (str): locator/target description of the condition
+            elapsed (float): seconds spent waiting
+            polls (int): number of polls spent
+            outcome (str): SATISFIED, TIMED_OUT or FAILED
+        '''
+        key = (page, condition, locator)
+
+        try:
+            stats = self.stats[key]
+        except KeyError:
+            stats = self.stats[key] = WaitStats(page, condition, locator,
+                                                self.buckets)
+
+        stats.add(elapsed, polls, outcome)
+
+    def reset(self):
+        self.stats.clear()
+
+    def to_dict(self):
+        '''all recorded stats, slowest (total wait time) first'''
+        ordered = sorted(self.stats.values(),
+                         key = lambda stats: stats.total,
+                         reverse = True)
+
+        return dict(waits = [stats.to_dict() for stats in ordered])
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def dump(self, path):
+        '''write all recorded stats as json to path'''
+        with open(path, 'w') as f:
+            f.write(self.to_json(indent = 4))
+
+
+# default run-level recorder, eg: WebPage.WAIT_RECORDER = wait_recorder
+wait_recorder = WaitRecorder()
+
+
+def _seconds(ms):
+    # browser timings are ms since navigation start, 0 when not reached
+    return ms / 1000 if ms else None
+
+
+class NavigationTiming(object):
+    '''
+    Navigation and resource timings of one page load, as reported by the
+    browser Navigation Timing and Resource Timing apis. Times are seconds 
+    since navigation start, None when not reached (eg, load right after an
+    'eager' page load) or not reported by the browser.
+
+    Attributes
+        page (str): page class name, if any
+        url (str): loaded document url
+        type (str): navigation type: navigate, reload, back_forward...
+        ttfb (float): time to first byte of the document
+        dom_content_loaded (float): end of the DOMContentLoaded event
+        load (float): end of the load event
+        transfer_size (int): bytes transferred for the document
+        resources (int): number of resources loaded so far
+        resources_transfer_size (int): bytes transferred for them
+        slowest (list): slowest resources, as ResourceTiming
+    '''
+
+    def __init__(self, page, navigation, resources):
+        navigation = navigation or {}
+
+        self.page = page
+        self.url = navigation.get('url')
+        self.type = navigation.get('type')
+        self.ttfb = _seconds(navigation.get('ttfb'))
+        self.dom_content_loaded = _seconds(
+                                    navigation.get('dom_content_loaded'))
+        self.load = _seconds(navigation.get('load'))
+        self.transfer_size = navigation.get('transfer_size', 0)
+        self.resources = resources['count']
+        self.resources_transfer_size = resources['transfer_size']
+        self.slowest = [ResourceTiming(entry['name'], 
+                                       entry['initiator_type'],
+                                       entry['duration'] / 1000,
+                                       entry['transfer_size'])
+                        for entry in resources['slowest']]
+
+    @classmethod
+    def collect(cls, driver, page = None, top = SLOWEST_RESOURCES):
+        '''read the timings of the current document of driver, in a single
+        script call
+
+        Arguments
+            driver (obj): webdriver instance
+            page (str): page class name to record the timings under
+            top (int): number of slowest resources to keep
+        '''
+        result = driver.execute_script(scripts.NAVIGATION_TIMING, top)
+
+        return cls(page, result['navigation'], result['resources'])
+
+    def to_dict(self):
+        return dict(page = self.page,
+                    url = self.url,
+                    type = self.type,
+                    ttfb = self.ttfb,
+                    dom_content_loaded = self.dom_content_loaded,
+                    load = self.load,
+                    transfer_size = self.transfer_size,
+                    resources = self.resources,
+                    resources_transfer_size = self.resources_transfer_size,
+                    slowest = [entry._asdict() for entry in self.slowest])
+
+
+class LoadStats(object):
+    '''
+    Aggregated navigation timings of one page class.
+
+    Attributes
+        loads (int): number of page loads recorded
+        ttfb (Histogram): time to first byte
+        dom_content_loaded (Histogram): DOMContentLoaded event end
+        load (Histogram): load event end
+        transfer_size (int): total bytes transferred, resources included
+        slowest (list): slowest resources across all loads, as 
+                        ResourceTiming
+    '''
+
+    def __init__(self, page, buckets = BUCKETS, top = SLOWEST_RESOURCES):
+        self.page = page
+        self.top = top
+        self.loads = 0
+        self.ttfb = Histogram(buckets)
+        self.dom_content_loaded = Histogram(buckets)
+        self.load = Histogram(buckets)
+        self.transfer_size = 0
+        self.slowest = []
+
+    def add(self, timing):
+        self.loads += 1
+
+        for name in ('ttfb', 'dom_content_loaded', 'load'):
+            value = getattr(timing, name)
+            if value is not None:
+                getattr(self, name).add(value)
+
+        self.transfer_size += (timing.transfer_size + 
+                               timing.resources_transfer_size)
+
+        self.slowest = sorted(self.slowest + timing.slowest,
+                              key = lambda entry: entry.duration,
+                              reverse = True)[:self.top]
+
+    def to_dict(self):
+        return dict(page = self.page,
+                    loads = self.loads,
+                    ttfb = self.ttfb.to_dict(),
+                    dom_content_loaded = self.dom_content_loaded.to_dict(),
+                    load = self.load.to_dict(),
+                    transfer_size = self.transfer_size,
+                    slowest = [entry._asdict() for entry in self.slowest])
+
+
+class LoadRecorder(object):
+    '''
+    In-memory collection of page load timings (NavigationTiming), fed by
+    WebPage.open() when provided as the page LOAD_RECORDER. Along with wait
+    telemetry (see WaitRecorder), tells the time the application spends
+    loading pages apart from the time the automation spends waiting.
+
+    Example:
+        WebPage.LOAD_RECORDER = load_recorder
+
+        # ... run the tests ...
+
+        load_recorder.dump('load_telemetry.json')
+    '''
+
+    def __init__(self, buckets = BUCKETS, top = SLOWEST_RESOURCES):
+        self.buckets = buckets
+        self.top = top
+        self.stats = {}
+
+    def record(self, timing):
+        '''record the NavigationTiming of a single page load'''
+
+        try:
+            stats = self.stats[timing.page]
+        except KeyError:
+            stats = self.stats[timing.page] = LoadStats(timing.page,
+                                                        self.buckets,
+                                                        self.top)
+
+        stats.add(timing)
+
+    def reset(self):
+        self.stats.clear()
+
+    def to_dict(self):
+        '''all recorded stats, slowest (total load time) first'''
+        ordered = sorted(self.stats.values(),
+                         key = lambda stats: stats.load.total,
+                         reverse = True)
+
+        return dict(loads = [stats.to_dict() for stats in ordered])
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def dump(self, path):
+        '''write all recorded stats as json to path'''
+        with open(path, 'w') as f:
+            f.write(self.to_json(indent = 4))
+
+
+# default run-level load recorder, eg: WebPage.LOAD_RECORDER = load_recorder
+load_recorder = LoadRecorder()
+
+
+def describe_target(args, kwargs):
+    '''describe what a condition method was called on: its locator (in
+    locator tuple or locator kwarg form), or its first argument.'''
+
+    keys = utils.LOCATOR_MAPPING_SET & set(kwargs)
+
+    if kwargs.get('locator'):
+        target = kwargs['locator']
+    elif keys:
+        key = next(iter(keys))
+        target = (utils.LOCATOR_MAPPING[key], kwargs[key])
+    elif len(args) > 1:
+        target = args
+    elif args:
+        target = args[0]
+    else:
+        return None
+
+    if isinstance(target, (tuple, list, str, int, float)):
+        return str(target)
+
+    # eg, web elements: unique per instance, only keep their type
+    return '<%s>' % type(target).__name__
+
+
+def condition_name(wait, condition):
+    '''name condition method calls are recorded under: waits for conditions
+    to become false (WaitUntilNot) are prefixed with 'not:', so that their
+    latencies never mix with the ones of the same condition becoming true.
+    '''
+    return 'not:%s' % condition if wait.negate else condition
+
+
+class Measurement(object):
+    '''times a single wait and records it into the wait's recorder and
+    timing store'''
+
+    def __init__(self, wait, condition, args, kwargs):
+        self.wait = wait
+        self.condition = condition_name(wait, condition)
+        self.locator = describe_target(args, kwargs)
+        self.page = (type(wait.owner).__qualname__
+                     if wait.owner is not None else None)
+        self.polls = wait.counters.polls
+        self.start = time.monotonic()
+        self.learned = False
+
+    def apply_timings(self, kwargs):
+        '''use the learned timeout and poll interval of this wait, unless the
+        caller passed an explicit timeout'''
+
+        if self.wait.timings is None or kwargs.get('timeout') is not None:
+            return
+
+        suggestion = self.wait.timings.suggest(self.page, self.condition,
+                                               self.locator)
+        if suggestion is None:
+            return
+
+        kwargs['timeout'] = suggestion.timeout
+        self.learned = True
+
+        if 'poll_strategy' not in kwargs and 'poll_frequency' not in kwargs:
+            kwargs['poll_strategy'] = polling.FixedPolling(
+                                                    suggestion.poll_interval)
+
+    def done(self, exc = None):
+        if exc is None:
+            outcome = SATISFIED
+        elif isinstance(exc, TimeoutException):
+            outcome = TIMED_OUT
+        else:
+            outcome = FAILED
+
+        elapsed = time.monotonic() - self.start
+
+        if self.wait.recorder is not None:
+            self.wait.recorder.record(self.page, self.condition, self.locator,
+                                      elapsed,
+                                      self.wait.counters.polls - self.polls,
+                                      outcome)
+
+        if self.wait.timings is None:
+            return
+
+        if outcome == SATISFIED:
+            self.wait.timings.record(self.page, self.condition, self.locator,
+                                     elapsed)
+
+        elif outcome == TIMED_OUT and self.learned:
+            # the learned timeout was too short: feed it back
+            self.wait.timings.record_timeout(self.page, self.condition,
+                                             self.locator, elapsed)
+
+    async def wrap(self, awaitable):
+        try:
+            result = await awaitable
+        except BaseException as e:
+            self.done(e)
+            raise
+
+        self.done()
+        return result
+
+
+def recorded(method):
+    '''decorator recording telemetry for a WaitUntil condition method into
+    its recorder and timing store (see timings.TimingStore), when set.'''
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.recorder is None and self.timings is None:
+            return method(self, *args, **kwargs)
+
+        measurement = Measurement(self, method.__name__, args, kwargs)
+        measurement.apply_timings(kwargs)
+
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as e:
+            measurement.done(e)
+            raise
+
+        if inspect.isawaitable(result):
+            # asyncio waits: measure once awaited
+            return measurement.wrap(result)
+
+        measurement.done()
+        return result
+
+    return wrapper
@@ -0,0 +1,295 @@
+import time
+import asyncio
+import unittest
+from unittest.mock import patch, Mock
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (TimeoutException,
+                                        NoSuchElementException,
+                                        StaleElementReferenceException)
+
+
+class Test_AsyncWait(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global AsyncWait, AsyncWaitUntil, AsyncWaitUntilNot, polling, scripts
+
+        from genie.webdriver.aio import (AsyncWait, AsyncWaitUntil, 
+                                         AsyncWaitUntilNot)
+        from genie.webdriver import polling, scripts
+
+    def setUp(self):
+        self.driver = Mock()
+
+    def test_init(self):
+        strategy = polling.FixedPolling(1)
+        wait = AsyncWait(driver = self.driver, timeout = 10,
+                         in_browser = True, poll_strategy = strategy)
+
+        self.assertIsInstance(wait.until, AsyncWaitUntil)
+        self.assertIsInstance(wait.until_not, AsyncWaitUntilNot)
+        self.assertIs(wait.until.counters, wait.counters)
+        self.assertIs(wait.until_not.poll_strategy, strategy)
+        self.assertTrue(wait.until.in_browser)
+
+    async def test_call(self):
+        wait = AsyncWait(driver = self.driver, timeout = 10)
+        await wait(5)
+        self.driver.implicitly_wait.assert_called_with(5)
+
+        await wait()
+        self.driver.implicitly_wait.assert_called_with(10)
+
+        await wait()
+        self.assertEqual(self.driver.implicitly_wait.call_count, 2)
+
+    async def test_implicitly(self):
+        wait = AsyncWait(driver = self.driver, timeout = 10)
+        await wait()
+
+        async with wait.implicitly(0):
+            self.assertEqual(wait.implicit_timeout, 0)
+
+        self.assertEqual(wait.implicit_timeout, 10)
+
+        self.driver.title = 'abc'
+        self.assertTrue(await wait.until.title_is('abc'))
+        self.assertEqual([c.args for c in 
+                          self.driver.implicitly_wait.call_args_list],
+                         [(10,), (0,), (10,), (0,), (10,)])
+
+    async def test_until(self):
+        self.driver.title = 'abc'
+        wait = AsyncWait(driver = self.driver, timeout = 10)
+
+        self.assertTrue(await wait.until.title_is('abc'))
+        self.assertEqual(wait.counters.last, 1)
+
+        self.assertFalse(await wait.until_not.title_is('xyz'))
+        self.assertEqual(wait.counters.waits, 2)
+
+    async def test_located(self):
+        element = Mock(is_displayed = Mock(return_value = True))
+        self.driver.find_element.side_effect = [Mock(is_displayed = Mock(
+                                                    return_value = False)),
+                                                element]
+        wait = AsyncWait(driver = self.driver, timeout = 10,
+                         poll_strategy = polling.FixedPolling(0.01))
+
+        result = await wait.until.visibility_of_element_located(id = 'abc')
+        self.assertIs(result, element)
+        self.driver.find_element.assert_called_with(By.ID, 'abc')
+        self.assertEqual(wait.counters.last, 2)
+
+    async def test_ignored_exceptions(self):
+        element = Mock(is_displayed = Mock(return_value = True))
+        self.driver.find_element.side_effect = [
+                                        StaleElementReferenceException(), 
+                                        NoSuchElementException(), element]
+        wait = AsyncWait(driver = self.driver, timeout = 10,
+                         poll_strategy = polling.FixedPolling(0.01))
+
+        result = await wait.until.visibility_of_element_located(
+                        id = 'abc', 
+                        ignored_exceptions = StaleElementReferenceException)
+        self.assertIs(result, element)
+        self.assertEqual(wait.counters.last, 3)
+
+        self.driver.find_element.side_effect = NoSuchElementException()
+        self.assertTrue(await wait.until_not.visibility_of_element_located(
+                                                                id = 'abc'))
+
+        self.driver.find_element.side_effect = ValueError('boom')
+        with self.assertRaisesRegex(ValueError, 'boom'):
+            await wait.until.visibility_of_element_located(id = 'abc')
+        self.assertEqual(wait.counters.last, 1)
+
+    async def test_timeout(self):
+        self.driver.title = 'abc'
+        wait = AsyncWait(driver = self.driver, timeout = 0.05,
+                         poll_strategy = polling.FixedPolling(0.01))
+
+        with self.assertRaisesRegex(TimeoutException, 'boom'):
+            await wait.until.title_is('xyz', message = 'boom')
+
+        self.assertEqual(wait.counters.timeouts, 1)
+
+    async def test_in_browser(self):
+        self.driver.execute_script.return_value = dict(matched = [0], 
+                                                       values = ['elem'])
+        wait = AsyncWait(driver = self.driver, timeout = 10, 
+                         in_browser = True)
+
+        self.assertEqual(await wait.until.presence_of_element_located(
+                                                        css = '.abc'), 'elem')
+        self.driver.execute_script.assert_called_with(
+            scripts.EVALUATE, [['presence', By.CSS_SELECTOR, '.abc']], 'all',
+            False)
+        self.assertFalse(self.driver.execute_async_script.called)
+
+        await wait.until_not.visibility_of_element_located(css = '.abc')
+        self.driver.execute_script.assert_called_with(
+            scripts.EVALUATE, [['visibility', By.CSS_SELECTOR, '.abc']], 
+            'all', True)
+
+    async def test_any_of(self):
+        self.driver.execute_script.side_effect = [
+            None, dict(matched = [1], values = [None, 'elem'])]
+        wait = AsyncWait(driver = self.driver, timeout = 10,
+                         poll_strategy = polling.FixedPolling(0.01))
+
+        match = await wait.until.any_of(
+                    ('visibility_of_element_located', {'id': 'a'}),
+                    ('visibility_of_element_located', {'id': 'b'}))
+        self.assertEqual(match.fired, (1,))
+        self.assertEqual(match.elements, (None, 'elem'))
+
+    async def test_network_idle(self):
+        self.driver.execute_script.side_effect = [False, True]
+        wait = AsyncWait(driver = self.driver, timeout = 10,
+                         poll_strategy = polling.FixedPolling(0.01))
+
+        self.assertTrue(await wait.until.network_idle(quiet_ms = 200))
+        self.driver.execute_script.assert_called_with(scripts.IS_QUIET,
+                                                      'network', 200, 0, 
+                                                      False)
+        self.assertEqual(wait.counters.last, 2)
+        self.assertFalse(self.driver.execute_async_script.called)
+
+        self.driver.execute_script.side_effect = None
+        self.driver.execute_script.return_value = True
+        await wait.until_not.dom_stable()
+        self.driver.execute_script.assert_called_with(scripts.IS_QUIET,
+                                                      'dom', 500, 0, True)
+
+    async def test_count(self):
+        self.driver.execute_script.side_effect = [None, dict(count = 12,
+                                                             elements = [])]
+        wait = AsyncWait(driver = self.driver, timeout = 10,
+                         poll_strategy = polling.FixedPolling(0.01))
+
+        count = await wait.until.number_of_elements_at_least(10, css = 'tr')
+
+        self.assertEqual(count, 12)
+        self.driver.execute_script.assert_called_with(scripts.COUNT,
+                                                      By.CSS_SELECTOR, 'tr',
+                                                      'ge', 10, 0, False)
+        self.assertEqual(wait.counters.last, 2)
+
+    async def test_concurrent_sessions(self):
+        # each session satisfies its condition after ~0.2s worth of polls:
+        # waiting on both concurrently should not take twice as long
+        def session():
+            driver = Mock()
+            driver.title = 'loading'
+
+            def load():
+                time.sleep(0.01)
+                driver.title = 'ready'
+            asyncio.get_running_loop().call_later(0.2, load)
+            return driver
+
+        strategy = polling.FixedPolling(0.02)
+        waits = [AsyncWait(session(), 5, poll_strategy = strategy)
+                 for i in range(5)]
+
+        start = time.monotonic()
+        await asyncio.gather(*(w.until.title_is('ready') for w in waits))
+
+        self.assertLess(time.monotonic() - start, 0.6)
+
+
+class Test_AsyncInteractions(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global AsyncInteractions, AsyncWait
+
+        from genie.webdriver.aio import AsyncInteractions, AsyncWait
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.find_element().is_displayed.return_value = True
+        self.interact = AsyncInteractions(self.driver, 10)
+
+    def test_init(self):
+        self.assertIs(self.interact.driver, self.driver)
+        self.assertEqual(self.interact.timeout, 10)
+        self.assertIsInstance(self.interact.wait, AsyncWait)
+
+    async def test_jquery_click(self):
+        await self.interact.jquery_click('#abc')
+        self.driver.execute_script.assert_called_with("$('#abc').click()")
+
+    async def test_type_and_enter(self):
+        element = self.driver.find_element()
+        await self.interact.type_and_enter('abc', id = 'box')
+
+        self.driver.find_element.assert_called_with(By.ID, 'box')
+        element.send_keys.assert_called_with('abc', Keys.RETURN)
+
+    async def test_send_tab(self):
+        element = self.driver.find_element()
+        await self.interact.send_tab(name = 'box')
+        element.send_keys.assert_called_with(Keys.TAB)
+
+    async def test_select_from_drop_down(self):
+        from genie.webdriver import scripts
+
+        self.driver.execute_script.return_value = dict(changed = True,
+                                                       selected = ['abc'])
+
+        selected = await self.interact.select_from_drop_down('abc', 
+                                                             id = 'list')
+        self.assertEqual(selected, ['abc'])
+        self.driver.execute_script.assert_called_with(scripts.SELECT,
+                                                      [By.ID, 'list'],
+                                                      'text', ['abc'], True,
+                                                      [''])
+
+    async def test_drop_down_options(self):
+        from genie.webdriver import scripts
+
+        option = dict(index = 0, value = '1', text = 'abc', selected = True,
+                      disabled = False)
+        self.driver.execute_script.return_value = dict(multiple = False,
+                                                       options = [option])
+
+        options = await self.interact.drop_down_options(id = 'list')
+        self.assertEqual(options[0].text, 'abc')
+        self.driver.execute_script.assert_called_with(scripts.OPTIONS,
+                                                      [By.ID, 'list'])
+
+    async def test_iter_virtual_list(self):
+        from genie.webdriver import scripts
+
+        self.driver.execute_async_script.side_effect = [
+                dict(items = [['1', 'a'], ['2', 'b']], scrolled = False),
+                dict(items = [['2', 'b'], ['3', 'c']], scrolled = True),
+                dict(items = [['2', 'b'], ['3', 'c']], scrolled = False)]
+
+        batches = [batch async for batch in self.interact.iter_virtual_list(
+                                                (By.CSS_SELECTOR, 'tr'),
+                                                key = 'data-id', 
+                                                patience = 1)]
+
+        self.assertEqual([[item.text for item in batch] for batch in batches],
+                         [['a', 'b'], ['c']])
+        self.driver.execute_async_script.assert_called_with(
+                scripts.VIRTUAL_LIST, None, [By.CSS_SELECTOR, 'tr'], 
+                'data-id', True, 100)
+
+    async def test_drag_and_drop(self):
+        with patch('genie.webdriver.interact.ActionChains') as ac:
+            await self.interact.drag_and_drop((By.ID, 'a'), (By.ID, 'b'))
+
+            ac.assert_called_with(self.driver)
+            ac().drag_and_drop().perform.assert_called_with()
+
+    async def test_scroll_into_view(self):
+        await self.interact.scroll_into_view(id = 'a')
+        self.driver.execute_script.assert_called_with(
+                "arguments[0].scrollIntoView(true);", 
+                self.driver.find_element())
@@ -0,0 +1,107 @@
+import timeit
+import unittest
+
+
+class Driver(object):
+
+    def __init__(self):
+        self.session_id = 'abc'
+        self.count = 0
+
+    def find_element(self, by, value):
+        return (by, value)
+
+    @property
+    def title(self):
+        self.count += 1
+        return 'title %s' % self.count
+
+
+class Test_DriverDelegation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global DriverDelegation, is_method
+
+        from genie.webdriver.delegation import DriverDelegation, is_method
+
+    def setUp(self):
+        class Delegating(DriverDelegation):
+            def __init__(self, driver):
+                self.driver = driver
+
+        self.Delegating = Delegating
+        self.driver = Driver()
+        self.obj = Delegating(self.driver)
+
+    def test_is_method(self):
+        self.assertTrue(is_method(self.driver, 'find_element'))
+        self.assertFalse(is_method(self.driver, 'title'))
+        self.assertFalse(is_method(self.driver, 'session_id'))
+        self.assertFalse(is_method(self.driver, 'missing'))
+        self.assertTrue(is_method('abc', 'startswith'))
+
+        # instance attributes shadow methods
+        self.driver.find_element = lambda by, value: None
+        self.assertFalse(is_method(self.driver, 'find_element'))
+
+    def test_delegation(self):
+        self.assertIs(self.obj.driver, self.driver)
+        self.assertEqual(self.obj.find_element('id', 'a'), ('id', 'a'))
+        self.assertEqual(self.obj.session_id, 'abc')
+
+        # methods are kept, other attributes always forwarded
+        self.assertIn('find_element', vars(self.obj))
+        self.assertNotIn('session_id', vars(self.obj))
+        self.assertEqual(self.obj.title, 'title 1')
+        self.assertEqual(self.obj.title, 'title 2')
+
+        with self.assertRaises(AttributeError):
+            self.obj.missing
+
+    def test_replace_driver(self):
+        self.obj.find_element
+
+        driver = Driver()
+        self.obj.driver = driver
+
+        self.assertNotIn('find_element', vars(self.obj))
+        self.assertIs(self.obj.find_element.__self__, driver)
+
+    def test_no_driver(self):
+        obj = self.Delegating.__new__(self.Delegating)
+
+        self.assertIsNone(obj.driver)
+        with self.assertRaises(AttributeError):
+            obj.find_element
+
+    def test_dir(self):
+        listing = dir(self.obj)
+
+        self.assertIn('find_element', listing)
+        self.assertIn('driver', listing)
+        self.assertEqual(listing, sorted(set(listing)))
+
+    def test_benchmark(self):
+        # previous delegation: hasattr() then getattr() on every access
+        class Legacy(object):
+            def __init__(self, driver):
+                self.driver = driver
+
+            def __getattr__(self, attr):
+                if hasattr(self.driver, attr):
+                    return getattr(self.driver, attr)
+                else:
+                    raise AttributeError(attr)
+
+        legacy = Legacy(self.driver)
+        obj = self.obj
+
+        def best(stmt):
+            return min(timeit.repeat(stmt, number = 20000, repeat = 5))
+
+        before = best(lambda: legacy.find_element)
+        after = best(lambda: obj.find_element)
+
+        # kept methods are plain attribute lookups: several times faster
+        self.assertLess(after * 2, before)
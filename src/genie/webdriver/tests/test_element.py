@@ -1,5 +1,8 @@
+import gc
+import re
+import weakref
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, patch, call
 
 from selenium.webdriver.common.by import By
 
@@ -290,3 +293,1103 @@ class Test_Element(unittest.TestCase):
 
             with self.assertRaises(TypeError):
                 Dummy().selector = 1
+
+    def test_deadline(self):
+        from genie.webdriver.wait import Deadline
+        from selenium.common.exceptions import TimeoutException
+
+        class Dummy(Mock):
+            pe = PageElement(id = 'abc')
+            driver = self.driver
+
+        with Deadline(0):
+            with self.assertRaises(TimeoutException):
+                Dummy().pe
+
+        self.assertFalse(self.driver.find_element.called)
+
+        with Deadline(10):
+            Dummy().pe
+
+        self.driver.find_element.assert_called_with(By.ID, 'abc')
+
+
+class Test_ElementCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global PageElement, TextBox, Button, Checkbox, Selector, ElementCache
+        global StaleElementReferenceException
+
+        from genie.webdriver.element import (PageElement, TextBox, Button,
+                                             Checkbox, Selector, ElementCache)
+        from selenium.common.exceptions import \
+                                        StaleElementReferenceException
+
+    def setUp(self):
+        self.driver = Mock()
+
+    def test_cache(self):
+        cache = ElementCache()
+        descriptor = object()
+
+        self.assertIsNone(cache.get(descriptor))
+        cache.set(descriptor, 1)
+        cache.set(object(), 2)
+        self.assertEqual(cache.get(descriptor), 1)
+        self.assertEqual(len(cache), 2)
+
+        cache.invalidate(descriptor)
+        self.assertIsNone(cache.get(descriptor))
+        self.assertEqual(len(cache), 1)
+
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+    def test_repeated_access(self):
+        class Dummy(Mock):
+            pe = PageElement(id = 'abc')
+            bt = Button(id = 'efg')
+            tb = TextBox(id = 'hij')
+            wait = Mock()
+            driver = self.driver
+            element_cache = ElementCache()
+
+        page = Dummy()
+        self.assertIs(page.pe, page.pe)
+        self.assertEqual(self.driver.find_element.call_count, 1)
+
+        self.assertIs(page.bt, page.bt)
+        self.assertEqual(Dummy.wait.until.element_to_be_clickable.call_count,
+                         1)
+
+        page.tb = 'text'
+        page.tb
+        self.assertEqual(
+                Dummy.wait.until.visibility_of_element_located.call_count, 1)
+
+        # descriptors are cached separately
+        self.assertEqual(len(Dummy.element_cache), 3)
+
+    def test_not_cached(self):
+        class Dummy(Mock):
+            pe = PageElement(id = 'abc')
+            driver = self.driver
+
+        page = Dummy()
+        page.pe
+        page.pe
+        self.assertEqual(self.driver.find_element.call_count, 2)
+
+    def test_stale(self):
+        stale = Mock()
+        stale.is_selected.side_effect = StaleElementReferenceException()
+        fresh = Mock()
+        fresh.is_selected.return_value = True
+
+        class Dummy(Mock):
+            cb = Checkbox(id = 'abc')
+            wait = Mock()
+            element_cache = ElementCache()
+
+        Dummy.wait.until.element_to_be_clickable.return_value = fresh
+
+        page = Dummy()
+        Dummy.element_cache.set(Dummy.__dict__['cb'], stale)
+
+        self.assertTrue(page.cb)
+        self.assertIs(Dummy.element_cache.get(Dummy.__dict__['cb']), fresh)
+        self.assertEqual(Dummy.wait.until.element_to_be_clickable.call_count,
+                         1)
+
+    def test_cached_state(self):
+        from genie.webdriver import scripts
+        from genie.webdriver.wait import Wait
+        from genie.webdriver.polling import FixedPolling
+        from selenium.common.exceptions import TimeoutException
+
+        button = Mock()
+
+        class Dummy(Mock):
+            bt = Button(id = 'abc')
+            driver = self.driver
+            wait = Wait(self.driver, 0.1, poll_strategy = FixedPolling(0.01))
+            element_cache = ElementCache()
+
+        descriptor = Dummy.__dict__['bt']
+        Dummy.element_cache.set(descriptor, button)
+
+        # clickable: reused after a single script call
+        self.driver.execute_script.return_value = True
+        self.assertIs(Dummy().bt, button)
+        self.driver.execute_script.assert_called_once_with(
+                                    scripts.CHECK_ELEMENT, 'clickable', button)
+        self.assertFalse(self.driver.find_element.called)
+
+        # disabled since: waited for like uncached buttons
+        self.driver.execute_script.return_value = None
+        with self.assertRaisesRegex(TimeoutException, 'Element not ready'):
+            Dummy().bt
+
+    def test_cached_presence(self):
+        from genie.webdriver.wait import Wait
+        from genie.webdriver.polling import FixedPolling
+
+        class Dummy(Mock):
+            pe = PageElement(id = 'abc')
+            driver = self.driver
+            wait = Wait(self.driver, 0.1, poll_strategy = FixedPolling(0.01))
+            element_cache = ElementCache()
+
+        page = Dummy()
+        element = page.pe
+
+        # repeated accesses cost no browser call at all
+        self.assertIs(page.pe, element)
+        self.assertIs(page.pe, element)
+        self.assertEqual(self.driver.mock_calls, 
+                         [call.find_element(By.ID, 'abc')])
+
+    def test_cached_stale(self):
+        stale, fresh = Mock(), Mock()
+
+        class Dummy(Mock):
+            bt = Button(id = 'abc')
+            driver = self.driver
+            wait = Mock()
+            element_cache = ElementCache()
+
+        Dummy.wait.until.side_effect = lambda condition, **kwargs: \
+                                            condition(self.driver)
+        Dummy.wait.until.element_to_be_clickable.return_value = fresh
+        self.driver.execute_script.return_value = 'stale'
+
+        descriptor = Dummy.__dict__['bt']
+        Dummy.element_cache.set(descriptor, stale)
+
+        # found again instead of raising StaleElementReferenceException
+        self.assertIs(Dummy().bt, fresh)
+        self.assertIs(Dummy.element_cache.get(descriptor), fresh)
+
+    def test_stale_not_cached(self):
+        element = Mock()
+        element.is_selected.side_effect = StaleElementReferenceException()
+
+        class Dummy(Mock):
+            cb = Checkbox(id = 'abc')
+            wait = Mock()
+            element_cache = ElementCache()
+
+        Dummy.wait.until.element_to_be_clickable.return_value = element
+
+        # freshly found elements going stale are not retried
+        with self.assertRaises(StaleElementReferenceException):
+            Dummy().cb
+
+        self.assertEqual(Dummy.wait.until.element_to_be_clickable.call_count,
+                         1)
+
+
+class Test_PageElements(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global PageElements, ElementList, scripts
+
+        from genie.webdriver.element import PageElements, ElementList
+        from genie.webdriver import scripts
+
+    def setUp(self):
+        self.driver = Mock()
+        self.elements = [Mock(), Mock(), Mock()]
+        self.driver.find_elements.return_value = self.elements
+
+        class Dummy(Mock):
+            rows = PageElements(css = 'tr')
+            driver = self.driver
+
+        self.page = Dummy()
+
+    def test_lazy(self):
+        rows = self.page.rows
+
+        self.assertIsInstance(rows, ElementList)
+        self.assertEqual(rows.locator, (By.CSS_SELECTOR, 'tr'))
+        self.assertFalse(self.driver.find_elements.called)
+        self.assertFalse(self.driver.execute_script.called)
+
+        with self.assertRaises(NotImplementedError):
+            self.page.rows = 1
+
+    def test_len(self):
+        self.driver.execute_script.return_value = dict(count = 10000,
+                                                       elements = [])
+        rows = self.page.rows
+
+        self.assertEqual(len(rows), 10000)
+        self.driver.execute_script.assert_called_with(scripts.COUNT,
+                                                      By.CSS_SELECTOR, 'tr',
+                                                      'ge', 0, 0, False)
+        self.assertFalse(self.driver.find_elements.called)
+
+        # once located, counted locally
+        list(rows)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(self.driver.execute_script.call_count, 1)
+
+    def test_sequence(self):
+        rows = self.page.rows
+
+        self.assertIs(rows[0], self.elements[0])
+        self.assertEqual(rows[1:], self.elements[1:])
+        self.assertEqual(list(rows), self.elements)
+        self.assertIn(self.elements[2], rows)
+        self.driver.find_elements.assert_called_once_with(By.CSS_SELECTOR,
+                                                          'tr')
+
+        rows.refresh()
+        rows[0]
+        self.assertEqual(self.driver.find_elements.call_count, 2)
+
+    def test_bulk_reads(self):
+        rows = self.page.rows
+        self.driver.execute_script.return_value = ['a', 'b']
+
+        reads = ((rows.texts, (), ('text', None)),
+                 (rows.values, (), ('property', 'value')),
+                 (rows.hrefs, (), ('property', 'href')),
+                 (rows.attributes, ('class',), ('attribute', 'class')),
+                 (rows.properties, ('checked',), ('property', 'checked')))
+
+        for read, args, expected in reads:
+            self.assertEqual(read(*args), ['a', 'b'])
+            self.driver.execute_script.assert_called_with(scripts.READ_ALL,
+                                                          By.CSS_SELECTOR,
+                                                          'tr', *expected)
+
+        self.assertFalse(self.driver.find_elements.called)
+
+
+class Test_Snapshot(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global PageElement, Button, Snapshot, snapshot, ElementCache, scripts
+        global SNAPSHOT_FIELDS, StaleElementReferenceException
+
+        from genie.webdriver.element import (PageElement, Button, Snapshot,
+                                             snapshot, ElementCache,
+                                             SNAPSHOT_FIELDS)
+        from genie.webdriver import scripts
+        from selenium.common.exceptions import \
+                                        StaleElementReferenceException
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.execute_script.return_value = dict(displayed = True,
+                                                       enabled = False)
+
+    def test_record(self):
+        record = Snapshot(True, dict(text = 'abc', 
+                                     attributes = {'href': '/x'}))
+
+        self.assertTrue(record.present)
+        self.assertEqual(record.text, 'abc')
+        self.assertEqual(record.attributes, {'href': '/x'})
+        self.assertEqual(record.to_dict(), dict(present = True, text = 'abc',
+                                                attributes = {'href': '/x'}))
+        self.assertEqual(record, Snapshot(True, dict(text = 'abc',
+                                                     attributes = {'href':
+                                                                   '/x'})))
+        self.assertNotEqual(record, Snapshot(False, dict(text = 'abc')))
+        self.assertIn("text='abc'", repr(record))
+
+        # not requested
+        with self.assertRaises(AttributeError):
+            record.value
+
+        # immutable
+        with self.assertRaises(AttributeError):
+            record.text = 'efg'
+        with self.assertRaises(AttributeError):
+            record.other = 1
+        with self.assertRaises(AttributeError):
+            del record.text
+
+    def test_snapshot(self):
+        record = snapshot(self.driver, [By.ID, 'abc'],
+                          fields = ('displayed', 'enabled'))
+
+        self.driver.execute_script.assert_called_once_with(
+                scripts.SNAPSHOT, [By.ID, 'abc'], ['displayed', 'enabled'],
+                [])
+        self.assertTrue(record.present)
+        self.assertTrue(record.displayed)
+        self.assertFalse(record.enabled)
+
+        snapshot(self.driver, 'element', attributes = ('href',))
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, 'element', list(SNAPSHOT_FIELDS), ['href'])
+
+        with self.assertRaises(ValueError):
+            snapshot(self.driver, [By.ID, 'abc'], fields = ('colour',))
+
+    def test_missing(self):
+        self.driver.execute_script.return_value = None
+
+        record = snapshot(self.driver, [By.ID, 'abc'], fields = ('text',),
+                          attributes = ('href',))
+
+        self.assertFalse(record.present)
+        self.assertIsNone(record.text)
+        self.assertEqual(record.attributes, {'href': None})
+
+    def test_descriptor(self):
+        class Dummy(Mock):
+            bt = Button(id = 'abc')
+            driver = self.driver
+            wait = Mock()
+
+        self.assertIsInstance(Dummy.bt, Button)
+
+        record = Dummy.bt.snapshot(Dummy(), fields = ('enabled',))
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, [By.ID, 'abc'], ['enabled'], [])
+        self.assertFalse(Dummy.wait.until.element_to_be_clickable.called)
+        self.assertFalse(record.enabled)
+
+    def test_descriptor_cached(self):
+        element = Mock()
+
+        class Dummy(Mock):
+            pe = PageElement(id = 'abc')
+            driver = self.driver
+            element_cache = ElementCache()
+
+        Dummy.element_cache.set(Dummy.pe, element)
+        Dummy.pe.snapshot(Dummy())
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, element, list(SNAPSHOT_FIELDS), [])
+
+        self.driver.execute_script.side_effect = [
+                            StaleElementReferenceException(), None]
+        Dummy.pe.snapshot(Dummy())
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, [By.ID, 'abc'], list(SNAPSHOT_FIELDS), [])
+        self.assertEqual(len(Dummy.element_cache), 0)
+
+
+class Test_Form(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Form, BoundForm, TextBox, Checkbox, RadioButton, Selector
+        global Button, Wait, FixedPolling, scripts, TimeoutException
+
+        from genie.webdriver.polling import FixedPolling
+        from genie.webdriver.element import (Form, BoundForm, TextBox, 
+                                             Checkbox, RadioButton, Selector,
+                                             Button)
+        from genie.webdriver.wait import Wait
+        from genie.webdriver import scripts
+        from selenium.common.exceptions import TimeoutException
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.execute_script.return_value = dict(values = dict(
+                                                            hostname = 'R1'))
+        driver = self.driver
+
+        class Dummy(object):
+            hostname = TextBox(id = 'hostname')
+            admin = RadioButton(value = 'admin')
+
+            device = Form('hostname', 'admin',
+                          enabled = Checkbox(id = 'enabled'),
+                          platform = Selector(css = '#platform'))
+
+            def __init__(self):
+                self.driver = driver
+                self.wait = Wait(driver, 0.2, 
+                                 poll_strategy = FixedPolling(0.01))
+
+        self.Dummy = Dummy
+        self.page = Dummy()
+        self.specs = [
+            ['hostname', 'value', By.ID, 'hostname'],
+            ['admin', 'radio', By.XPATH, 
+             ".//input[@type='radio' and @value='admin']"],
+            ['enabled', 'checkbox', By.ID, 'enabled'],
+            ['platform', 'select', By.CSS_SELECTOR, '#platform']]
+
+    def test_fields(self):
+        self.assertIsInstance(self.Dummy.device, Form)
+        self.assertEqual(self.Dummy.device.specs(), self.specs)
+
+        form = self.page.device
+        self.assertIsInstance(form, BoundForm)
+        self.assertEqual(form.fields, ['hostname', 'admin', 'enabled', 
+                                       'platform'])
+
+        with self.assertRaises(TypeError):
+            Form(login = Button(id = 'login'))
+
+        with self.assertRaises(TypeError):
+            Form(hostname = 'hostname')
+
+    def test_values(self):
+        self.assertEqual(self.page.device.values, dict(hostname = 'R1'))
+        self.driver.execute_script.assert_called_once_with(scripts.FORM,
+                                                           self.specs, None)
+
+    def test_fill(self):
+        self.page.device = dict(hostname = 1, admin = 1, enabled = 0,
+                                platform = 'IOS-XE')
+
+        self.driver.execute_script.assert_called_once_with(
+                scripts.FORM, self.specs, dict(hostname = '1', admin = True,
+                                               enabled = False,
+                                               platform = 'IOS-XE'))
+
+        result = self.page.device.fill(platform = ('A', 'B'))
+        self.assertEqual(result, dict(hostname = 'R1'))
+        self.driver.execute_script.assert_called_with(
+                scripts.FORM, self.specs, dict(platform = ['A', 'B']))
+
+        with self.assertRaises(ValueError):
+            self.page.device = dict(unknown = 1)
+
+    def test_missing(self):
+        self.driver.execute_script.side_effect = [
+                    dict(missing = ['enabled']),
+                    dict(values = dict(enabled = True))]
+
+        self.assertEqual(self.page.device.fill(enabled = True),
+                         dict(enabled = True))
+        self.assertEqual(self.driver.execute_script.call_count, 2)
+
+        self.driver.execute_script.side_effect = None
+        self.driver.execute_script.return_value = dict(
+                                        missing = ['platform: JUNOS'])
+
+        with self.assertRaisesRegex(TimeoutException, 'platform: JUNOS'):
+            self.page.device.fill(platform = 'JUNOS')
+
+    def test_pending(self):
+        # fields to fill not displayed/enabled yet: waited for
+        self.driver.execute_script.side_effect = [
+                    dict(pending = ['hostname']),
+                    dict(values = dict(hostname = 'R1'))]
+
+        self.assertEqual(self.page.device.fill(hostname = 'R1'),
+                         dict(hostname = 'R1'))
+        self.assertEqual(self.driver.execute_script.call_count, 2)
+
+        self.driver.execute_script.side_effect = None
+        self.driver.execute_script.return_value = dict(pending = ['enabled'])
+
+        with self.assertRaisesRegex(TimeoutException, 
+                                    'Form fields not ready: enabled'):
+            self.page.device.fill(enabled = True)
+
+
+class Test_Table(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Table, BoundTable, Wait, FixedPolling, scripts
+        global TimeoutException
+
+        from genie.webdriver.element import Table, BoundTable
+        from genie.webdriver.wait import Wait
+        from genie.webdriver.polling import FixedPolling
+        from genie.webdriver import scripts
+        from selenium.common.exceptions import TimeoutException
+
+    def setUp(self):
+        self.driver = Mock()
+        self.body = [['ge0', 'up'], ['ge1', 'down'], ['ge2', 'up'],
+                     ['ge3', 'down'], ['ge4']]
+        self.driver.execute_script.side_effect = self.execute_script
+        driver = self.driver
+
+        class Dummy(object):
+            table = Table(id = 'interfaces', chunk_size = 2)
+
+            def __init__(self):
+                self.driver = driver
+                self.wait = Wait(driver, 0.05, 
+                                 poll_strategy = FixedPolling(0.01))
+
+        self.Dummy = Dummy
+        self.page = Dummy()
+
+    def execute_script(self, script, by, value, start, stop, layout):
+        '''fake scripts.TABLE'''
+        rows = self.body[start:stop]
+        result = dict(headers = ['If', 'State'], total = len(self.body))
+
+        if layout == 'rows':
+            result['rows'] = rows
+        else:
+            result['columns'] = [[row[0] for row in rows],
+                                 [row[1] if len(row) > 1 else None
+                                  for row in rows]]
+        return result
+
+    def test_descriptor(self):
+        self.assertIsInstance(self.Dummy.table, Table)
+        self.assertIsInstance(self.page.table, BoundTable)
+        self.assertFalse(self.driver.execute_script.called)
+
+        with self.assertRaises(NotImplementedError):
+            self.page.table = 1
+
+    def test_rows(self):
+        table = self.page.table
+
+        self.assertEqual(table.rows(), [tuple(row) for row in self.body])
+        self.driver.execute_script.assert_called_once_with(
+                scripts.TABLE, By.ID, 'interfaces', 0, None, 'rows')
+
+        self.assertEqual(table.rows(1, 2), [('ge1', 'down')])
+        self.assertEqual(table.headers, ['If', 'State'])
+        self.assertEqual(table.header_index, {'If': 0, 'State': 1})
+        self.assertEqual(len(table), 5)
+
+        self.assertEqual(table.records(0, 1), [dict(If = 'ge0', 
+                                                    State = 'up')])
+
+    def test_columns(self):
+        columns = self.page.table.columns()
+
+        self.assertEqual(columns, {'If': ['ge0', 'ge1', 'ge2', 'ge3', 'ge4'],
+                                   'State': ['up', 'down', 'up', 'down', 
+                                             None]})
+        self.driver.execute_script.assert_called_once_with(
+                scripts.TABLE, By.ID, 'interfaces', 0, None, 'columns')
+
+    def test_no_headers(self):
+        self.driver.execute_script.side_effect = None
+        self.driver.execute_script.return_value = dict(headers = None,
+                                                       total = 1,
+                                                       rows = [['a', 'b']],
+                                                       columns = [['a'],
+                                                                  ['b']])
+        table = self.page.table
+
+        self.assertIsNone(table.headers)
+        self.assertEqual(table.header_index, {})
+        self.assertEqual(table.records(), [{0: 'a', 1: 'b'}])
+        self.assertEqual(table.columns(), {0: ['a'], 1: ['b']})
+
+    def test_iter_rows(self):
+        rows = self.page.table.iter_rows()
+
+        self.assertFalse(self.driver.execute_script.called)
+        self.assertEqual(list(rows), [tuple(row) for row in self.body])
+
+        calls = [call.args[3:5] 
+                 for call in self.driver.execute_script.call_args_list]
+        self.assertEqual(calls, [(0, 2), (2, 4), (4, 6)])
+
+        self.driver.execute_script.reset_mock()
+        self.assertEqual(len(list(self.page.table.iter_rows(10))), 5)
+        self.assertEqual(self.driver.execute_script.call_count, 1)
+
+        self.body = []
+        self.assertEqual(list(self.page.table), [])
+
+    def test_not_found(self):
+        self.driver.execute_script.side_effect = None
+        self.driver.execute_script.return_value = None
+
+        with self.assertRaisesRegex(TimeoutException, 'Table not found'):
+            self.page.table.rows()
+
+
+class Test_TextBoxInputMode(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global TextBox, scripts, INPUT_AUTO_LENGTH
+
+        from genie.webdriver.element import TextBox, INPUT_AUTO_LENGTH
+        from genie.webdriver import scripts
+
+    def setUp(self):
+        self.driver = Mock()
+
+    def make_page(self, **kwargs):
+        class Dummy(Mock):
+            tb = TextBox(id = 'abc', **kwargs)
+            wait = Mock()
+            driver = self.driver
+
+        return Dummy
+
+    def test_keys(self):
+        Dummy = self.make_page()
+        Dummy().tb = 'x' * 1000
+
+        element = Dummy.wait.until.visibility_of_element_located()
+        element.clear.assert_called_with()
+        element.send_keys.assert_called_with('x' * 1000)
+        self.assertFalse(self.driver.execute_script.called)
+
+    def test_js(self):
+        Dummy = self.make_page(input_mode = 'js')
+        Dummy().tb = 12
+
+        element = Dummy.wait.until.visibility_of_element_located()
+        self.driver.execute_script.assert_called_with(scripts.SET_VALUE,
+                                                      element, '12')
+        self.assertFalse(element.send_keys.called)
+        self.assertFalse(element.clear.called)
+
+    def test_auto(self):
+        Dummy = self.make_page(input_mode = 'auto')
+        element = Dummy.wait.until.visibility_of_element_located()
+
+        Dummy().tb = 'x' * INPUT_AUTO_LENGTH
+        element.send_keys.assert_called_with('x' * INPUT_AUTO_LENGTH)
+        self.assertFalse(self.driver.execute_script.called)
+
+        Dummy().tb = 'x' * (INPUT_AUTO_LENGTH + 1)
+        self.driver.execute_script.assert_called_with(
+                        scripts.SET_VALUE, element, 
+                        'x' * (INPUT_AUTO_LENGTH + 1))
+
+    def test_page_mode(self):
+        Dummy = self.make_page()
+        Dummy.INPUT_MODE = 'js'
+        Dummy().tb = 'abc'
+        self.assertTrue(self.driver.execute_script.called)
+
+        # descriptor mode wins
+        self.driver.reset_mock()
+        Dummy = self.make_page(input_mode = 'keys')
+        Dummy.INPUT_MODE = 'js'
+        Dummy().tb = 'abc'
+        self.assertFalse(self.driver.execute_script.called)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            TextBox(id = 'abc', input_mode = 'paste')
+
+
+class Test_Ensure(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global TextBox, Checkbox, RadioButton, Selector, Button, ElementCache
+        global Wait, FixedPolling, scripts, TimeoutException
+        global StaleElementReferenceException
+
+        from genie.webdriver.polling import FixedPolling
+        from genie.webdriver.element import (TextBox, Checkbox, RadioButton,
+                                             Selector, Button, ElementCache)
+        from genie.webdriver.wait import Wait
+        from genie.webdriver import scripts
+        from selenium.common.exceptions import (
+                                        TimeoutException,
+                                        StaleElementReferenceException)
+
+    def setUp(self):
+        self.driver = Mock()
+        driver = self.driver
+
+        class Dummy(object):
+            hostname = TextBox(id = 'hostname')
+            admin = RadioButton(value = 'admin')
+            enabled = Checkbox(id = 'enabled')
+            platform = Selector(id = 'platform')
+            login = Button(id = 'login')
+
+            def __init__(self):
+                self.driver = driver
+                self.wait = Wait(driver, 0.2, 
+                                 poll_strategy = FixedPolling(0.01))
+
+        self.Dummy = Dummy
+        self.page = Dummy()
+
+    def test_ensure(self):
+        self.driver.execute_script.return_value = dict(changed = True,
+                                                       value = True)
+
+        self.assertTrue(self.Dummy.enabled.ensure(self.page, 1))
+        self.driver.execute_script.assert_called_once_with(
+                scripts.ENSURE, [By.ID, 'enabled'], 'checkbox', True)
+
+        self.driver.execute_script.return_value = dict(changed = False,
+                                                       value = 'R1')
+        self.assertFalse(self.Dummy.hostname.ensure(self.page, 'R1'))
+        self.driver.execute_script.assert_called_with(
+                scripts.ENSURE, [By.ID, 'hostname'], 'value', 'R1')
+
+        self.Dummy.admin.ensure(self.page, True)
+        self.driver.execute_script.assert_called_with(
+                scripts.ENSURE, 
+                [By.XPATH, ".//input[@type='radio' and @value='admin']"], 
+                'radio', True)
+
+        self.Dummy.platform.ensure(self.page, ('IOS', 'NXOS'))
+        self.driver.execute_script.assert_called_with(
+                scripts.ENSURE, [By.ID, 'platform'], 'select', 
+                ['IOS', 'NXOS'])
+
+    def test_waits(self):
+        self.driver.execute_script.side_effect = [None, 
+                                                  dict(missing = ['IOS']),
+                                                  dict(changed = True,
+                                                       value = 'IOS')]
+
+        self.assertTrue(self.Dummy.platform.ensure(self.page, 'IOS'))
+        self.assertEqual(self.driver.execute_script.call_count, 3)
+
+    def test_timeout(self):
+        self.driver.execute_script.return_value = dict(missing = ['JUNOS'])
+
+        with self.assertRaisesRegex(TimeoutException, 'JUNOS'):
+            self.Dummy.platform.ensure(self.page, 'JUNOS')
+
+        self.driver.execute_script.return_value = None
+
+        with self.assertRaisesRegex(TimeoutException, 'enabled'):
+            self.Dummy.enabled.ensure(self.page, True)
+
+    def test_cached(self):
+        self.page.element_cache = ElementCache()
+        element = Mock()
+        self.page.element_cache.set(self.Dummy.enabled, element)
+
+        self.driver.execute_script.side_effect = [
+                    StaleElementReferenceException(),
+                    dict(changed = False, value = True)]
+
+        self.assertFalse(self.Dummy.enabled.ensure(self.page, True))
+        self.assertEqual(self.driver.execute_script.call_args_list[0][0][1],
+                         element)
+        self.assertEqual(self.driver.execute_script.call_args_list[1][0][1],
+                         [By.ID, 'enabled'])
+        self.assertEqual(len(self.page.element_cache), 0)
+
+    def test_not_fillable(self):
+        with self.assertRaises(TypeError):
+            self.Dummy.login.ensure(self.page, True)
+
+
+class Test_SelectorOptions(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Selector, SelectCondition, SelectOption, ElementCache
+        global Wait, FixedPolling, scripts, TimeoutException
+        global NoSuchElementException
+
+        from genie.webdriver.polling import FixedPolling
+        from genie.webdriver.element import (Selector, SelectCondition,
+                                             SelectOption, ElementCache)
+        from genie.webdriver.wait import Wait
+        from genie.webdriver import scripts
+        from selenium.common.exceptions import (TimeoutException,
+                                                NoSuchElementException)
+
+    def setUp(self):
+        self.driver = Mock()
+        driver = self.driver
+
+        class Dummy(object):
+            vlan = Selector(id = 'vlan')
+
+            def __init__(self):
+                self.driver = driver
+                self.wait = Wait(driver, 0.2, 
+                                 poll_strategy = FixedPolling(0.01))
+
+        self.Dummy = Dummy
+        self.page = Dummy()
+
+    def test_options(self):
+        self.driver.execute_script.side_effect = [
+            None,
+            dict(multiple = False,
+                 options = [dict(index = 0, value = '1', text = 'VLAN 1',
+                                 selected = True, disabled = False),
+                            dict(index = 1, value = '10', text = 'VLAN 10',
+                                 selected = False, disabled = True)])]
+
+        options = self.Dummy.vlan.options(self.page)
+
+        self.assertEqual(options, [SelectOption(0, '1', 'VLAN 1', True, False),
+                                   SelectOption(1, '10', 'VLAN 10', False,
+                                                True)])
+        self.driver.execute_script.assert_called_with(scripts.OPTIONS,
+                                                      [By.ID, 'vlan'])
+
+    def test_select(self):
+        self.driver.execute_script.return_value = dict(changed = True,
+                                                       selected = ['VLAN 10'])
+
+        self.assertEqual(self.Dummy.vlan.select(self.page, 10, 
+                                                match = 'value'),
+                         ['VLAN 10'])
+        self.driver.execute_script.assert_called_with(scripts.SELECT,
+                                                      [By.ID, 'vlan'],
+                                                      'value', ['10'], True,
+                                                      [''])
+
+        self.Dummy.vlan.select(self.page, [re.compile(r'^VLAN \d+$')],
+                               match = 'regex', deselect_others = False)
+        self.driver.execute_script.assert_called_with(scripts.SELECT,
+                                                      [By.ID, 'vlan'],
+                                                      'regex', 
+                                                      [r'^VLAN \d+$'], False,
+                                                      [''])
+
+    def test_select_cached(self):
+        self.page.element_cache = ElementCache()
+        element = Mock()
+        self.page.element_cache.set(self.Dummy.vlan, element)
+        self.driver.execute_script.return_value = dict(changed = False,
+                                                       selected = ['VLAN 1'])
+
+        self.Dummy.vlan.select(self.page, 'VLAN 1')
+        self.driver.execute_script.assert_called_with(scripts.SELECT,
+                                                      element, 'text', 
+                                                      ['VLAN 1'], True, 
+                                                      [''])
+
+    def test_select_timeout(self):
+        self.driver.execute_script.return_value = dict(missing = ['VLAN 99'])
+
+        with self.assertRaisesRegex(NoSuchElementException, 
+                                    'Options not found: VLAN 99'):
+            self.Dummy.vlan.select(self.page, 'VLAN 99')
+        self.assertEqual(self.driver.execute_script.call_count, 1)
+
+        self.driver.execute_script.return_value = None
+
+        with self.assertRaisesRegex(TimeoutException, 'Select not found'):
+            self.Dummy.vlan.select(self.page, 'VLAN 99')
+
+    def test_condition(self):
+        with self.assertRaises(ValueError):
+            SelectCondition([By.ID, 'vlan'], 'a', match = 'index')
+
+        condition = SelectCondition([By.ID, 'vlan'], 'a')
+        self.assertEqual(condition.patterns, ['a'])
+        self.assertEqual(condition.flags, [''])
+
+    def test_condition_flags(self):
+        condition = SelectCondition([By.ID, 'vlan'], 
+                                    [re.compile('^vlan', re.I | re.S), 
+                                     re.compile('^VLAN'), 'VLAN 1'],
+                                    match = 'regex')
+        self.assertEqual(condition.patterns, ['^vlan', '^VLAN', 'VLAN 1'])
+        self.assertEqual(condition.flags, ['is', '', ''])
+
+        with self.assertRaisesRegex(ValueError, 'Unsupported flags'):
+            SelectCondition([By.ID, 'vlan'], re.compile('^vlan', re.X),
+                            match = 'regex')
+
+
+class Test_Component(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Component, ScopedDriver, TextBox, Button, PageElements
+        global Form, Checkbox, ElementCache, Wait, FixedPolling, scripts
+        global StaleElementReferenceException, NoSuchElementException, CHAIN
+
+        from genie.webdriver.element import (Component, ScopedDriver, TextBox,
+                                             Button, PageElements, Form,
+                                             Checkbox, ElementCache)
+        from genie.webdriver.wait import Wait
+        from genie.webdriver.polling import FixedPolling
+        from genie.webdriver.utils import CHAIN
+        from genie.webdriver import scripts
+        from selenium.common.exceptions import (
+                                        StaleElementReferenceException,
+                                        NoSuchElementException)
+
+    def setUp(self):
+        self.driver = Mock()
+        driver = self.driver
+
+        class Widget(Component):
+            ok = Button(id = 'ok')
+
+        class NavBar(Component):
+            search = TextBox(name = 'q')
+            rows = PageElements(css = 'li')
+            widget = Widget(css = 'my-widget', shadow = True)
+            settings = Form(enabled = Checkbox(id = 'enabled'))
+
+        class Dummy(object):
+            INPUT_MODE = 'js'
+            timeout = 5
+            navbar = NavBar(id = 'nav')
+
+            def __init__(self):
+                self.driver = driver
+                self.element_cache = None
+                self.wait = Wait(driver, 0.2, 
+                                 poll_strategy = FixedPolling(0.01))
+
+        self.Dummy = Dummy
+        self.NavBar = NavBar
+        self.page = Dummy()
+
+    def test_bind(self):
+        navbar = self.page.navbar
+
+        self.assertIsInstance(navbar, self.NavBar)
+        self.assertIs(self.page.navbar, navbar)
+        self.assertIs(self.Dummy.navbar.parent, None)
+        self.assertIs(navbar.parent, self.page)
+        self.assertIs(navbar.page, self.page)
+        self.assertIsInstance(navbar.driver, ScopedDriver)
+        self.assertIsInstance(navbar.wait, Wait)
+        self.assertEqual(navbar.wait.timeout, 0.2)
+
+        # other attributes come from the page
+        self.assertEqual(navbar.timeout, 5)
+        self.assertEqual(navbar.INPUT_MODE, 'js')
+        self.assertIs(navbar.driver.title, self.driver.title)
+
+        widget = navbar.widget
+        self.assertIs(widget.parent, navbar)
+        self.assertIs(widget.page, self.page)
+        self.assertEqual(widget.scopes(), [navbar, widget])
+
+        with self.assertRaises(AttributeError):
+            self.Dummy.navbar.missing
+
+        with self.assertRaises(NotImplementedError):
+            self.page.navbar = 1
+
+    def test_bind_released(self):
+        # bound components do not keep their page alive
+        self.page.navbar.widget.wait
+        page = weakref.ref(self.page)
+
+        del self.page
+        gc.collect()
+
+        self.assertIsNone(page())
+
+    def test_find(self):
+        root, element = Mock(), Mock()
+        self.driver.execute_script.return_value = dict(path = [root],
+                                                       found = [element])
+
+        self.assertIs(self.page.navbar.driver.find_element(By.NAME, 'q'),
+                      element)
+        self.driver.execute_script.assert_called_with(
+                scripts.RESOLVE, 
+                [None, False, [[By.ID, 'nav', False], [By.NAME, 'q', False]]])
+        self.assertIs(self.page.navbar.root, root)
+
+        # root is cached from now on
+        self.page.navbar.driver.find_elements(By.NAME, 'q')
+        self.driver.execute_script.assert_called_with(
+                scripts.RESOLVE, [root, False, [[By.NAME, 'q', False]]])
+
+        self.driver.execute_script.return_value = None
+        self.assertEqual(self.page.navbar.driver.find_elements(By.NAME, 'q'),
+                         [])
+        with self.assertRaises(NoSuchElementException):
+            self.page.navbar.driver.find_element(By.NAME, 'q')
+
+    def test_nested(self):
+        navbar_root, widget_root, ok = Mock(), Mock(), Mock()
+        ok.is_displayed.return_value = True
+        ok.is_enabled.return_value = True
+        self.driver.execute_script.return_value = dict(
+                                                path = [navbar_root, 
+                                                        widget_root],
+                                                found = [ok])
+
+        self.assertIs(self.page.navbar.widget.ok, ok)
+        self.assertEqual(self.driver.execute_script.call_count, 1)
+        self.driver.execute_script.assert_called_with(
+                scripts.RESOLVE, 
+                [None, False, [[By.ID, 'nav', False], 
+                               [By.CSS_SELECTOR, 'my-widget', True],
+                               [By.ID, 'ok', False]]])
+        self.assertIs(self.page.navbar.root, navbar_root)
+        self.assertIs(self.page.navbar.widget.root, widget_root)
+
+        # starts from the innermost cached root, in its shadow root
+        self.driver.execute_script.return_value = dict(path = [], 
+                                                       found = [ok])
+        self.page.navbar.widget.ok
+        self.driver.execute_script.assert_called_with(
+                scripts.RESOLVE, [widget_root, True, [[By.ID, 'ok', False]]])
+
+    def test_stale(self):
+        stale, fresh, element = Mock(), Mock(), Mock()
+        self.page.navbar.root = stale
+
+        self.driver.execute_script.side_effect = [
+                    StaleElementReferenceException(),
+                    dict(path = [fresh], found = [element])]
+
+        self.assertEqual(self.page.navbar.driver.find_elements(By.NAME, 'q'),
+                         [element])
+        self.assertIs(self.page.navbar.root, fresh)
+        self.driver.execute_script.assert_called_with(
+                scripts.RESOLVE, 
+                [None, False, [[By.ID, 'nav', False], [By.NAME, 'q', False]]])
+
+    def test_children(self):
+        element = Mock()
+        element.is_displayed.return_value = True
+        self.driver.execute_script.return_value = dict(path = [Mock()],
+                                                       found = [element])
+
+        # page INPUT_MODE applies to children
+        self.page.navbar.search = 'R1'
+        self.driver.execute_script.assert_called_with(scripts.SET_VALUE,
+                                                      element, 'R1')
+
+    def test_scripts(self):
+        chain = [None, False, [[By.ID, 'nav', False], 
+                               [By.CSS_SELECTOR, 'li', False]]]
+        self.page.navbar.root = Mock()
+
+        # scripts taking locators resolve the whole chain, never stale
+        self.assertEqual(self.page.navbar.scoped((By.CSS_SELECTOR, 'li')),
+                         [CHAIN, chain])
+
+        rows = self.page.navbar.rows
+        self.assertEqual(rows.locator, (CHAIN, chain))
+
+        self.driver.execute_script.return_value = dict(count = 3)
+        self.assertEqual(len(rows), 3)
+        self.driver.execute_script.assert_called_with(scripts.COUNT, CHAIN,
+                                                      chain, 'ge', 0, 0, 
+                                                      False)
+
+        self.driver.execute_script.return_value = dict(path = [Mock()],
+                                                       found = [1, 2])
+        self.assertEqual(rows.elements, [1, 2])
+        self.driver.execute_script.assert_called_with(scripts.RESOLVE, chain)
+
+        self.assertEqual(
+            self.NavBar.settings.specs(self.page.navbar),
+            [['enabled', 'checkbox', CHAIN, 
+              [None, False, [[By.ID, 'nav', False], 
+                             [By.ID, 'enabled', False]]]]])
+
+    def test_element_cache(self):
+        self.page.element_cache = ElementCache()
+
+        cache = self.page.navbar.element_cache
+        self.assertIsInstance(cache, ElementCache)
+        self.assertIs(self.page.navbar.element_cache, cache)
+
+        self.page.element_cache.invalidate()
+        self.assertIsNot(self.page.navbar.element_cache, cache)
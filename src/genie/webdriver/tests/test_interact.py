@@ -111,15 +111,67 @@ class Test_Interact(unittest.TestCase):
                 ac().move_to_element().perform.assert_called_with()
 
     def test_select_from_drop_down(self):
-        with patch('genie.webdriver.wait.Wait') as wait:
-            wait().until.visibility_of_element_located.return_value = (By.ID, 
-                                                                 'tomhanks')
-            with patch('genie.webdriver.interact.Select') as sel:
-                interact = Interactions(driver = self.driver, timeout = 10)
-                interact.select_from_drop_down('abc', id='tomhanks')
+        from genie.webdriver import scripts
+
+        self.driver.execute_script.return_value = dict(changed = True,
+                                                       selected = ['abc'])
+
+        interact = Interactions(driver = self.driver, timeout = 10)
+        selected = interact.select_from_drop_down('abc', id='tomhanks')
+
+        self.assertEqual(selected, ['abc'])
+        self.driver.execute_script.assert_called_with(scripts.SELECT,
+                                                      [By.ID, 'tomhanks'],
+                                                      'text', ['abc'], True,
+                                                      [''])
+
+        interact.select_from_drop_down(['^a', '^b'], id='tomhanks', 
+                                       match = 'regex', 
+                                       deselect_others = False)
+        self.driver.execute_script.assert_called_with(scripts.SELECT,
+                                                      [By.ID, 'tomhanks'],
+                                                      'regex', ['^a', '^b'],
+                                                      False, ['', ''])
+
+    def test_select_from_drop_down_missing(self):
+        from genie.webdriver.wait import Wait
+        from genie.webdriver.polling import FixedPolling
+        from selenium.common.exceptions import (TimeoutException,
+                                                NoSuchElementException)
+
+        self.driver.execute_script.return_value = dict(missing = ['abc'])
+
+        interact = Interactions(driver = self.driver, timeout = 10)
+
+        # the select is displayed: missing options fail at once
+        with self.assertRaisesRegex(NoSuchElementException, 
+                                    'Options not found: abc'):
+            interact.select_from_drop_down('abc', id='tomhanks')
+        self.assertEqual(self.driver.execute_script.call_count, 1)
+
+        self.driver.execute_script.return_value = None
+
+        interact.wait = Wait(self.driver, 0.1, 
+                             poll_strategy = FixedPolling(0.01))
+
+        with self.assertRaisesRegex(TimeoutException, 'Select not found'):
+            interact.select_from_drop_down('abc', id='tomhanks')
 
-                sel.assert_called_with((By.ID, 'tomhanks'))
-                sel().select_by_visible_text.assert_called_with('abc')
+    def test_drop_down_options(self):
+        from genie.webdriver import scripts
+
+        option = dict(index = 0, value = '1', text = 'abc', selected = True,
+                      disabled = False)
+        self.driver.execute_script.return_value = dict(multiple = False,
+                                                       options = [option])
+
+        interact = Interactions(driver = self.driver, timeout = 10)
+        options = interact.drop_down_options(id = 'tomhanks')
+
+        self.assertEqual(options[0].text, 'abc')
+        self.assertTrue(options[0].selected)
+        self.driver.execute_script.assert_called_with(scripts.OPTIONS,
+                                                      [By.ID, 'tomhanks'])
 
     def test_type_and_enter(self):
         with patch('genie.webdriver.wait.Wait') as wait:
@@ -216,3 +268,100 @@ class Test_Interact(unittest.TestCase):
             interact.jquery_click(css = 'boomshakalala')
             self.driver.execute_script.assert_called_with(
             "$('boomshakalala').click()")
+
+
+class Test_VirtualList(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Interactions, VirtualListReader, ListItem, scripts
+
+        from genie.webdriver.interact import (Interactions, VirtualListReader,
+                                              ListItem)
+        from genie.webdriver import scripts
+
+    def setUp(self):
+        self.driver = Mock()
+        self.total = 23
+        self.top = 0
+
+        # 9 rows rendered around the top visible one, scrolling 4 rows 
+        def execute(script, container, items, key, scroll, settle_ms):
+            scrolled = False
+            if scroll and self.top < self.total - 5:
+                self.top = min(self.top + 4, self.total - 5)
+                scrolled = True
+
+            rows = range(max(self.top - 2, 0), min(self.top + 7, self.total))
+            return dict(scrolled = scrolled,
+                        items = [[str(i) if key else None, 'line %s' % i]
+                                 for i in rows])
+
+        self.driver.execute_async_script.side_effect = execute
+        self.interact = Interactions(self.driver, 10)
+
+    def test_iter(self):
+        batches = list(self.interact.iter_virtual_list(
+                                            (By.CSS_SELECTOR, '.row'),
+                                            (By.ID, 'log'), 
+                                            key = 'data-index'))
+
+        items = [item for batch in batches for item in batch]
+        self.assertEqual(items, [ListItem(str(i), 'line %s' % i)
+                                 for i in range(23)])
+        self.assertEqual(batches[0], [ListItem(str(i), 'line %s' % i) 
+                                      for i in range(7)])
+
+        self.driver.execute_async_script.assert_called_with(
+                scripts.VIRTUAL_LIST, [By.ID, 'log'], 
+                [By.CSS_SELECTOR, '.row'], 'data-index', True, 100)
+
+        # 5 scrolls, then 3 reads without progress
+        self.assertEqual(self.driver.execute_async_script.call_count, 9)
+
+    def test_limit(self):
+        items = []
+        for batch in self.interact.iter_virtual_list((By.CSS_SELECTOR, 'tr'),
+                                                     limit = 10,
+                                                     patience = 1,
+                                                     dedupe_by_text = True):
+            items.extend(batch)
+
+        self.assertEqual([item.key for item in items],
+                         ['line %s' % i for i in range(10)])
+        self.assertEqual(self.driver.execute_async_script.call_args[0][1],
+                         None)
+
+    def test_key_required(self):
+        with self.assertRaisesRegex(ValueError, 'without key attribute'):
+            next(self.interact.iter_virtual_list((By.CSS_SELECTOR, 'tr')))
+
+        # identical items are only dropped when deduped by text
+        reader = VirtualListReader(by_text = True)
+        self.assertEqual(reader.read(dict(items = [[None, 'up'], [None, 'up']],
+                                          scrolled = False)),
+                         [ListItem('up', 'up')])
+
+    def test_missing_container(self):
+        from selenium.common.exceptions import NoSuchElementException
+
+        self.driver.execute_async_script.side_effect = None
+        self.driver.execute_async_script.return_value = None
+
+        with self.assertRaises(NoSuchElementException):
+            next(self.interact.iter_virtual_list((By.CSS_SELECTOR, 'tr'),
+                                                 (By.ID, 'log')))
+
+    def test_dedupe_window(self):
+        reader = VirtualListReader(dedupe_window = 2)
+
+        self.assertEqual(len(reader.read(dict(items = [['a', 'A'], 
+                                                       ['b', 'B'], 
+                                                       ['c', 'C']],
+                                              scrolled = False))), 3)
+        self.assertEqual(list(reader.seen), ['b', 'c'])
+
+        self.assertEqual(reader.read(dict(items = [['c', 'C'], ['d', 'D']],
+                                          scrolled = False)),
+                         [ListItem('d', 'D')])
+        self.assertFalse(reader.done)
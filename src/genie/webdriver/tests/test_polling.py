@@ -0,0 +1,150 @@
+import unittest
+from itertools import islice
+from unittest.mock import patch, Mock
+
+from selenium.common.exceptions import (NoSuchElementException,
+                                        StaleElementReferenceException,
+                                        TimeoutException)
+
+
+class Test_Strategies(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global polling
+
+        from genie.webdriver import polling
+
+    def test_base(self):
+        with self.assertRaises(NotImplementedError):
+            next(polling.PollStrategy().intervals())
+
+    def test_fixed(self):
+        self.assertEqual(list(islice(polling.FixedPolling().intervals(), 3)),
+                         [0.5, 0.5, 0.5])
+        self.assertEqual(list(islice(polling.FixedPolling(2).intervals(), 2)),
+                         [2, 2])
+
+    def test_exponential_backoff(self):
+        strategy = polling.ExponentialBackoff(initial = 0.1, factor = 2,
+                                              maximum = 0.5, jitter = 0)
+        self.assertEqual(list(islice(strategy.intervals(), 5)),
+                         [0.1, 0.2, 0.4, 0.5, 0.5])
+
+        strategy = polling.ExponentialBackoff(initial = 1, factor = 1,
+                                              jitter = 0.2)
+        for interval in islice(strategy.intervals(), 50):
+            self.assertGreaterEqual(interval, 0.8)
+            self.assertLessEqual(interval, 1.2)
+
+    def test_fast_then_slow(self):
+        strategy = polling.FastThenSlow(fast = 0.25, fast_period = 1, 
+                                        slow = 2)
+        self.assertEqual(list(islice(strategy.intervals(), 6)),
+                         [0.25, 0.25, 0.25, 0.25, 2, 2])
+
+
+class Test_PollCounters(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global PollCounters
+
+        from genie.webdriver.polling import PollCounters
+
+    def test_record(self):
+        counters = PollCounters()
+        self.assertEqual(counters.average, 0)
+
+        counters.record(3)
+        counters.record(5, timed_out = True)
+
+        self.assertEqual(counters.waits, 2)
+        self.assertEqual(counters.polls, 8)
+        self.assertEqual(counters.timeouts, 1)
+        self.assertEqual(counters.last, 5)
+        self.assertEqual(counters.average, 4)
+
+        counters.reset()
+        self.assertEqual(counters.waits, 0)
+        self.assertEqual(counters.polls, 0)
+
+
+class Test_Poller(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Poller, FixedPolling, PollCounters
+
+        from genie.webdriver.polling import Poller, FixedPolling, PollCounters
+
+    def setUp(self):
+        self.driver = Mock()
+        self.counters = PollCounters()
+
+    def test_until(self):
+        condition = Mock(side_effect = [False, NoSuchElementException(), 
+                                        'elem'])
+
+        with patch('genie.webdriver.polling.time.sleep') as sleep:
+            poller = Poller(self.driver, 10, FixedPolling(0.3), 
+                            counters = self.counters)
+            self.assertEqual(poller.until(condition), 'elem')
+
+        condition.assert_called_with(self.driver)
+        sleep.assert_called_with(0.3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(poller.polls, 3)
+        self.assertEqual(self.counters.last, 3)
+        self.assertEqual(self.counters.timeouts, 0)
+
+    def test_until_not(self):
+        with patch('genie.webdriver.polling.time.sleep'):
+            poller = Poller(self.driver, 10, FixedPolling())
+            self.assertEqual(poller.until_not(Mock(side_effect = [True, 0])), 
+                             0)
+            self.assertEqual(poller.polls, 2)
+
+            self.assertIs(poller.until_not(
+                    Mock(side_effect = NoSuchElementException())), True)
+
+    def test_timeout(self):
+        poller = Poller(self.driver, 0.05, FixedPolling(0.01), 
+                        counters = self.counters)
+
+        with self.assertRaisesRegex(TimeoutException, 'boom'):
+            poller.until(Mock(return_value = False), 'boom')
+
+        self.assertGreater(poller.polls, 1)
+        self.assertEqual(self.counters.timeouts, 1)
+        self.assertEqual(self.counters.last, poller.polls)
+
+    def test_poll_frequency_override(self):
+        poller = Poller(self.driver, 10, FixedPolling(1), 
+                        poll_frequency = 0.1)
+        self.assertEqual(poller.strategy.interval, 0.1)
+
+    def test_ignored_exceptions(self):
+        condition = Mock(side_effect = [StaleElementReferenceException(), 1])
+
+        with patch('genie.webdriver.polling.time.sleep'):
+            poller = Poller(self.driver, 10, FixedPolling(), 
+                        ignored_exceptions = [StaleElementReferenceException])
+            self.assertEqual(poller.until(condition), 1)
+
+        with self.assertRaises(StaleElementReferenceException):
+            Poller(self.driver, 10, FixedPolling()).until(
+                    Mock(side_effect = StaleElementReferenceException()))
+
+    def test_ignored_exception(self):
+        # a single class, as accepted by WebDriverWait
+        condition = Mock(side_effect = [StaleElementReferenceException(), 1])
+
+        with patch('genie.webdriver.polling.time.sleep'):
+            poller = Poller(self.driver, 10, FixedPolling(), 
+                        ignored_exceptions = StaleElementReferenceException)
+            self.assertEqual(poller.until(condition), 1)
+
+        self.assertEqual(poller.ignored_exceptions, 
+                         (NoSuchElementException, 
+                          StaleElementReferenceException))
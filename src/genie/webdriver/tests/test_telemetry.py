@@ -0,0 +1,266 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+
+
+class Test_Histogram(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Histogram
+
+        from genie.webdriver.telemetry import Histogram
+
+    def test_add(self):
+        histogram = Histogram(buckets = (1, 5, float('inf')))
+        self.assertEqual(histogram.mean, 0)
+
+        for value in (0.5, 1, 3, 100):
+            histogram.add(value)
+
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.total, 104.5)
+        self.assertEqual(histogram.min, 0.5)
+        self.assertEqual(histogram.max, 100)
+        self.assertEqual(histogram.mean, 26.125)
+
+        data = histogram.to_dict()
+        self.assertEqual(data['buckets'], {'le_1': 2, 'le_5': 1, 
+                                           'le_inf': 1})
+        self.assertEqual(data['count'], 4)
+
+
+class Test_WaitRecorder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global telemetry
+
+        from genie.webdriver import telemetry
+
+    def test_record(self):
+        recorder = telemetry.WaitRecorder()
+        recorder.record('Page', 'title_is', 'abc', 0.2, 2, telemetry.SATISFIED)
+        recorder.record('Page', 'title_is', 'abc', 0.4, 3, telemetry.SATISFIED)
+        recorder.record('Page', 'title_is', 'abc', 10, 20, 
+                        telemetry.TIMED_OUT)
+        recorder.record('Page', 'title_is', 'xyz', 0.1, 1, telemetry.FAILED)
+
+        self.assertEqual(len(recorder.stats), 2)
+
+        stats = recorder.stats[('Page', 'title_is', 'abc')]
+        self.assertEqual(stats.satisfied, 2)
+        self.assertEqual(stats.timed_out, 1)
+        self.assertEqual(stats.failed, 0)
+        self.assertEqual(stats.polls, 25)
+        self.assertEqual(stats.elapsed.count, 2)
+        self.assertEqual(stats.wasted, 10)
+        self.assertAlmostEqual(stats.total, 10.6)
+
+        data = recorder.to_dict()
+        self.assertEqual([w['locator'] for w in data['waits']], ['abc', 'xyz'])
+        self.assertEqual(data['waits'][1]['failed'], 1)
+
+        recorder.reset()
+        self.assertEqual(recorder.stats, {})
+
+    def test_dump(self):
+        recorder = telemetry.WaitRecorder()
+        recorder.record(None, 'title_is', 'abc', 0.2, 2, telemetry.SATISFIED)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'waits.json')
+            recorder.dump(path)
+
+            with open(path) as f:
+                self.assertEqual(json.load(f), 
+                                 json.loads(recorder.to_json()))
+
+    def test_describe_target(self):
+        describe = telemetry.describe_target
+
+        self.assertEqual(describe((), dict(id = 'abc', timeout = 1)),
+                         str((By.ID, 'abc')))
+        self.assertEqual(describe((), dict(locator = (By.ID, 'abc'))),
+                         str((By.ID, 'abc')))
+        self.assertEqual(describe(((By.ID, 'abc'),), {}), 
+                         str((By.ID, 'abc')))
+        self.assertEqual(describe(('title',), {}), 'title')
+        self.assertEqual(describe((Mock(),), {}), '<Mock>')
+        self.assertEqual(describe(('a', 'b'), {}), str(('a', 'b')))
+        self.assertIsNone(describe((), dict(timeout = 1)))
+
+
+class Test_LoadRecorder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global telemetry, scripts
+
+        from genie.webdriver import telemetry, scripts
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.execute_script.return_value = dict(
+            navigation = dict(url = 'http://a/devices', type = 'navigate',
+                              ttfb = 120, dom_content_loaded = 800, 
+                              load = 0, transfer_size = 2000),
+            resources = dict(count = 3, transfer_size = 5000,
+                             slowest = [dict(name = 'http://cdn/a.js',
+                                             initiator_type = 'script',
+                                             duration = 1500,
+                                             transfer_size = 4000)]))
+
+    def test_collect(self):
+        timing = telemetry.NavigationTiming.collect(self.driver, 'Page', 
+                                                    top = 3)
+
+        self.driver.execute_script.assert_called_once_with(
+                                            scripts.NAVIGATION_TIMING, 3)
+        self.assertEqual(timing.page, 'Page')
+        self.assertEqual(timing.url, 'http://a/devices')
+        self.assertEqual(timing.ttfb, 0.12)
+        self.assertEqual(timing.dom_content_loaded, 0.8)
+        # load event not reached yet
+        self.assertIsNone(timing.load)
+        self.assertEqual(timing.resources, 3)
+        self.assertEqual(timing.slowest, [
+            telemetry.ResourceTiming('http://cdn/a.js', 'script', 1.5, 4000)])
+        self.assertEqual(timing.to_dict()['slowest'][0]['duration'], 1.5)
+
+        # no navigation entry reported
+        self.driver.execute_script.return_value['navigation'] = None
+        timing = telemetry.NavigationTiming.collect(self.driver)
+        self.assertIsNone(timing.ttfb)
+        self.assertEqual(timing.transfer_size, 0)
+
+    def test_record(self):
+        recorder = telemetry.LoadRecorder(top = 2)
+
+        for _ in range(2):
+            recorder.record(telemetry.NavigationTiming.collect(self.driver,
+                                                               'Page'))
+        self.driver.execute_script.return_value['navigation']['load'] = 900
+        self.driver.execute_script.return_value['resources']['slowest'] = [
+            dict(name = 'http://cdn/b.png', initiator_type = 'img',
+                 duration = 2000, transfer_size = 100)]
+        recorder.record(telemetry.NavigationTiming.collect(self.driver,
+                                                           'Page'))
+        recorder.record(telemetry.NavigationTiming.collect(self.driver,
+                                                           'Other'))
+
+        stats = recorder.stats['Page']
+        self.assertEqual(stats.loads, 3)
+        self.assertEqual(stats.ttfb.count, 3)
+        self.assertEqual(stats.load.count, 1)
+        self.assertEqual(stats.transfer_size, 21000)
+        self.assertEqual([entry.duration for entry in stats.slowest], 
+                         [2, 1.5])
+
+        data = json.loads(recorder.to_json())
+        self.assertEqual([load['page'] for load in data['loads']],
+                         ['Page', 'Other'])
+
+        recorder.reset()
+        self.assertEqual(recorder.stats, {})
+
+
+class Test_RecordedWaits(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Wait, telemetry
+
+        from genie.webdriver.wait import Wait
+        from genie.webdriver import telemetry
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.title = 'abc'
+        self.recorder = telemetry.WaitRecorder()
+
+        class SomePage(object):
+            pass
+        self.page = SomePage()
+
+    def test_not_recorded(self):
+        with patch('genie.webdriver.telemetry.Measurement') as measurement:
+            wait = Wait(self.driver, 10)
+            wait.until.title_is('abc')
+            self.assertFalse(measurement.called)
+
+    def test_satisfied(self):
+        wait = Wait(self.driver, 10, recorder = self.recorder, 
+                    owner = self.page)
+        wait.until.title_is('abc')
+        wait.until.title_is('abc')
+
+        stats = self.recorder.stats[(
+            'Test_RecordedWaits.setUp.<locals>.SomePage', 'title_is', 'abc')]
+        self.assertEqual(stats.satisfied, 2)
+        self.assertEqual(stats.polls, 2)
+
+    def test_timed_out(self):
+        self.driver.find_element.return_value.is_displayed.return_value = False
+        wait = Wait(self.driver, 0.01, recorder = self.recorder)
+
+        with self.assertRaises(TimeoutException):
+            wait.until.visibility_of_element_located(id = 'abc')
+
+        stats = self.recorder.stats[(None, 'visibility_of_element_located',
+                                     str((By.ID, 'abc')))]
+        self.assertEqual(stats.timed_out, 1)
+        self.assertGreaterEqual(stats.polls, 1)
+        self.assertGreater(stats.wasted, 0)
+
+    def test_failed(self):
+        self.driver.execute_async_script.return_value = dict(
+                                        status = 'error', message = 'bad')
+        wait = Wait(self.driver, 10, recorder = self.recorder, 
+                    in_browser = True)
+
+        with self.assertRaises(Exception):
+            wait.until_not.presence_of_element_located(xpath = '//[')
+
+        stats = self.recorder.stats[(None, 'not:presence_of_element_located',
+                                     str((By.XPATH, '//[')))]
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(stats.polls, 1)
+
+    def test_negated(self):
+        wait = Wait(self.driver, 10, recorder = self.recorder)
+        wait.until.title_is('abc')
+        wait.until_not.title_is('xyz')
+
+        # same condition and target, kept apart
+        self.assertEqual(sorted(self.recorder.stats), 
+                         [(None, 'not:title_is', 'xyz'),
+                          (None, 'title_is', 'abc')])
+
+
+class Test_RecordedAsyncWaits(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global AsyncWait, telemetry
+
+        from genie.webdriver.aio import AsyncWait
+        from genie.webdriver import telemetry
+
+    async def test_satisfied(self):
+        driver = Mock()
+        driver.title = 'abc'
+        recorder = telemetry.WaitRecorder()
+
+        wait = AsyncWait(driver, 10, recorder = recorder)
+        await wait.until.title_is('abc')
+
+        stats = recorder.stats[(None, 'title_is', 'abc')]
+        self.assertEqual(stats.satisfied, 1)
+        self.assertEqual(stats.polls, 1)
@@ -0,0 +1,233 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+
+
+class Test_TimingStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global TimingStore, Suggestion, percentile
+
+        from genie.webdriver.timings import (TimingStore, Suggestion,
+                                             percentile)
+
+    def test_percentile(self):
+        samples = list(range(1, 101))
+
+        self.assertEqual(percentile(samples, 0.99), 99)
+        self.assertEqual(percentile(samples, 0.5), 50)
+        self.assertEqual(percentile([3], 0.99), 3)
+
+    def test_record(self):
+        store = TimingStore(window = 3, min_samples = 2)
+
+        store.record('Page', 'title_is', 'abc', 1)
+        self.assertIsNone(store.p99('Page', 'title_is', 'abc'))
+
+        for elapsed in (2, 3, 4):
+            store.record('Page', 'title_is', 'abc', elapsed)
+
+        # only the most recent samples are kept
+        self.assertEqual(list(store.samples[('Page', 'title_is', 'abc')]),
+                         [2, 3, 4])
+        self.assertEqual(store.p99('Page', 'title_is', 'abc'), 4)
+
+        # web elements do not identify anything across runs
+        store.record('Page', 'visibility_of', '<WebElement>', 1)
+        store.record('Page', 'alert_is_present', None, 1)
+        self.assertEqual(len(store.samples), 1)
+
+    def test_suggest(self):
+        store = TimingStore(min_samples = 10)
+
+        for _ in range(10):
+            store.record('Page', 'presence_of_element_located', 'fast', 0.05)
+            store.record('Page', 'presence_of_element_located', 'slow', 8)
+
+        self.assertIsNone(store.suggest('Page', 'title_is', 'fast'))
+
+        self.assertEqual(store.suggest('Page', 'presence_of_element_located',
+                                       'fast'),
+                         Suggestion(1.0, 0.05))
+        self.assertEqual(store.suggest('Page', 'presence_of_element_located',
+                                       'slow'),
+                         Suggestion(16, 0.8))
+
+        store.maximum = 10
+        self.assertEqual(store.suggest('Page', 'presence_of_element_located',
+                                       'slow').timeout, 10)
+
+    def test_record_timeout(self):
+        store = TimingStore(min_samples = 2)
+
+        for _ in range(2):
+            store.record('Page', 'title_is', 'abc', 0.5)
+        self.assertEqual(store.suggest('Page', 'title_is', 'abc').timeout, 1)
+
+        # timed out under the learned timeout: suggestions grow back
+        store.record_timeout('Page', 'title_is', 'abc', 1)
+        self.assertEqual(list(store.samples[('Page', 'title_is', 'abc')]),
+                         [0.5, 0.5, 1])
+        self.assertEqual(store.suggest('Page', 'title_is', 'abc').timeout, 2)
+
+        for _ in range(10):
+            store.record('Page', 'title_is', 'abc', 0.5)
+        self.assertEqual(store.suggest('Page', 'title_is', 'abc').timeout, 2)
+
+        store.record_timeout('Page', 'title_is', '<WebElement>', 1)
+        self.assertNotIn(('Page', 'title_is', '<WebElement>'), store.floors)
+
+        store.reset()
+        self.assertEqual(store.floors, {})
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'timings.json')
+
+            store = TimingStore(path)
+            self.assertEqual(store.samples, {})
+
+            store.record('Page', 'title_is', 'abc', 0.5)
+            store.record(None, 'title_is', 'abc', 1.5)
+            store.save()
+
+            with open(path) as f:
+                data = json.load(f)
+            self.assertEqual(data['version'], 1)
+            self.assertEqual(len(data['timings']), 2)
+            self.assertEqual(os.listdir(directory), ['timings.json'])
+
+            store = TimingStore(path)
+            self.assertEqual(list(store.samples[('Page', 'title_is', 'abc')]),
+                             [0.5])
+            self.assertEqual(list(store.samples[(None, 'title_is', 'abc')]),
+                             [1.5])
+
+            with open(path, 'w') as f:
+                json.dump(dict(version = 0, timings = []), f)
+
+            with self.assertRaises(ValueError):
+                TimingStore(path)
+
+        with self.assertRaises(ValueError):
+            TimingStore().save()
+
+    def test_save_load_timeout(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'timings.json')
+
+            store = TimingStore(path)
+            for _ in range(100):
+                store.record('Page', 'title_is', 'abc', 0.1)
+            self.assertEqual(store.suggest('Page', 'title_is', 'abc').timeout,
+                             1)
+
+            store.record_timeout('Page', 'title_is', 'abc', 1)
+            self.assertEqual(store.suggest('Page', 'title_is', 'abc').timeout,
+                             2)
+            store.save()
+
+            # the p99 of the window ignores the single timed out sample: 
+            # the raised timeout survives through its floor
+            store = TimingStore(path)
+            self.assertEqual(store.floors[('Page', 'title_is', 'abc')], 2)
+            self.assertEqual(store.suggest('Page', 'title_is', 'abc').timeout,
+                             2)
+
+
+class Test_LearnedWaits(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Wait, TimingStore, FixedPolling
+
+        from genie.webdriver.wait import Wait
+        from genie.webdriver.timings import TimingStore
+        from genie.webdriver.polling import FixedPolling
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.title = 'abc'
+        self.store = TimingStore(min_samples = 2)
+
+        class SomePage(object):
+            pass
+        self.page = SomePage()
+        self.key = ('Test_LearnedWaits.setUp.<locals>.SomePage',
+                    'presence_of_element_located', "('id', 'abc')")
+
+    def test_feed(self):
+        wait = Wait(self.driver, 10, timings = self.store, owner = self.page)
+        wait.until.presence_of_element_located(id = 'abc')
+        wait.until.presence_of_element_located((By.ID, 'abc'))
+
+        self.assertEqual(len(self.store.samples[self.key]), 2)
+
+    def test_timed_out_not_fed(self):
+        self.driver.title = 'xyz'
+
+        wait = Wait(self.driver, 0.01, timings = self.store)
+        with self.assertRaises(TimeoutException):
+            wait.until.title_is('abc', poll_frequency = 0.01)
+
+        self.assertEqual(self.store.samples, {})
+
+    def test_negated(self):
+        wait = Wait(self.driver, 10, timings = self.store)
+        wait.until.title_is('abc')
+        wait.until_not.title_is('xyz')
+
+        self.assertEqual(sorted(self.store.samples), 
+                         [(None, 'not:title_is', 'xyz'),
+                          (None, 'title_is', 'abc')])
+
+    def test_timed_out_under_learned_timeout(self):
+        key = (None, 'title_is', 'xyz')
+        self.driver.title = 'abc'
+
+        for _ in range(2):
+            self.store.record(*key, 0.005)
+        self.store.minimum = 0.01
+
+        wait = Wait(self.driver, 10, timings = self.store)
+        with self.assertRaises(TimeoutException):
+            wait.until.title_is('xyz')
+
+        # fed back: next suggestion is longer than the one that timed out
+        self.assertEqual(len(self.store.samples[key]), 3)
+        self.assertGreaterEqual(self.store.suggest(*key).timeout, 0.02)
+
+    def test_apply(self):
+        for _ in range(2):
+            self.store.record(*self.key, 3)
+
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            wait = Wait(self.driver, 10, timings = self.store,
+                        owner = self.page)
+
+            wait.until.presence_of_element_located(id = 'abc')
+            kwargs = poller.call_args[1]
+            self.assertEqual(kwargs['timeout'], 6)
+            self.assertIsInstance(kwargs['strategy'], FixedPolling)
+            self.assertEqual(kwargs['strategy'].interval, 0.3)
+
+            # explicit timeouts always win
+            wait.until.presence_of_element_located(id = 'abc', timeout = 1)
+            self.assertEqual(poller.call_args[1]['timeout'], 1)
+
+            # explicit polling too
+            wait.until.presence_of_element_located(id = 'abc',
+                                                   poll_frequency = 2)
+            kwargs = poller.call_args[1]
+            self.assertEqual(kwargs['timeout'], 6)
+            self.assertEqual(kwargs['poll_frequency'], 2)
+
+            # nothing learned for other locators
+            wait.until.presence_of_element_located(id = 'efg')
+            self.assertEqual(poller.call_args[1]['timeout'], 10)
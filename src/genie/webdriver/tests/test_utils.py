@@ -127,3 +127,22 @@ class Test_Translator(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             translate_args_with_passthru((By.ID, 'value'), id='value')
+
+
+class Test_NormalizeUrl(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global normalize_url
+
+        from genie.webdriver.utils import normalize_url
+
+    def test_normalize(self):
+        expectations = {'https://host': 'https://host/',
+                        'HTTPS://Host:443': 'https://host/',
+                        'http://host:80/a?b=1#c': 'http://host/a?b=1#c',
+                        'http://host:8080/A': 'http://host:8080/A',
+                        'https://host:80/': 'https://host:80/'}
+
+        for url, expected in expectations.items():
+            self.assertEqual(normalize_url(url), expected)
@@ -1,5 +1,6 @@
+import time
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, ANY
 
 class Test_Wait(unittest.TestCase):
 
@@ -19,8 +20,18 @@ class Test_Wait(unittest.TestCase):
                 self.assertEqual(wait.timeout, 10)
                 self.assertIs(wait.driver, self.driver)
 
-                wu.assert_called_with(self.driver, 10)
-                wun.assert_called_with(self.driver, 10)
+                wu.assert_called_with(self.driver, 10, in_browser = False,
+                                      poll_strategy = None, 
+                                      counters = wait.counters,
+                                      recorder = None,
+                                      timings = None,
+                                      owner = None)
+                wun.assert_called_with(self.driver, 10, in_browser = False,
+                                       poll_strategy = None,
+                                       counters = wait.counters,
+                                       recorder = None,
+                                       timings = None,
+                                       owner = None)
 
         wait = Wait(driver = self.driver, timeout = 10)
 
@@ -35,34 +46,38 @@ class Test_Wait(unittest.TestCase):
         self.driver.implicitly_wait.assert_called_with(10)
 
     def test_until(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = Wait(driver = self.driver, timeout = 10)
             wait.until(object, message='lalala')
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10)
-            wdw().until.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = ANY, counters = ANY)
+            poller().until.assert_called_with(object, 'lalala')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = Wait(driver = self.driver, timeout = 10)
             wait.until(object, message='lalala', abc=1)
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10, abc=1)
-            wdw().until.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      abc=1, strategy = ANY, counters = ANY)
+            poller().until.assert_called_with(object, 'lalala')
 
     def test_until_not(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = Wait(driver = self.driver, timeout = 10)
             wait.until_not(object, message='lalala')
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10)
-            wdw().until_not.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = ANY, counters = ANY)
+            poller().until_not.assert_called_with(object, 'lalala')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = Wait(driver = self.driver, timeout = 10)
             wait.until_not(object, message='lalala', abc=1)
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10, abc=1)
-            wdw().until_not.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      abc=1, strategy = ANY, counters = ANY)
+            poller().until_not.assert_called_with(object, 'lalala')
 
 class Test_WaitUntil(unittest.TestCase):
     @classmethod
@@ -81,254 +96,274 @@ class Test_WaitUntil(unittest.TestCase):
         self.assertIs(wait.driver, self.driver)
 
     def test_call(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = WaitUntil(driver = self.driver, timeout = 10)
             wait(object, message='lalala')
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10)
-            wdw().until.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = ANY, counters = ANY)
+            poller().until.assert_called_with(object, 'lalala')
 
     def test_title_is(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.title_is('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_is(), '')
+                poller().until.assert_called_with(ec.title_is(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 61)
                 wait.title_is('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_is(), 'boom')
+                poller().until.assert_called_with(ec.title_is(), 'boom')
 
     def test_title_contains(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.title_contains('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_contains(), '')
+                poller().until.assert_called_with(ec.title_contains(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 61)
                 wait.title_contains('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_contains(), 'boom')
+                poller().until.assert_called_with(ec.title_contains(), 'boom')
 
     def test_presence_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.presence_of_element_located(css='lalala', message = 'monk',
                                                  timeout = 11)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 11)
+                poller.assert_called_with(driver = self.driver, timeout = 11,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_element_located.assert_called_with(
                                     (By.CSS_SELECTOR, 'lalala'))
-                wdw().until.assert_called_with(ec.presence_of_element_located(), 
+                poller().until.assert_called_with(ec.presence_of_element_located(), 
                                                'monk')
 
     def test_visibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.visibility_of_element_located(
                                     name='lalala1', message = 'monk',
                                                  timeout = 13)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 13)
+                poller.assert_called_with(driver = self.driver, timeout = 13,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of_element_located.assert_called_with(
                                     (By.NAME, 'lalala1'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.visibility_of_element_located(), 
                                                'monk')
 
     def test_visibility_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.visibility_of(object, message = 'monk',
                                                  timeout = 14)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 14)
+                poller.assert_called_with(driver = self.driver, timeout = 14,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of.assert_called_with(object)
-                wdw().until.assert_called_with(ec.visibility_of(), 'monk')
+                poller().until.assert_called_with(ec.visibility_of(), 'monk')
 
     def test_presence_of_all_elements_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.presence_of_all_elements_located(
                                     link='legion', message = 'willnotprevail',
                                                  timeout = 15)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 15)
+                poller.assert_called_with(driver = self.driver, timeout = 15,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_all_elements_located.assert_called_with(
                                     (By.LINK_TEXT, 'legion'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.presence_of_all_elements_located(), 
                                                'willnotprevail')
 
     def test_text_to_be_present_in_element(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
 
     def test_text_to_be_present_in_element_value(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
 
     def test_frame_to_be_available_and_switch_to_it(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.frame_to_be_available_and_switch_to_it(
                                     tag_name='warrior', timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.frame_to_be_available_and_switch_to_it.assert_called_with(
                                     (By.TAG_NAME, 'warrior'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.frame_to_be_available_and_switch_to_it(), 
                                                '')
     
     def test_invisibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.invisibility_of_element_located(
                                     (By.ID, 'priest'), timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.invisibility_of_element_located.assert_called_with(
                                     (By.ID, 'priest'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.invisibility_of_element_located(), 
                                                '')
     
     def test_element_to_be_clickable(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_to_be_clickable(
                                     (By.ID, 'lol'), timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_clickable.assert_called_with(
                                     (By.ID, 'lol'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_to_be_clickable(), 
                                                '')
 
     def test_staleness_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.staleness_of(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.staleness_of.assert_called_with(self)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.staleness_of(), 
                                                '')
 
     def test_element_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_to_be_selected(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_selected.assert_called_with(self)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_to_be_selected(), 
                                                '')
 
     def test_element_located_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_located_to_be_selected(class_ = 'ddy', 
                                                     timeout = 21)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 21)
+                poller.assert_called_with(driver = self.driver, timeout = 21,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_to_be_selected.assert_called_with(
                                     (By.CLASS_NAME, 'ddy'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_located_to_be_selected(), 
                                                '')
 
     def test_element_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_selection_state_to_be(self, 'up!')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.element_selection_state_to_be.assert_called_with(
                                     self, 'up!')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_selection_state_to_be(), 
                                                '')
 
     def test_element_located_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_located_selection_state_to_be(
@@ -336,46 +371,50 @@ class Test_WaitUntil(unittest.TestCase):
                                                     state = 'down!',
                                                     timeout = 23)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 23)
+                poller.assert_called_with(driver = self.driver, timeout = 23,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_selection_state_to_be.assert_called_with(
                                     (By.CLASS_NAME, 'jalopnik'), 'down!')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_located_selection_state_to_be(), 
                                                '')
 
     def test_number_of_windows_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.number_of_windows_to_be(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.number_of_windows_to_be.assert_called_with(111)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.number_of_windows_to_be(), 
                                                '')
 
     def test_new_window_is_opened(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.new_window_is_opened(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.new_window_is_opened.assert_called_with(111)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.new_window_is_opened(), 
                                                '')
 
     def test_alert_is_present(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.alert_is_present(timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.alert_is_present.assert_called_with()
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.alert_is_present(), 
                                                '')
 
@@ -396,254 +435,274 @@ class Test_WaitUntil(unittest.TestCase):
         self.assertIs(wait.driver, self.driver)
 
     def test_call(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = WaitUntil(driver = self.driver, timeout = 10)
             wait(object, message='lalala')
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10)
-            wdw().until.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = ANY, counters = ANY)
+            poller().until.assert_called_with(object, 'lalala')
 
     def test_title_is(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.title_is('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_is(), '')
+                poller().until.assert_called_with(ec.title_is(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 61)
                 wait.title_is('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_is(), 'boom')
+                poller().until.assert_called_with(ec.title_is(), 'boom')
 
     def test_title_contains(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.title_contains('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_contains(), '')
+                poller().until.assert_called_with(ec.title_contains(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 61)
                 wait.title_contains('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_contains(), 'boom')
+                poller().until.assert_called_with(ec.title_contains(), 'boom')
 
     def test_presence_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.presence_of_element_located(css='lalala', message = 'monk',
                                                  timeout = 11)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 11)
+                poller.assert_called_with(driver = self.driver, timeout = 11,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_element_located.assert_called_with(
                                     (By.CSS_SELECTOR, 'lalala'))
-                wdw().until.assert_called_with(ec.presence_of_element_located(), 
+                poller().until.assert_called_with(ec.presence_of_element_located(), 
                                                'monk')
 
     def test_visibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.visibility_of_element_located(
                                     name='lalala1', message = 'monk',
                                                  timeout = 13)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 13)
+                poller.assert_called_with(driver = self.driver, timeout = 13,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of_element_located.assert_called_with(
                                     (By.NAME, 'lalala1'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.visibility_of_element_located(), 
                                                'monk')
 
     def test_visibility_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.visibility_of(object, message = 'monk',
                                                  timeout = 14)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 14)
+                poller.assert_called_with(driver = self.driver, timeout = 14,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of.assert_called_with(object)
-                wdw().until.assert_called_with(ec.visibility_of(), 'monk')
+                poller().until.assert_called_with(ec.visibility_of(), 'monk')
 
     def test_presence_of_all_elements_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.presence_of_all_elements_located(
                                     link='legion', message = 'willnotprevail',
                                                  timeout = 15)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 15)
+                poller.assert_called_with(driver = self.driver, timeout = 15,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_all_elements_located.assert_called_with(
                                     (By.LINK_TEXT, 'legion'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.presence_of_all_elements_located(), 
                                                'willnotprevail')
 
     def test_text_to_be_present_in_element(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
 
     def test_text_to_be_present_in_element_value(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
 
     def test_frame_to_be_available_and_switch_to_it(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.frame_to_be_available_and_switch_to_it(
                                     tag_name='warrior', timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.frame_to_be_available_and_switch_to_it.assert_called_with(
                                     (By.TAG_NAME, 'warrior'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.frame_to_be_available_and_switch_to_it(), 
                                                '')
     
     def test_invisibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.invisibility_of_element_located(
                                     (By.ID, 'priest'), timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.invisibility_of_element_located.assert_called_with(
                                     (By.ID, 'priest'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.invisibility_of_element_located(), 
                                                '')
     
     def test_element_to_be_clickable(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_to_be_clickable(
                                     (By.ID, 'lol'), timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_clickable.assert_called_with(
                                     (By.ID, 'lol'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_to_be_clickable(), 
                                                '')
 
     def test_staleness_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.staleness_of(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.staleness_of.assert_called_with(self)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.staleness_of(), 
                                                '')
 
     def test_element_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_to_be_selected(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_selected.assert_called_with(self)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_to_be_selected(), 
                                                '')
 
     def test_element_located_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_located_to_be_selected(class_ = 'ddy', 
                                                     timeout = 21)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 21)
+                poller.assert_called_with(driver = self.driver, timeout = 21,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_to_be_selected.assert_called_with(
                                     (By.CLASS_NAME, 'ddy'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_located_to_be_selected(), 
                                                '')
 
     def test_element_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_selection_state_to_be(self, 'up!')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.element_selection_state_to_be.assert_called_with(
                                     self, 'up!')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_selection_state_to_be(), 
                                                '')
 
     def test_element_located_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_located_selection_state_to_be(
@@ -651,46 +710,50 @@ class Test_WaitUntil(unittest.TestCase):
                                                     state = 'down!',
                                                     timeout = 23)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 23)
+                poller.assert_called_with(driver = self.driver, timeout = 23,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_selection_state_to_be.assert_called_with(
                                     (By.CLASS_NAME, 'jalopnik'), 'down!')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_located_selection_state_to_be(), 
                                                '')
 
     def test_number_of_windows_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.number_of_windows_to_be(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.number_of_windows_to_be.assert_called_with(111)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.number_of_windows_to_be(), 
                                                '')
 
     def test_new_window_is_opened(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.new_window_is_opened(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.new_window_is_opened.assert_called_with(111)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.new_window_is_opened(), 
                                                '')
 
     def test_alert_is_present(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.alert_is_present(timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.alert_is_present.assert_called_with()
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.alert_is_present(), 
                                                '')
 
@@ -711,254 +774,274 @@ class Test_WaitUntil(unittest.TestCase):
         self.assertIs(wait.driver, self.driver)
 
     def test_call(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = WaitUntil(driver = self.driver, timeout = 10)
             wait(object, message='lalala')
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10)
-            wdw().until.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = ANY, counters = ANY)
+            poller().until.assert_called_with(object, 'lalala')
 
     def test_title_is(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.title_is('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_is(), '')
+                poller().until.assert_called_with(ec.title_is(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 61)
                 wait.title_is('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_is(), 'boom')
+                poller().until.assert_called_with(ec.title_is(), 'boom')
 
     def test_title_contains(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.title_contains('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_contains(), '')
+                poller().until.assert_called_with(ec.title_contains(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 61)
                 wait.title_contains('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until.assert_called_with(ec.title_contains(), 'boom')
+                poller().until.assert_called_with(ec.title_contains(), 'boom')
 
     def test_presence_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.presence_of_element_located(css='lalala', message = 'monk',
                                                  timeout = 11)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 11)
+                poller.assert_called_with(driver = self.driver, timeout = 11,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_element_located.assert_called_with(
                                     (By.CSS_SELECTOR, 'lalala'))
-                wdw().until.assert_called_with(ec.presence_of_element_located(), 
+                poller().until.assert_called_with(ec.presence_of_element_located(), 
                                                'monk')
 
     def test_visibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.visibility_of_element_located(
                                     name='lalala1', message = 'monk',
                                                  timeout = 13)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 13)
+                poller.assert_called_with(driver = self.driver, timeout = 13,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of_element_located.assert_called_with(
                                     (By.NAME, 'lalala1'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.visibility_of_element_located(), 
                                                'monk')
 
     def test_visibility_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.visibility_of(object, message = 'monk',
                                                  timeout = 14)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 14)
+                poller.assert_called_with(driver = self.driver, timeout = 14,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of.assert_called_with(object)
-                wdw().until.assert_called_with(ec.visibility_of(), 'monk')
+                poller().until.assert_called_with(ec.visibility_of(), 'monk')
 
     def test_presence_of_all_elements_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.presence_of_all_elements_located(
                                     link='legion', message = 'willnotprevail',
                                                  timeout = 15)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 15)
+                poller.assert_called_with(driver = self.driver, timeout = 15,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_all_elements_located.assert_called_with(
                                     (By.LINK_TEXT, 'legion'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.presence_of_all_elements_located(), 
                                                'willnotprevail')
 
     def test_text_to_be_present_in_element(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
 
     def test_text_to_be_present_in_element_value(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
 
     def test_frame_to_be_available_and_switch_to_it(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.frame_to_be_available_and_switch_to_it(
                                     tag_name='warrior', timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.frame_to_be_available_and_switch_to_it.assert_called_with(
                                     (By.TAG_NAME, 'warrior'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.frame_to_be_available_and_switch_to_it(), 
                                                '')
     
     def test_invisibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.invisibility_of_element_located(
                                     (By.ID, 'priest'), timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.invisibility_of_element_located.assert_called_with(
                                     (By.ID, 'priest'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.invisibility_of_element_located(), 
                                                '')
     
     def test_element_to_be_clickable(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_to_be_clickable(
                                     (By.ID, 'lol'), timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_clickable.assert_called_with(
                                     (By.ID, 'lol'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_to_be_clickable(), 
                                                '')
 
     def test_staleness_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.staleness_of(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.staleness_of.assert_called_with(self)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.staleness_of(), 
                                                '')
 
     def test_element_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_to_be_selected(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_selected.assert_called_with(self)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_to_be_selected(), 
                                                '')
 
     def test_element_located_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_located_to_be_selected(class_ = 'ddy', 
                                                     timeout = 21)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 21)
+                poller.assert_called_with(driver = self.driver, timeout = 21,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_to_be_selected.assert_called_with(
                                     (By.CLASS_NAME, 'ddy'))
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_located_to_be_selected(), 
                                                '')
 
     def test_element_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_selection_state_to_be(self, 'up!')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.element_selection_state_to_be.assert_called_with(
                                     self, 'up!')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_selection_state_to_be(), 
                                                '')
 
     def test_element_located_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.element_located_selection_state_to_be(
@@ -966,46 +1049,50 @@ class Test_WaitUntil(unittest.TestCase):
                                                     state = 'down!',
                                                     timeout = 23)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 23)
+                poller.assert_called_with(driver = self.driver, timeout = 23,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_selection_state_to_be.assert_called_with(
                                     (By.CLASS_NAME, 'jalopnik'), 'down!')
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.element_located_selection_state_to_be(), 
                                                '')
 
     def test_number_of_windows_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.number_of_windows_to_be(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.number_of_windows_to_be.assert_called_with(111)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.number_of_windows_to_be(), 
                                                '')
 
     def test_new_window_is_opened(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.new_window_is_opened(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.new_window_is_opened.assert_called_with(111)
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.new_window_is_opened(), 
                                                '')
 
     def test_alert_is_present(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntil(driver = self.driver, timeout = 10)
                 wait.alert_is_present(timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.alert_is_present.assert_called_with()
-                wdw().until.assert_called_with(
+                poller().until.assert_called_with(
                             ec.alert_is_present(), 
                                                '')
 
@@ -1026,254 +1113,274 @@ class Test_WaitUntilNot(unittest.TestCase):
         self.assertIs(wait.driver, self.driver)
 
     def test_call(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             wait = WaitUntilNot(driver = self.driver, timeout = 10)
             wait(object, message='lalala')
 
-            wdw.assert_called_with(driver = self.driver, timeout = 10)
-            wdw().until_not.assert_called_with(object, 'lalala')
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = ANY, counters = ANY)
+            poller().until_not.assert_called_with(object, 'lalala')
 
     def test_title_is(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.title_is('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until_not.assert_called_with(ec.title_is(), '')
+                poller().until_not.assert_called_with(ec.title_is(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 61)
                 wait.title_is('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_is.assert_called_with('jb is genius')
-                wdw().until_not.assert_called_with(ec.title_is(), 'boom')
+                poller().until_not.assert_called_with(ec.title_is(), 'boom')
 
     def test_title_contains(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.title_contains('jb is genius')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until_not.assert_called_with(ec.title_contains(), '')
+                poller().until_not.assert_called_with(ec.title_contains(), '')
 
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 61)
                 wait.title_contains('jb is genius', message = 'boom')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 61)
+                poller.assert_called_with(driver = self.driver, timeout = 61,
+                                          strategy = ANY, counters = ANY)
                 ec.title_contains.assert_called_with('jb is genius')
-                wdw().until_not.assert_called_with(ec.title_contains(), 'boom')
+                poller().until_not.assert_called_with(ec.title_contains(), 'boom')
 
     def test_presence_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.presence_of_element_located(css='lalala', message = 'monk',
                                                  timeout = 11)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 11)
+                poller.assert_called_with(driver = self.driver, timeout = 11,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_element_located.assert_called_with(
                                     (By.CSS_SELECTOR, 'lalala'))
-                wdw().until_not.assert_called_with(ec.presence_of_element_located(), 
+                poller().until_not.assert_called_with(ec.presence_of_element_located(), 
                                                'monk')
 
     def test_visibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.visibility_of_element_located(
                                     name='lalala1', message = 'monk',
                                                  timeout = 13)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 13)
+                poller.assert_called_with(driver = self.driver, timeout = 13,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of_element_located.assert_called_with(
                                     (By.NAME, 'lalala1'))
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.visibility_of_element_located(), 
                                                'monk')
 
     def test_visibility_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.visibility_of(object, message = 'monk',
                                                  timeout = 14)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 14)
+                poller.assert_called_with(driver = self.driver, timeout = 14,
+                                          strategy = ANY, counters = ANY)
                 ec.visibility_of.assert_called_with(object)
-                wdw().until_not.assert_called_with(ec.visibility_of(), 'monk')
+                poller().until_not.assert_called_with(ec.visibility_of(), 'monk')
 
     def test_presence_of_all_elements_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.presence_of_all_elements_located(
                                     link='legion', message = 'willnotprevail',
                                                  timeout = 15)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 15)
+                poller.assert_called_with(driver = self.driver, timeout = 15,
+                                          strategy = ANY, counters = ANY)
                 ec.presence_of_all_elements_located.assert_called_with(
                                     (By.LINK_TEXT, 'legion'))
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.presence_of_all_elements_located(), 
                                                'willnotprevail')
 
     def test_text_to_be_present_in_element(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.text_to_be_present_in_element(), 
                                                '')
 
     def test_text_to_be_present_in_element_value(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     tag='paladin', timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.text_to_be_present_in_element_value(text = '111',
                                     locator = (By.TAG_NAME, 'paladin'), 
                                     timeout = 16)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 16)
+                poller.assert_called_with(driver = self.driver, timeout = 16,
+                                          strategy = ANY, counters = ANY)
                 ec.text_to_be_present_in_element_value.assert_called_with(
                                     (By.TAG_NAME, 'paladin'), '111')
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.text_to_be_present_in_element_value(), 
                                                '')
 
     def test_frame_to_be_available_and_switch_to_it(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.frame_to_be_available_and_switch_to_it(
                                     tag_name='warrior', timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.frame_to_be_available_and_switch_to_it.assert_called_with(
                                     (By.TAG_NAME, 'warrior'))
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.frame_to_be_available_and_switch_to_it(), 
                                                '')
     
     def test_invisibility_of_element_located(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.invisibility_of_element_located(
                                     (By.ID, 'priest'), timeout = 17)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 17)
+                poller.assert_called_with(driver = self.driver, timeout = 17,
+                                          strategy = ANY, counters = ANY)
                 ec.invisibility_of_element_located.assert_called_with(
                                     (By.ID, 'priest'))
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.invisibility_of_element_located(), 
                                                '')
     
     def test_element_to_be_clickable(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.element_to_be_clickable(
                                     (By.ID, 'lol'), timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_clickable.assert_called_with(
                                     (By.ID, 'lol'))
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.element_to_be_clickable(), 
                                                '')
 
     def test_staleness_of(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.staleness_of(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.staleness_of.assert_called_with(self)
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.staleness_of(), 
                                                '')
 
     def test_element_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.element_to_be_selected(self, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.element_to_be_selected.assert_called_with(self)
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.element_to_be_selected(), 
                                                '')
 
     def test_element_located_to_be_selected(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.element_located_to_be_selected(class_ = 'ddy', 
                                                     timeout = 21)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 21)
+                poller.assert_called_with(driver = self.driver, timeout = 21,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_to_be_selected.assert_called_with(
                                     (By.CLASS_NAME, 'ddy'))
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.element_located_to_be_selected(), 
                                                '')
 
     def test_element_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.element_selection_state_to_be(self, 'up!')
 
-                wdw.assert_called_with(driver = self.driver, timeout = 10)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
                 ec.element_selection_state_to_be.assert_called_with(
                                     self, 'up!')
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.element_selection_state_to_be(), 
                                                '')
 
     def test_element_located_selection_state_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.element_located_selection_state_to_be(
@@ -1281,45 +1388,739 @@ class Test_WaitUntilNot(unittest.TestCase):
                                                     state = 'down!',
                                                     timeout = 23)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 23)
+                poller.assert_called_with(driver = self.driver, timeout = 23,
+                                          strategy = ANY, counters = ANY)
                 ec.element_located_selection_state_to_be.assert_called_with(
                                     (By.CLASS_NAME, 'jalopnik'), 'down!')
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.element_located_selection_state_to_be(), 
                                                '')
 
     def test_number_of_windows_to_be(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.number_of_windows_to_be(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.number_of_windows_to_be.assert_called_with(111)
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.number_of_windows_to_be(), 
                                                '')
 
     def test_new_window_is_opened(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.new_window_is_opened(111, timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.new_window_is_opened.assert_called_with(111)
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.new_window_is_opened(), 
                                                '')
 
     def test_alert_is_present(self):
-        with patch('genie.webdriver.wait.WebDriverWait') as wdw:
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
             with patch('genie.webdriver.wait.EC') as ec:
                 wait = WaitUntilNot(driver = self.driver, timeout = 10)
                 wait.alert_is_present(timeout = 19)
 
-                wdw.assert_called_with(driver = self.driver, timeout = 19)
+                poller.assert_called_with(driver = self.driver, timeout = 19,
+                                          strategy = ANY, counters = ANY)
                 ec.alert_is_present.assert_called_with()
-                wdw().until_not.assert_called_with(
+                poller().until_not.assert_called_with(
                             ec.alert_is_present(), 
                                                '')
+
+
+class Test_WaitUntilInBrowser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        global WaitUntil, WaitUntilNot, By, scripts, TimeoutException
+        global JavascriptException
+
+        from genie.webdriver.wait import WaitUntil, WaitUntilNot
+        from genie.webdriver import scripts
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import (TimeoutException,
+                                                JavascriptException)
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.execute_async_script.return_value = dict(
+                status = 'ok', value = dict(matched = [0], values = ['elem']))
+
+    def test_init(self):
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+        self.assertFalse(wait.in_browser)
+
+        wait = WaitUntil(driver = self.driver, timeout = 10, in_browser = True)
+        self.assertTrue(wait.in_browser)
+
+    def test_located_conditions(self):
+        checks = dict(presence_of_element_located = 'presence',
+                      visibility_of_element_located = 'visibility',
+                      element_to_be_clickable = 'clickable',
+                      invisibility_of_element_located = 'invisibility')
+
+        for method, check in checks.items():
+            # frozen clock: the time slice passed to the script is the 
+            # timeout
+            with patch('genie.webdriver.wait.time.monotonic', 
+                       return_value = 0),\
+                 patch('genie.webdriver.wait.polling.Poller') as poller:
+                wait = WaitUntil(driver = self.driver, timeout = 10,
+                                 in_browser = True)
+                result = getattr(wait, method)(id = 'paladin', timeout = 5)
+
+                self.assertEqual(result, 'elem')
+                self.assertFalse(poller.called)
+                self.driver.execute_async_script.assert_called_with(
+                        scripts.OBSERVE, [[check, By.ID, 'paladin']], 'all',
+                        False, 5000)
+
+    def test_until_not(self):
+        wait = WaitUntilNot(driver = self.driver, timeout = 10,
+                            in_browser = True)
+
+        with patch('genie.webdriver.wait.time.monotonic', return_value = 0):
+            wait.visibility_of_element_located((By.CSS_SELECTOR, '.toast'))
+
+        self.driver.execute_async_script.assert_called_with(
+                scripts.OBSERVE, [['visibility', By.CSS_SELECTOR, '.toast']],
+                'all', True, 10000)
+
+    def test_per_call_override(self):
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            with patch('genie.webdriver.wait.EC') as ec:
+                wait = WaitUntil(driver = self.driver, timeout = 10,
+                                 in_browser = True)
+                wait.element_to_be_clickable(id = 'paladin', 
+                                             in_browser = False)
+
+                self.assertFalse(self.driver.execute_async_script.called)
+                poller.assert_called_with(driver = self.driver, timeout = 10,
+                                          strategy = ANY, counters = ANY)
+                poller().until.assert_called_with(ec.element_to_be_clickable(),
+                                               '')
+
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+        wait.element_to_be_clickable(id = 'paladin', in_browser = True)
+        self.assertTrue(self.driver.execute_async_script.called)
+
+    def test_fallback(self):
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            with patch('genie.webdriver.wait.EC') as ec:
+                wait = WaitUntil(driver = self.driver, timeout = 10,
+                                 in_browser = True)
+                wait.text_to_be_present_in_element(text = 'a', id = 'b')
+
+                self.assertFalse(self.driver.execute_async_script.called)
+                poller().until.assert_called_with(
+                            ec.text_to_be_present_in_element(), '')
+
+    def test_long_wait_is_sliced(self):
+        with patch('genie.webdriver.wait.IN_BROWSER_SLICE', 0.01):
+            self.driver.execute_async_script.side_effect = [
+                dict(status = 'timeout'),
+                TimeoutException('script timeout'),
+                JavascriptException('document unloaded'),
+                dict(status = 'ok', value = dict(matched = [0], 
+                                                 values = ['elem']))]
+            wait = WaitUntil(driver = self.driver, timeout = 10,
+                             in_browser = True)
+
+            self.assertEqual(wait.presence_of_element_located(id = 'a'), 
+                             'elem')
+            self.assertEqual(self.driver.execute_async_script.call_count, 4)
+            self.assertEqual(
+                self.driver.execute_async_script.call_args[0][-1], 10)
+
+    def test_timeout(self):
+        self.driver.execute_async_script.return_value = dict(
+                                                        status = 'timeout')
+        wait = WaitUntil(driver = self.driver, timeout = 0.01,
+                         in_browser = True)
+
+        with self.assertRaisesRegex(TimeoutException, 'gone'):
+            wait.presence_of_element_located(id = 'a', message = 'gone')
+
+    def test_script_error(self):
+        self.driver.execute_async_script.return_value = dict(
+                                        status = 'error', message = 'bad')
+        wait = WaitUntil(driver = self.driver, timeout = 10,
+                         in_browser = True)
+
+        with self.assertRaisesRegex(JavascriptException, 'bad'):
+            wait.presence_of_element_located(xpath = '//[')
+
+
+class Test_WaitUntilMultiCondition(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        global WaitUntil, WaitUntilNot, ConditionMatch, By, scripts
+        global FixedPolling
+
+        from genie.webdriver.wait import (WaitUntil, WaitUntilNot, 
+                                          ConditionMatch)
+        from genie.webdriver.polling import FixedPolling
+        from genie.webdriver import scripts
+        from selenium.webdriver.common.by import By
+
+    def setUp(self):
+        self.driver = Mock()
+        self.conditions = (
+            ('visibility_of_element_located', (By.ID, 'success')),
+            ('visibility_of_element_located', {'css': '.toast'}))
+        self.specs = [['visibility', By.ID, 'success'],
+                      ['visibility', By.CSS_SELECTOR, '.toast']]
+
+    def test_any_of(self):
+        self.driver.execute_script.return_value = dict(matched = [1],
+                                                       values = [None, 'e'])
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+        result = wait.any_of(*self.conditions, timeout = 1)
+
+        self.assertEqual(result, ConditionMatch((1,), (None, 'e')))
+        self.driver.execute_script.assert_called_once_with(
+                                    scripts.EVALUATE, self.specs, 'any', False)
+
+    def test_all_of(self):
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            poller().until.return_value = dict(matched = [0, 1],
+                                            values = ['a', 'b'])
+            wait = WaitUntil(driver = self.driver, timeout = 10)
+            result = wait.all_of(*self.conditions, message = 'boom')
+
+            self.assertEqual(result.fired, (0, 1))
+            self.assertEqual(result.elements, ('a', 'b'))
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = ANY, counters = ANY)
+
+            # condition evaluates all specs in one script call
+            condition, message = poller().until.call_args[0]
+            self.assertEqual(message, 'boom')
+            condition(self.driver)
+            self.driver.execute_script.assert_called_once_with(
+                                    scripts.EVALUATE, self.specs, 'all', False)
+
+    def test_until_not(self):
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            poller().until.return_value = dict(matched = [0, 1], 
+                                            values = [True, True])
+            wait = WaitUntilNot(driver = self.driver, timeout = 10)
+            wait.any_of(*self.conditions)
+
+            # negation happens in-browser, still polls using until(). None
+            # of the conditions holding is all of the negated checks holding
+            self.assertFalse(poller().until_not.called)
+            condition, message = poller().until.call_args[0]
+            condition(self.driver)
+            self.driver.execute_script.assert_called_once_with(
+                                    scripts.EVALUATE, self.specs, 'all', True)
+
+    def test_until_not_combined(self):
+        # browser stub evaluating check_all() over per-poll element states
+        states = iter([[True, True], [False, True], [True, False], 
+                       [False, False]])
+        polls = []
+
+        def execute_script(script, specs, mode, negate):
+            held = next(states)
+            polls.append(held)
+            values = [None if state is negate else True for state in held]
+            matched = [i for i, value in enumerate(values) if value]
+            holds = (len(matched) > 0 if mode == 'any' 
+                     else len(matched) == len(specs))
+
+            return dict(matched = matched, values = values) if holds else None
+
+        self.driver.execute_script.side_effect = execute_script
+        wait = WaitUntilNot(driver = self.driver, timeout = 10, 
+                            poll_strategy = FixedPolling(0.001))
+
+        # waits until neither condition holds
+        result = wait.any_of(*self.conditions)
+        self.assertEqual(len(polls), 4)
+        self.assertEqual(result, ConditionMatch((0, 1), (True, True)))
+
+        # waits until not all conditions hold
+        states = iter([[True, True], [True, False]])
+        polls.clear()
+        result = wait.all_of(*self.conditions)
+        self.assertEqual(len(polls), 2)
+        self.assertEqual(result, ConditionMatch((1,), (None, True)))
+
+    def test_in_browser(self):
+        self.driver.execute_async_script.return_value = dict(
+                status = 'ok', value = dict(matched = [0], 
+                                            values = ['a', None]))
+        wait = WaitUntil(driver = self.driver, timeout = 10, 
+                         in_browser = True)
+
+        with patch('genie.webdriver.wait.time.monotonic', return_value = 0):
+            result = wait.any_of(*self.conditions, timeout = 3)
+
+        self.assertEqual(result, ConditionMatch((0,), ('a', None)))
+        self.assertFalse(self.driver.execute_script.called)
+        self.driver.execute_async_script.assert_called_once_with(
+                            scripts.OBSERVE, self.specs, 'any', False, 3000)
+
+    def test_all_of_ready_state(self):
+        self.driver.execute_script.return_value = dict(
+                                                matched = [0, 1, 2],
+                                                values = ['a', 'b', True])
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+        result = wait.all_of(*self.conditions, ready_state = 'interactive',
+                             timeout = 1)
+
+        # the document check is left out of the match
+        self.assertEqual(result, ConditionMatch((0, 1), ('a', 'b')))
+        self.driver.execute_script.assert_called_once_with(
+                scripts.EVALUATE, 
+                self.specs + [['document', None, 'interactive']], 
+                'all', False)
+
+        # no condition needed along with a ready_state
+        self.driver.execute_script.return_value = dict(matched = [0],
+                                                       values = [True])
+        result = wait.all_of(ready_state = 'complete', timeout = 1)
+        self.assertEqual(result, ConditionMatch((), ()))
+
+    def test_invalid(self):
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+
+        with self.assertRaises(ValueError):
+            wait.any_of()
+
+        with self.assertRaises(ValueError):
+            wait.all_of(('title_is', (By.ID, 'a')))
+
+        with self.assertRaises(ValueError):
+            wait.all_of(ready_state = 'done')
+
+        with self.assertRaises(ValueError):
+            WaitUntilNot(driver = self.driver, 
+                         timeout = 10).all_of(ready_state = 'complete')
+
+
+class Test_WaitUntilPollStrategy(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        global Wait, WaitUntil, WaitUntilNot, polling
+
+        from genie.webdriver.wait import Wait, WaitUntil, WaitUntilNot
+        from genie.webdriver import polling
+
+    def setUp(self):
+        self.driver = Mock()
+        self.strategy = polling.FixedPolling(0.2)
+
+    def test_init(self):
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+        self.assertIsNone(wait.poll_strategy)
+        self.assertIsInstance(wait.counters, polling.PollCounters)
+
+        wait = Wait(driver = self.driver, timeout = 10, 
+                    poll_strategy = self.strategy)
+        self.assertIs(wait.until.poll_strategy, self.strategy)
+        self.assertIs(wait.until_not.poll_strategy, self.strategy)
+        self.assertIs(wait.until.counters, wait.counters)
+        self.assertIs(wait.until_not.counters, wait.counters)
+
+    def test_call(self):
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            wait = WaitUntil(driver = self.driver, timeout = 10,
+                             poll_strategy = self.strategy)
+            wait(object, message = 'lalala', poll_frequency = 1)
+
+            poller.assert_called_with(driver = self.driver, timeout = 10,
+                                      strategy = self.strategy,
+                                      counters = wait.counters,
+                                      poll_frequency = 1)
+            poller().until.assert_called_with(object, 'lalala')
+
+            # default strategy
+            wait = WaitUntil(driver = self.driver, timeout = 10)
+            wait(object)
+
+            self.assertIsInstance(poller.call_args[1]['strategy'],
+                                  polling.FixedPolling)
+
+    def test_per_call_strategy(self):
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            wait = WaitUntilNot(driver = self.driver, timeout = 10)
+            wait.title_is('abc', poll_strategy = self.strategy, 
+                          timeout = 3)
+
+            poller.assert_called_with(driver = self.driver, timeout = 3,
+                                      strategy = self.strategy,
+                                      counters = wait.counters)
+            self.assertTrue(poller().until_not.called)
+
+    def test_counters(self):
+        self.driver.title = 'abc'
+
+        wait = Wait(driver = self.driver, timeout = 10,
+                    poll_strategy = self.strategy)
+        wait.until.title_is('abc')
+        wait.until_not.title_is('xyz')
+
+        self.assertEqual(wait.counters.waits, 2)
+        self.assertEqual(wait.counters.polls, 2)
+        self.assertEqual(wait.counters.last, 1)
+
+    def test_default_counters(self):
+        self.driver.title = 'abc'
+
+        # polls are counted without any poll strategy or recorder too
+        wait = Wait(driver = self.driver, timeout = 10)
+        wait.until.title_is('abc')
+
+        self.assertEqual(wait.counters.waits, 1)
+        self.assertEqual(wait.counters.polls, 1)
+
+    def test_in_browser_counters(self):
+        self.driver.execute_async_script.side_effect = [
+            dict(status = 'timeout'),
+            dict(status = 'ok', value = dict(matched = [0], values = [1]))]
+
+        with patch('genie.webdriver.wait.IN_BROWSER_SLICE', 0.01):
+            wait = WaitUntil(driver = self.driver, timeout = 10,
+                             in_browser = True)
+            wait.presence_of_element_located(id = 'abc')
+
+        self.assertEqual(wait.counters.waits, 1)
+        self.assertEqual(wait.counters.last, 2)
+
+
+class Test_ImplicitWait(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Wait, ImplicitWait
+
+        from genie.webdriver.wait import Wait, ImplicitWait
+
+    def setUp(self):
+        self.driver = Mock()
+
+    def test_of(self):
+        state = ImplicitWait.of(self.driver)
+
+        self.assertIs(ImplicitWait.of(self.driver), state)
+        self.assertIsNot(ImplicitWait.of(Mock()), state)
+        self.assertIsNone(state.timeout)
+
+        # not weak referenceable
+        self.assertIsInstance(ImplicitWait.of(1), ImplicitWait)
+
+    def test_set(self):
+        state = ImplicitWait.of(self.driver)
+        state.set(self.driver, 10)
+        state.set(self.driver, 10)
+
+        self.driver.implicitly_wait.assert_called_once_with(10)
+        self.assertEqual(state.timeout, 10)
+
+    def test_override(self):
+        state = ImplicitWait.of(self.driver)
+        state.set(self.driver, 10)
+
+        with state.override(self.driver, 0):
+            self.assertEqual(state.timeout, 0)
+            self.driver.implicitly_wait.assert_called_with(0)
+
+        self.assertEqual(state.timeout, 10)
+        self.driver.implicitly_wait.assert_called_with(10)
+
+    def test_override_unknown(self):
+        state = ImplicitWait.of(self.driver)
+
+        with self.assertRaises(ValueError):
+            with state.override(self.driver, 0):
+                raise ValueError()
+
+        # previous value unknown: left as is
+        self.driver.implicitly_wait.assert_called_once_with(0)
+
+    def test_wait_call(self):
+        wait = Wait(driver = self.driver, timeout = 10)
+        wait()
+        wait(10)
+        Wait(driver = self.driver, timeout = 10)(10)
+
+        self.driver.implicitly_wait.assert_called_once_with(10)
+        self.assertEqual(wait.implicit_timeout, 10)
+
+        wait(5)
+        self.driver.implicitly_wait.assert_called_with(5)
+        self.assertEqual(wait.implicit_timeout, 5)
+
+    def test_no_implicit_wait(self):
+        wait = Wait(driver = self.driver, timeout = 10)
+        wait()
+
+        with wait.no_implicit_wait():
+            self.assertEqual(wait.implicit_timeout, 0)
+
+        with wait.implicitly(3):
+            self.assertEqual(wait.implicit_timeout, 3)
+
+        self.assertEqual(wait.implicit_timeout, 10)
+        self.assertEqual([c.args for c in 
+                          self.driver.implicitly_wait.call_args_list],
+                         [(10,), (0,), (10,), (3,), (10,)])
+
+    def test_explicit_waits(self):
+        timeouts = []
+        self.driver.title = 'abc'
+
+        def find_element(*args):
+            timeouts.append(wait.implicit_timeout)
+            return Mock()
+
+        self.driver.find_element.side_effect = find_element
+
+        wait = Wait(driver = self.driver, timeout = 10)
+        wait()
+
+        wait.until.presence_of_element_located(id = 'abc')
+        wait.until_not.title_is('xyz')
+
+        self.assertEqual(timeouts, [0])
+        self.assertEqual(wait.implicit_timeout, 10)
+        self.assertEqual([c.args for c in 
+                          self.driver.implicitly_wait.call_args_list],
+                         [(10,), (0,), (10,), (0,), (10,)])
+
+    def test_explicit_waits_untracked(self):
+        self.driver.title = 'abc'
+
+        wait = Wait(driver = self.driver, timeout = 10)
+        wait.until.title_is('abc')
+
+        self.assertFalse(self.driver.implicitly_wait.called)
+
+
+class Test_Deadline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        global Wait, WaitUntil, Deadline, TimeoutException
+
+        from genie.webdriver.wait import Wait, WaitUntil, Deadline
+        from selenium.common.exceptions import TimeoutException
+
+    def setUp(self):
+        self.driver = Mock()
+
+    def test_context(self):
+        self.assertIsNone(Deadline.current())
+
+        with Deadline(15) as outer:
+            self.assertIs(Deadline.current(), outer)
+            self.assertFalse(outer.expired)
+            self.assertLessEqual(outer.remaining, 15)
+
+            with Deadline(60) as inner:
+                self.assertIs(Deadline.current(), inner)
+                # never extends the outer budget
+                self.assertEqual(inner.end, outer.end)
+
+            with Deadline(5) as inner:
+                self.assertLess(inner.end, outer.end)
+
+            self.assertIs(Deadline.current(), outer)
+
+        self.assertIsNone(Deadline.current())
+
+    def test_cap(self):
+        self.assertEqual(Deadline.cap(10), 10)
+
+        with Deadline(5):
+            self.assertLessEqual(Deadline.cap(10), 5)
+            self.assertEqual(Deadline.cap(1), 1)
+
+        with Deadline(0):
+            with self.assertRaises(TimeoutException):
+                Deadline.cap(10)
+
+    def test_waits_share_budget(self):
+        with patch('genie.webdriver.wait.polling.Poller') as poller:
+            wait = Wait(driver = self.driver, timeout = 10)
+
+            with Deadline(3):
+                wait.until.title_is('abc')
+                self.assertLessEqual(poller.call_args[1]['timeout'], 3)
+
+                wait.until_not.title_is('abc', timeout = 1)
+                self.assertEqual(poller.call_args[1]['timeout'], 1)
+
+            wait.until.title_is('abc')
+            self.assertEqual(poller.call_args[1]['timeout'], 10)
+
+    def test_fail_fast(self):
+        wait = Wait(driver = self.driver, timeout = 10)
+
+        with Deadline(0.05):
+            self.driver.title = 'xyz'
+            with self.assertRaises(TimeoutException):
+                wait.until.title_is('abc', poll_frequency = 0.01)
+
+            start = time.monotonic()
+            with self.assertRaises(TimeoutException):
+                wait.until.title_is('abc')
+            self.assertLess(time.monotonic() - start, 0.05)
+
+            with self.assertRaises(TimeoutException):
+                wait.until.presence_of_element_located(id = 'abc',
+                                                       in_browser = True)
+
+        self.assertFalse(self.driver.execute_async_script.called)
+
+
+class Test_WaitUntilQuiet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        global WaitUntil, WaitUntilNot, scripts, TimeoutException
+
+        from genie.webdriver.wait import WaitUntil, WaitUntilNot
+        from genie.webdriver import scripts
+        from selenium.common.exceptions import TimeoutException
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.execute_async_script.return_value = dict(status = 'ok',
+                                                             value = True)
+
+    def test_network_idle(self):
+        # frozen clock: the time slice passed to the script is the timeout
+        with patch('genie.webdriver.wait.time.monotonic', return_value = 0),\
+             patch('genie.webdriver.wait.polling.Poller') as poller:
+            wait = WaitUntil(driver = self.driver, timeout = 10)
+
+            self.assertTrue(wait.network_idle())
+            self.driver.execute_async_script.assert_called_with(
+                            scripts.QUIET, 'network', 500, 0, False, 10000)
+
+            wait.network_idle(quiet_ms = 200, max_inflight = 2, timeout = 5,
+                              poll_frequency = 1)
+            self.driver.execute_async_script.assert_called_with(
+                            scripts.QUIET, 'network', 200, 2, False, 5000)
+
+            self.assertFalse(poller.called)
+
+    def test_dom_stable(self):
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+
+        with patch('genie.webdriver.wait.time.monotonic', return_value = 0):
+            self.assertTrue(wait.dom_stable(quiet_ms = 300))
+
+        self.driver.execute_async_script.assert_called_with(
+                            scripts.QUIET, 'dom', 300, 0, False, 10000)
+        self.assertEqual(wait.counters.last, 1)
+
+    def test_negate(self):
+        wait = WaitUntilNot(driver = self.driver, timeout = 10)
+
+        with patch('genie.webdriver.wait.time.monotonic', return_value = 0):
+            wait.network_idle()
+
+        self.driver.execute_async_script.assert_called_with(
+                            scripts.QUIET, 'network', 500, 0, True, 10000)
+
+    def test_timeout(self):
+        self.driver.execute_async_script.return_value = dict(
+                                                        status = 'timeout')
+
+        wait = WaitUntil(driver = self.driver, timeout = 0.01)
+
+        with self.assertRaises(TimeoutException):
+            wait.dom_stable(message = 'still busy')
+
+        self.assertEqual(wait.counters.timeouts, 1)
+
+
+class Test_WaitUntilCount(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        global WaitUntil, WaitUntilNot, By, scripts, TimeoutException
+        global FixedPolling
+
+        from genie.webdriver.wait import WaitUntil, WaitUntilNot
+        from genie.webdriver import scripts
+        from genie.webdriver.polling import FixedPolling
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import TimeoutException
+
+    def setUp(self):
+        self.driver = Mock()
+        self.driver.execute_script.return_value = dict(count = 3,
+                                                       elements = [])
+
+    def test_conditions(self):
+        operators = dict(number_of_elements_to_be = 'eq',
+                         number_of_elements_at_least = 'ge',
+                         number_of_elements_less_than = 'lt')
+
+        for method, op in operators.items():
+            wait = WaitUntil(driver = self.driver, timeout = 10)
+
+            self.assertEqual(getattr(wait, method)(3, css = 'tr'), 3)
+            self.driver.execute_script.assert_called_with(
+                        scripts.COUNT, By.CSS_SELECTOR, 'tr', op, 3, 0, False)
+
+            getattr(wait, method)(5, (By.ID, 'abc'), poll_frequency = 0.1)
+            self.driver.execute_script.assert_called_with(
+                        scripts.COUNT, By.ID, 'abc', op, 5, 0, False)
+
+    def test_return_elements(self):
+        elements = [Mock(), Mock()]
+        self.driver.execute_script.return_value = dict(count = 10000,
+                                                       elements = elements)
+
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+        result = wait.number_of_elements_at_least(100, css = 'tr',
+                                                  return_elements = 2)
+
+        self.assertEqual(result, elements)
+        self.driver.execute_script.assert_called_with(
+                        scripts.COUNT, By.CSS_SELECTOR, 'tr', 'ge', 100, 2, 
+                        False)
+
+    def test_polling(self):
+        self.driver.execute_script.side_effect = [None, None, 
+                                                  dict(count = 0, 
+                                                       elements = [])]
+
+        wait = WaitUntil(driver = self.driver, timeout = 10, 
+                         poll_strategy = FixedPolling(0.01))
+
+        self.assertEqual(wait.number_of_elements_to_be(0, css = 'tr'), 0)
+        self.assertEqual(wait.counters.last, 3)
+
+    def test_negate(self):
+        wait = WaitUntilNot(driver = self.driver, timeout = 10)
+
+        self.assertEqual(wait.number_of_elements_to_be(5, css = 'tr'), 3)
+        self.driver.execute_script.assert_called_with(
+                        scripts.COUNT, By.CSS_SELECTOR, 'tr', 'eq', 5, 0, True)
+
+    def test_timeout(self):
+        self.driver.execute_script.return_value = None
+
+        wait = WaitUntil(driver = self.driver, timeout = 0.01)
+
+        with self.assertRaises(TimeoutException):
+            wait.number_of_elements_less_than(1, css = 'tr', 
+                                              poll_frequency = 0.01)
+
+    def test_locator_required(self):
+        wait = WaitUntil(driver = self.driver, timeout = 10)
+
+        with self.assertRaises(ValueError):
+            wait.number_of_elements_to_be(1)
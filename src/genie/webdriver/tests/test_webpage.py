@@ -1,4 +1,5 @@
 import unittest
+import warnings
 from unittest.mock import patch, Mock
 
 from selenium.webdriver.common.by import By
@@ -25,7 +26,11 @@ class Test_WebPage(unittest.TestCase):
 
                 self.assertEqual(page.timeout, 10)
                 self.assertIs(page.driver, self.driver)
-                wait.assert_called_with(self.driver, 10)
+                wait.assert_called_with(self.driver, 10, in_browser = False,
+                                        poll_strategy = TestPage.POLL_STRATEGY,
+                                        recorder = None,
+                                        timings = None,
+                                        owner = page)
                 interact.assert_called_with(self.driver, 10)
                 self.assertEqual(page.url, '/lol')
 
@@ -115,3 +120,370 @@ class Test_WebPage(unittest.TestCase):
 
                 page.find_elements([1,2])
                 self.driver.find_elements.assert_called_with(1,2)
+
+    def test_deadline(self):
+        from genie.webdriver.wait import Deadline
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+
+        page = TestPage(self.driver)
+        deadline = page.deadline(15)
+
+        self.assertIsInstance(deadline, Deadline)
+        self.assertEqual(deadline.seconds, 15)
+
+    def test_element_cache(self):
+        from genie.webdriver.element import ElementCache
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+
+        page = TestPage(self.driver)
+        self.assertIsNone(page.element_cache)
+        page.open()
+        page.refresh()
+        self.driver.refresh.assert_called_with()
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+            ELEMENT_CACHE = True
+
+        page = TestPage(self.driver, base_url = 'http://abc')
+        self.assertIsInstance(page.element_cache, ElementCache)
+
+        for navigate, args in ((page.open, ()), 
+                               (page.get, ('http://efg',)),
+                               (page.back, ()),
+                               (page.forward, ()),
+                               (page.refresh, ())):
+            page.element_cache.set('descriptor', 'element')
+            navigate(*args)
+            self.assertEqual(len(page.element_cache), 0)
+
+        self.driver.get.assert_called_with('http://efg')
+        self.assertTrue(self.driver.back.called)
+        self.assertTrue(self.driver.forward.called)
+
+    def test_element_descriptors(self):
+        from genie.webdriver.element import TextBox, Button, PageElements
+
+        class BasePage(WebPage):
+            URL = '/testpage'
+            login = Button(id = 'login')
+            rows = PageElements(css = 'tr')
+
+        class TestPage(BasePage):
+            username = TextBox(id = 'username')
+            rows = None
+
+        self.assertEqual(WebPage.element_descriptors, {})
+        self.assertEqual(set(BasePage.element_descriptors), 
+                         {'login', 'rows'})
+        self.assertEqual(TestPage.element_descriptors,
+                         dict(login = BasePage.login, 
+                              username = TestPage.username))
+
+    def test_prefetch(self):
+        from genie.webdriver import scripts
+        from genie.webdriver.element import (TextBox, Button, Checkbox,
+                                             PageElements, Component)
+
+        class NavBar(Component):
+            pass
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+            login = Button(id = 'login')
+            remember = Checkbox(id = 'remember')
+            username = TextBox(id = 'username')
+            rows = PageElements(css = 'tr')
+            navbar = NavBar(id = 'nav')
+
+        login, nav, remember = Mock(), Mock(), Mock()
+        self.driver.execute_script.return_value = [
+                dict(element = login, ready = True),
+                dict(element = nav, ready = False),
+                dict(element = remember, ready = False),
+                None]
+
+        # cache disabled: located, but not cached
+        page = TestPage(self.driver)
+        prefetched = page.prefetch()
+
+        self.assertEqual(prefetched.found, ['login', 'navbar'])
+        self.assertIsNone(page.element_cache)
+        self.assertIs(page.navbar.root, nav)
+
+        TestPage.ELEMENT_CACHE = True
+        self.driver.execute_script.reset_mock()
+
+        page = TestPage(self.driver)
+        prefetched = page.prefetch()
+        self.driver.execute_script.assert_called_once_with(
+                scripts.PREFETCH, [[By.ID, 'login'], [By.ID, 'nav'], 
+                                   [By.ID, 'remember'], [By.ID, 'username']])
+
+        self.assertEqual(prefetched.found, ['login', 'navbar'])
+        self.assertEqual(prefetched.pending, ['remember'])
+        self.assertEqual(prefetched.missing, ['username'])
+
+        # seeded with ready elements only
+        self.assertIs(page.element_cache.get(TestPage.login), login)
+        self.assertIsNone(page.element_cache.get(TestPage.remember))
+        self.assertIs(page.login, login)
+        self.assertIs(page.navbar.root, nav)
+
+        self.driver.execute_script.return_value = [None]
+        self.assertEqual(page.prefetch(['username']).missing, ['username'])
+
+        with self.assertRaises(ValueError):
+            page.prefetch(['unknown'])
+
+    def test_open_prefetch(self):
+        class TestPage(WebPage):
+            URL = '/testpage'
+
+        with patch.object(TestPage, 'prefetch') as prefetch:
+            TestPage(self.driver).open()
+            self.assertFalse(prefetch.called)
+
+            TestPage.PREFETCH = True
+            TestPage(self.driver).open()
+            prefetch.assert_called_once_with()
+
+    def test_page_load_strategy(self):
+        from genie.webdriver import scripts
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+            PAGE_LOAD_STRATEGY = 'eager'
+
+        # the session waits for complete documents: warned, nothing to wait
+        self.driver.capabilities = dict(pageLoadStrategy = 'normal')
+        page = TestPage(self.driver)
+        page.wait.until = Mock()
+
+        with self.assertWarnsRegex(RuntimeWarning, "'eager'.*'normal'"):
+            page.open()
+
+        self.driver.get.assert_called_once_with('/testpage')
+        self.assertFalse(page.wait.until.all_of.called)
+
+        # matching session: waits for the document state itself
+        self.driver.capabilities = dict(pageLoadStrategy = 'eager')
+        page.wait.until.reset_mock()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            page.open()
+
+        self.assertFalse(self.driver.execute_script.called)
+        page.wait.until.all_of.assert_called_once_with(
+                                            ready_state = 'interactive',
+                                            timeout = None,
+                                            message = 'TestPage not ready')
+
+        # faster session: normal pages wait for the complete document, and
+        # the document being left is marked first
+        class NormalPage(WebPage):
+            URL = '/normal'
+
+        self.driver.capabilities = dict(pageLoadStrategy = 'none')
+        page = NormalPage(self.driver)
+        page.wait.until = Mock()
+        page.open()
+
+        self.driver.execute_script.assert_called_once_with(scripts.LEAVE,
+                                                           '/normal')
+        self.driver.get.assert_called_with('/normal')
+        page.wait.until.all_of.assert_called_once_with(
+                                            ready_state = 'complete',
+                                            timeout = None,
+                                            message = 'NormalPage not ready')
+
+        with self.assertRaises(ValueError):
+            class BadPage(WebPage):
+                URL = '/testpage'
+                PAGE_LOAD_STRATEGY = 'lazy'
+
+    def test_ready(self):
+        class TestPage(WebPage):
+            URL = '/testpage'
+            READY = [(By.ID, 'table'),
+                     {'css': '.toolbar'},
+                     ('invisibility_of_element_located', {'css': '.spinner'})]
+
+        page = TestPage(self.driver)
+        self.assertEqual(page.ready_conditions(), [
+            ('visibility_of_element_located', (By.ID, 'table')),
+            ('visibility_of_element_located', {'css': '.toolbar'}),
+            ('invisibility_of_element_located', {'css': '.spinner'})])
+
+        page.wait.until = Mock()
+        with page:
+            self.driver.get.assert_called_once_with('/testpage')
+            page.wait.until.all_of.assert_called_once_with(
+                                            *page.ready_conditions(),
+                                            ready_state = None,
+                                            timeout = None,
+                                            message = 'TestPage not ready')
+
+        # nothing to wait for
+        class PlainPage(WebPage):
+            URL = '/testpage'
+
+        page = PlainPage(self.driver)
+        page.wait.until = Mock()
+        self.assertIsNone(page.wait_until_ready())
+        self.assertFalse(page.wait.until.all_of.called)
+
+    def test_load_timing(self):
+        from genie.webdriver import telemetry
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+
+        with patch.object(TestPage, 'collect_load_timing') as collect:
+            TestPage(self.driver).open()
+            self.assertFalse(collect.called)
+
+            TestPage.LOAD_TIMING = True
+            TestPage(self.driver).open()
+            collect.assert_called_once_with()
+
+        recorder = telemetry.LoadRecorder()
+        TestPage.LOAD_RECORDER = recorder
+        self.driver.execute_script.return_value = dict(
+                    navigation = None, 
+                    resources = dict(count = 0, transfer_size = 0,
+                                     slowest = []))
+
+        page = TestPage(self.driver)
+        self.assertIsNone(page.load_timing)
+        page.open()
+
+        self.assertEqual(page.load_timing.page, 
+                         'Test_WebPage.test_load_timing.<locals>.TestPage')
+        self.assertEqual(recorder.stats[page.load_timing.page].loads, 1)
+
+    def test_open_reuse(self):
+        class TestPage(WebPage):
+            URL = '/testpage'
+            LOAD_TIMING = True
+
+        page = TestPage(self.driver, base_url = 'http://a/')
+        page.element_cache = Mock()
+        page.wait.until = Mock()
+        page.collect_load_timing = Mock()
+
+        self.driver.current_url = 'http://a/testpage'
+        page.open(reuse = True)
+
+        # already loaded: nothing loaded, invalidated nor collected
+        self.assertFalse(self.driver.get.called)
+        self.assertFalse(page.element_cache.invalidate.called)
+        self.assertFalse(page.collect_load_timing.called)
+
+        self.driver.current_url = 'http://a/other'
+        TestPage.REUSE_LOADED = True
+        page.open()
+
+        self.driver.get.assert_called_once_with('http://a/testpage')
+        page.element_cache.invalidate.assert_called_once_with()
+        page.collect_load_timing.assert_called_once_with()
+
+        # root pages: browsers report normalized urls
+        class RootPage(WebPage):
+            URL = ''
+
+        page = RootPage(self.driver, base_url = 'https://a:443')
+        self.driver.current_url = 'https://a/'
+        self.driver.get.reset_mock()
+
+        page.open(reuse = True)
+        self.assertFalse(self.driver.get.called)
+
+    def test_open_spa(self):
+        from genie.webdriver import scripts
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+            SPA_NAVIGATION = True
+            READY = [(By.ID, 'table')]
+
+        page = TestPage(self.driver)
+        page.wait.until = Mock()
+
+        self.driver.execute_script.return_value = True
+        page.open()
+
+        # route changed, readiness still waited for
+        self.assertFalse(self.driver.get.called)
+        self.driver.execute_script.assert_called_once_with(scripts.ROUTE,
+                                                           '/testpage')
+        self.assertTrue(page.wait.until.all_of.called)
+
+        # other origin: regular page load
+        self.driver.execute_script.return_value = False
+        page.open()
+        self.driver.get.assert_called_once_with('/testpage')
+
+        self.driver.reset_mock()
+        page.open(spa = False)
+        self.assertFalse(self.driver.execute_script.called)
+        self.driver.get.assert_called_once_with('/testpage')
+
+    def test_snapshot(self):
+        from genie.webdriver import scripts
+        from genie.webdriver.element import Button
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+            login = Button(id = 'login')
+
+        page = TestPage(self.driver)
+        self.driver.execute_script.return_value = dict(text = 'abc')
+
+        page.snapshot('login', fields = ('enabled',))
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, [By.ID, 'login'], ['enabled'], [])
+
+        page.snapshot(id = 'abc', fields = ('text',))
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, [By.ID, 'abc'], ['text'], [])
+
+        page.snapshot((By.CSS_SELECTOR, 'a'), fields = ('text',),
+                      attributes = ('href',))
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, [By.CSS_SELECTOR, 'a'], ['text'], ['href'])
+
+        element = Mock()
+        page.snapshot(element, fields = ('text',))
+        self.driver.execute_script.assert_called_with(
+                scripts.SNAPSHOT, element, ['text'], [])
+
+        with self.assertRaises(TypeError):
+            page.snapshot('snapshot')
+
+        with self.assertRaises(AttributeError):
+            page.snapshot('missing')
+
+    def test_ensure(self):
+        from genie.webdriver import scripts
+        from genie.webdriver.element import Checkbox
+
+        class TestPage(WebPage):
+            URL = '/testpage'
+            remember = Checkbox(id = 'remember')
+
+        page = TestPage(self.driver)
+        self.driver.execute_script.return_value = dict(changed = True,
+                                                       value = True)
+
+        self.assertTrue(page.ensure('remember', True))
+        self.driver.execute_script.assert_called_with(
+                scripts.ENSURE, [By.ID, 'remember'], 'checkbox', True)
+
+        with self.assertRaises(TypeError):
+            page.ensure('ensure', True)
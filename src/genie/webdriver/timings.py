@@ -0,0 +1,180 @@
+import os
+import math
+import json
+from collections import deque, namedtuple
+
+# learned wait settings for one (page, condition, locator)
+Suggestion = namedtuple('Suggestion', ['timeout', 'poll_interval'])
+
+FORMAT_VERSION = 1
+
+
+def percentile(samples, ratio):
+    '''nearest-rank percentile of samples (ratio in 0..1)'''
+    ordered = sorted(samples)
+    index = max(math.ceil(ratio * len(ordered)) - 1, 0)
+
+    return ordered[index]
+
+
+def learnable(locator):
+    '''whether a wait target description identifies the same thing across
+    runs: web elements (described as '<WebElement>') do not.'''
+    return locator is not None and not locator.startswith('<')
+
+
+class TimingStore(object):
+    '''
+    Time-to-satisfy samples of waits, keyed by page class, condition and
+    locator, deriving per-locator timeout and poll interval suggestions from
+    their p99 latency. Optionally persisted to a json file between runs.
+
+    When provided to Wait() objects (or WebPage.WAIT_TIMINGS), waits record
+    their time-to-satisfy into the store, and use its suggestion whenever
+    the caller does not pass an explicit timeout. Waits timing out under a
+    learned timeout are fed back (see record_timeout()), so that learned 
+    timeouts grow back when the application slows down.
+
+    Arguments
+        path (str): json file to load samples from/save them to
+        window (int): number of most recent samples kept per locator
+        min_samples (int): samples needed before suggesting anything
+        margin (float): suggested timeout is p99 * margin
+        minimum (float): minimum suggested timeout (seconds)
+        maximum (float): maximum suggested timeout (seconds), if any
+
+    Example:
+        store = TimingStore('wait_timings.json')
+        WebPage.WAIT_TIMINGS = store
+
+        # ... run the tests ...
+
+        store.save()
+    '''
+
+    def __init__(self, path = None, window = 100, min_samples = 10,
+                 margin = 2.0, minimum = 1.0, maximum = None):
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self.margin = margin
+        self.minimum = minimum
+        self.maximum = maximum
+        self.samples = {}
+        self.floors = {}
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def record(self, page, condition, locator, elapsed):
+        '''record the time-to-satisfy (seconds) of a single wait'''
+        if not learnable(locator):
+            return
+
+        key = (page, condition, locator)
+
+        try:
+            samples = self.samples[key]
+        except KeyError:
+            samples = self.samples[key] = deque(maxlen = self.window)
+
+        samples.append(elapsed)
+
+    def record_timeout(self, page, condition, locator, elapsed):
+        '''record a wait that timed out after elapsed seconds under a learned
+        timeout. Its actual time-to-satisfy is longer than elapsed: elapsed 
+        is kept as a (censored) sample, and the timeouts suggested for this
+        wait no longer go below elapsed * margin.'''
+        if not learnable(locator):
+            return
+
+        self.record(page, condition, locator, elapsed)
+
+        key = (page, condition, locator)
+        self.floors[key] = max(self.floors.get(key, 0), 
+                               elapsed * self.margin)
+
+    def p99(self, page, condition, locator):
+        '''p99 time-to-satisfy, None if not enough samples'''
+        samples = self.samples.get((page, condition, locator), ())
+
+        if len(samples) < self.min_samples:
+            return None
+
+        return percentile(samples, 0.99)
+
+    def suggest(self, page, condition, locator):
+        '''return the learned Suggestion(timeout, poll_interval) for a wait,
+        None if there is not enough samples yet.
+
+        The timeout is the p99 latency times margin (bounded by minimum and
+        maximum), raised by any timeout under a previous suggestion (see
+        record_timeout()), and the poll interval a tenth of the p99 latency,
+        between 50ms and 1s: fast locators get polled often, slow ones 
+        rarely.
+        '''
+        p99 = self.p99(page, condition, locator)
+
+        if p99 is None:
+            return None
+
+        timeout = max(p99 * self.margin, self.minimum,
+                      self.floors.get((page, condition, locator), 0))
+        if self.maximum is not None:
+            timeout = min(timeout, self.maximum)
+
+        return Suggestion(timeout, min(max(p99 / 10, 0.05), 1.0))
+
+    def reset(self):
+        self.samples.clear()
+        self.floors.clear()
+
+    def to_dict(self):
+        timings = []
+
+        for key, samples in self.samples.items():
+            page, condition, locator = key
+            timing = dict(page = page, condition = condition, 
+                          locator = locator, samples = list(samples))
+
+            # timeouts fed back outlive the samples window
+            if key in self.floors:
+                timing['floor'] = self.floors[key]
+
+            timings.append(timing)
+
+        return dict(version = FORMAT_VERSION, timings = timings)
+
+    def load(self, path = None):
+        '''load (merge) samples and timeout floors from a json file saved by
+        save()'''
+        with open(path or self.path) as f:
+            data = json.load(f)
+
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError('Unsupported timing store format version: %s'
+                             % data.get('version'))
+
+        for timing in data['timings']:
+            key = (timing['page'], timing['condition'], timing['locator'])
+
+            for elapsed in timing['samples']:
+                self.record(*key, elapsed)
+
+            if 'floor' in timing:
+                self.floors[key] = max(self.floors.get(key, 0), 
+                                       timing['floor'])
+
+    def save(self, path = None):
+        '''write all samples and timeout floors as json to path (defaults 
+        to self.path)'''
+        path = path or self.path
+        if not path:
+            raise ValueError('No path to save the timing store to')
+
+        # write then rename: an interrupted run never corrupts the store
+        temp = '%s.%s.tmp' % (path, os.getpid())
+        with open(temp, 'w') as f:
+            json.dump(self.to_dict(), f, indent = 4)
+
+        os.replace(temp, path)
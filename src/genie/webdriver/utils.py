@@ -1,3 +1,5 @@
+from urllib.parse import urlsplit, urlunsplit
+
 from selenium.webdriver.common.by import By
 
 # mapping for converting func(By.ID, 'value') to func(id = value)
@@ -17,6 +19,13 @@ LOCATOR_MAPPING = dict(id = By.ID,
 
 LOCATOR_MAPPING_SET = set(LOCATOR_MAPPING.keys())
 
+# locator strategy of nested (component) locators: (CHAIN, chain), resolved
+# by the injected scripts, see scripts.FIND_ELEMENTS_JS
+CHAIN = 'chain'
+
+# ports left out of urls by browsers, see normalize_url()
+DEFAULT_PORTS = dict(http = 80, https = 443)
+
 
 def kwarg_to_locator(**kwargs):
     '''basic function to translate id='name' style into (By.ID, 'name')
@@ -98,4 +107,33 @@ def translate_args_with_passthru(locator = None, **kwargs):
     # convert locator kwarg to locator object
     locator = LOCATOR_MAPPING[key], kwargs.pop(key)
 
-    return locator, kwargs
\ No newline at end of file
+    return locator, kwargs
+
+def normalize_url(url):
+    '''normalize a url the way browsers report it (eg, driver.current_url),
+    so that urls can be compared: lower case scheme and host, no default 
+    port, and '/' for an empty path.
+
+    Examples:
+        normalize_url('HTTPS://Host:443') == 'https://host/'
+
+    Argument:
+        url (str): absolute url
+
+    Returns:
+        normalized url (str)
+    '''
+    parts = urlsplit(url)
+    scheme, netloc = parts.scheme.lower(), parts.netloc.lower()
+
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+
+    if port is not None and port == DEFAULT_PORTS.get(scheme):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parts.path or ('/' if netloc else '')
+
+    return urlunsplit((scheme, netloc, path, parts.query, parts.fragment))
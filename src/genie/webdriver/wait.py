@@ -1,7 +1,169 @@
-from selenium.webdriver.support.ui import WebDriverWait
+import time
+import weakref
+import contextvars
+from contextlib import contextmanager, nullcontext
+from collections import namedtuple
+
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, JavascriptException
+
+from . import utils, scripts, polling, telemetry
+
+# condition methods that have an equivalent check that can be evaluated
+# inside the browser (see scripts.CHECK_JS)
+IN_BROWSER_CHECKS = {
+    'presence_of_element_located': 'presence',
+    'visibility_of_element_located': 'visibility',
+    'element_to_be_clickable': 'clickable',
+    'invisibility_of_element_located': 'invisibility',
+}
+
+# max seconds a single in-browser wait script is allowed to run. Longer waits
+# are split into multiple scripts, keeping each one well below selenium's
+# default 30s script timeout.
+IN_BROWSER_SLICE = 10
+
+# document.readyState values, in loading order. WaitUntil.all_of() can
+# require the document to have reached one of them (ready_state)
+READY_STATES = ('loading', 'interactive', 'complete')
+
+# result of WaitUntil.any_of()/all_of():
+#   fired: indexes of the conditions that were met
+#   elements: per-condition result (element, True or None when not met)
+ConditionMatch = namedtuple('ConditionMatch', ['fired', 'elements'])
+
+# innermost active Deadline of the current thread/asyncio task
+_deadline = contextvars.ContextVar('genie.webdriver.deadline', default = None)
+
+
+class Deadline(object):
+    '''
+    Time budget shared by all waits within its context: while active, every
+    WaitUntil/WaitUntilNot call waits at most for the remaining budget, and
+    fails immediately with TimeoutException once it ran out. Deadlines can
+    be nested: an inner deadline never extends its outer one.
+
+    Arguments
+        seconds (float): total time budget
+
+    Example:
+        with Deadline(15):
+            page.search_box = 'cisco'
+            page.search_button.click()
+    '''
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.end = None
+        self._token = None
+
+    def __enter__(self):
+        self.end = time.monotonic() + self.seconds
+
+        outer = _deadline.get()
+        if outer is not None:
+            self.end = min(self.end, outer.end)
+
+        self._token = _deadline.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        _deadline.reset(self._token)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        return self.__exit__(exc_type, exc_value, exc_tb)
+
+    @property
+    def remaining(self):
+        '''seconds left in this budget'''
+        return max(self.end - time.monotonic(), 0)
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.end
+
+    @staticmethod
+    def current():
+        '''return the innermost active deadline, if any'''
+        return _deadline.get()
+
+    @classmethod
+    def check(cls):
+        '''raise TimeoutException if the active deadline ran out'''
+        deadline = cls.current()
+
+        if deadline is not None and deadline.expired:
+            raise TimeoutException('deadline of %ss exceeded'
+                                   % deadline.seconds)
+
+    @classmethod
+    def cap(cls, timeout):
+        '''return timeout, reduced to the remaining budget of the active
+        deadline. Raises TimeoutException if it ran out.'''
+        cls.check()
+
+        deadline = cls.current()
+        if deadline is None:
+            return timeout
+
+        return min(timeout, deadline.remaining)
+
+
+class ImplicitWait(object):
+    '''
+    Tracks the implicit wait timeout currently active on a driver session, 
+    so that redundant implicitly_wait() commands can be skipped, and explicit
+    waits can temporarily disable it.
+
+    One instance is shared by all Wait/WaitUntil objects of the same driver,
+    see ImplicitWait.of(). timeout is None until set through this class:
+    implicit waits set directly on the driver are not tracked.
+    '''
+
+    # driver -> ImplicitWait
+    _sessions = weakref.WeakKeyDictionary()
+
+    def __init__(self):
+        self.timeout = None
+
+    @classmethod
+    def of(cls, driver):
+        '''return the implicit wait state shared by all users of driver'''
+        try:
+            return cls._sessions[driver]
+        except KeyError:
+            state = cls._sessions[driver] = cls()
+            return state
+        except TypeError:
+            # driver cannot be weak referenced: state is not shared
+            return cls()
+
+    def set(self, driver, timeout):
+        '''set the driver implicit wait, unless already active'''
+        if timeout == self.timeout:
+            return
+
+        result = driver.implicitly_wait(timeout)
+        self.timeout = timeout
+
+        return result
+
+    @contextmanager
+    def override(self, driver, timeout):
+        '''temporarily set the driver implicit wait to timeout, restoring the
+        previous value (if known) on exit.'''
+        previous = self.timeout
+        self.set(driver, timeout)
+
+        try:
+            yield
+        finally:
+            if previous is not None:
+                self.set(driver, previous)
 
-from . import utils
 
 class Wait(object):
     '''
@@ -21,17 +183,44 @@ class Wait(object):
         # using this wait class
         page = WebPage(driver)
         page.wait.until.element_to_be_clickable(id = 'someid', timeout = 10)
+
+    The implicit wait timeout of the driver is tracked (see ImplicitWait):
+    explicit waits temporarily disable it, so that negative checks never pay
+    the implicit timeout on top of their own.
     '''
 
-    def __init__(self, driver, timeout):
+    def __init__(self, driver, timeout, in_browser = False, 
+                 poll_strategy = None, recorder = None, timings = None,
+                 owner = None):
         self.driver = driver
         self.timeout = timeout
-        self.until = WaitUntil(driver, timeout)
-        self.until_not = WaitUntilNot(driver, timeout)
+        self.counters = polling.PollCounters()
+
+        until, until_not = self._waits()
+        self.until = until(driver, timeout, 
+                           in_browser = in_browser,
+                           poll_strategy = poll_strategy,
+                           counters = self.counters,
+                           recorder = recorder,
+                           timings = timings,
+                           owner = owner)
+        self.until_not = until_not(driver, timeout, 
+                                   in_browser = in_browser,
+                                   poll_strategy = poll_strategy,
+                                   counters = self.counters,
+                                   recorder = recorder,
+                                   timings = timings,
+                                   owner = owner)
+        self.implicit = ImplicitWait.of(driver)
+
+    def _waits(self):
+        '''the (until, until_not) classes of this wait'''
+        return WaitUntil, WaitUntilNot
 
     def __call__(self, timeout = None):
         '''allows the Wait() instance to be called as if it was just an inline
-        wait (implicitly_wait)
+        wait (implicitly_wait). The command is skipped when the driver already
+        uses that implicit wait timeout.
 
         Exmaple:
             page = WebPage(driver)
@@ -40,25 +229,462 @@ class Wait(object):
 
         timeout = timeout or self.timeout
 
-        return self.driver.implicitly_wait(timeout)
+        return self.implicit.set(self.driver, timeout)
+
+    @property
+    def implicit_timeout(self):
+        '''implicit wait timeout active on the driver (None if unknown)'''
+        return self.implicit.timeout
+
+    def implicitly(self, timeout):
+        '''context manager temporarily setting the implicit wait timeout
+
+        Example:
+            with page.wait.implicitly(2):
+                page.find_element(id = 'slow-widget')
+        '''
+        return self.implicit.override(self.driver, timeout)
+
+    def no_implicit_wait(self):
+        '''context manager temporarily disabling the implicit wait, eg: for
+        checking that elements are absent without paying the implicit wait
+        timeout.
+
+        Example:
+            with page.wait.no_implicit_wait():
+                assert not page.find_elements(css = '.error')
+        '''
+        return self.implicitly(0)
 
 
 class WaitUntil(object):
-    '''Class to allow users to perform a wait-until'''
+    '''Class to allow users to perform a wait-until
+
+    When in_browser is enabled, locator based conditions listed in
+    IN_BROWSER_CHECKS are evaluated inside the page by a single
+    execute_async_script() call that re-checks the condition on every DOM
+    mutation, instead of polling from python. All other conditions are 
+    polled from python. The mode can also be toggled per call by passing 
+    in_browser = True/False to the condition method.
+
+    When a poll_strategy (see polling module) is provided, python side polls
+    are spaced according to it instead of a fixed poll_frequency, and the
+    polls spent are accounted in counters (polling.PollCounters). The 
+    strategy can also be provided per call through the poll_strategy kwarg.
+
+    When a recorder (telemetry.WaitRecorder) is provided, every condition 
+    method call records its locator, elapsed time, polls spent, outcome and
+    the owner (page) class it came from.
+
+    When a timing store (timings.TimingStore) is provided, condition methods
+    record their time-to-satisfy into it, and use its learned timeout and
+    poll interval when called without an explicit timeout.
+    '''
 
+    # whether this instance waits for conditions to become false
+    negate = False
 
-    def __init__(self, driver, timeout):
+    def __init__(self, driver, timeout, in_browser = False, 
+                 poll_strategy = None, counters = None, recorder = None,
+                 timings = None, owner = None):
         self.driver = driver
         self.timeout = timeout
+        self.in_browser = in_browser
+        self.poll_strategy = poll_strategy
+        self.counters = counters or polling.PollCounters()
+        self.recorder = recorder
+        self.timings = timings
+        self.owner = owner
+        self.implicit = ImplicitWait.of(driver)
 
     def __call__(self, condition, timeout = None, message = '', **kwargs):
         '''same as WebDriverWait().until(), in a different argument form.'''
         
-        return WebDriverWait(driver = self.driver, 
-                             timeout = timeout or self.timeout, 
-                             **kwargs).until(condition, message)
+        with self._no_implicit_wait():
+            return self._waiter(timeout, kwargs).until(condition, message)
+
+    def _no_implicit_wait(self):
+        '''disable the driver implicit wait during an explicit wait, when one
+        is active: each poll would otherwise pay the implicit wait timeout.'''
+
+        if self.implicit.timeout:
+            return self.implicit.override(self.driver, 0)
+
+        return nullcontext()
+
+    def _waiter(self, timeout, kwargs):
+        '''build the python side wait object: a polling.Poller (drop-in
+        replacement of selenium's WebDriverWait), spacing polls according to
+        the poll strategy (default to FixedPolling()) and counting them into
+        self.counters.'''
+
+        strategy = kwargs.pop('poll_strategy', self.poll_strategy)
+        timeout = Deadline.cap(timeout or self.timeout)
+
+        return self._poller()(driver = self.driver, 
+                              timeout = timeout, 
+                              strategy = strategy or polling.FixedPolling(), 
+                              counters = self.counters, 
+                              **kwargs)
+
+    def _poller(self):
+        '''the polling.Poller class of this wait'''
+        return polling.Poller
+
+    def _located(self, name, locator, condition, kwargs):
+        '''dispatch a locator based condition either to the in-browser wait
+        engine or to the regular python polling __call__().'''
+
+        if kwargs.pop('in_browser', self.in_browser):
+            by, value = locator
+            specs = [[IN_BROWSER_CHECKS[name], by, value]]
 
+            return self._observe(specs, 'all', **kwargs)['values'][0]
 
+        return self(condition, **kwargs)
+
+    def _observe(self, specs, mode, timeout = None, message = '', **kwargs):
+        '''wait for in-browser checks to hold using scripts.OBSERVE, and
+        return the check results.
+        
+        Arguments
+            specs (list): [check, by, value] lists, check being one of
+                          IN_BROWSER_CHECKS values
+            mode (str): 'all' or 'any' of the specs must hold
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+            kwargs (dict): python polling arguments, not used in-browser
+        '''
+        return self._run_in_browser(scripts.OBSERVE,
+                                    (specs, mode, self.negate),
+                                    timeout, message)
+
+    def _run_in_browser(self, script, args, timeout = None, message = ''):
+        '''run an in-browser wait script until it resolves, and return its
+        value. 
+
+        The script is called with args followed by its time slice (ms), and
+        must resolve with {status: 'ok', value: ...}, {status: 'timeout'} or
+        {status: 'error', message: ...}. Long waits are split into slices of
+        IN_BROWSER_SLICE seconds, staying under the driver script timeout.
+
+        Each script executed is accounted as a poll in self.counters.
+        '''
+        end_time = time.monotonic() + Deadline.cap(timeout or self.timeout)
+        polls = 0
+
+        while True:
+            polls += 1
+            remaining = max(end_time - time.monotonic(), 0)
+            slice_ms = round(min(remaining, IN_BROWSER_SLICE) * 1000)
+
+            try:
+                result = self.driver.execute_async_script(script, *args,
+                                                          slice_ms)
+            except (JavascriptException, TimeoutException):
+                # page navigated away/reloaded while waiting, or the script
+                # outlived the driver script timeout: try again until the
+                # overall timeout is reached.
+                result = None
+
+            if result and result.get('status') == 'ok':
+                self.counters.record(polls)
+                return result['value']
+
+            if result and result.get('status') == 'error':
+                self.counters.record(polls)
+                raise JavascriptException(result.get('message'))
+
+            if time.monotonic() >= end_time:
+                self.counters.record(polls, timed_out = True)
+                raise TimeoutException(message)
+
+    def _quiet(self, kind, quiet_ms, max_inflight, kwargs):
+        '''wait for in-browser network/dom activity to quiet down, using
+        scripts.QUIET'''
+
+        # python polling arguments are not used in-browser
+        kwargs.pop('in_browser', None)
+        timeout = kwargs.pop('timeout', None)
+        message = kwargs.pop('message', '')
+
+        return self._run_in_browser(scripts.QUIET,
+                                    (kind, quiet_ms, max_inflight,
+                                     self.negate),
+                                    timeout, message)
+
+    def _specs(self, conditions, ready_state = None):
+        '''convert (method, locator) conditions into in-browser check specs,
+        followed by a document check when a ready_state is given'''
+
+        if not conditions and ready_state is None:
+            raise ValueError('Must provide at least one condition')
+
+        specs = []
+        for name, locator in conditions:
+            if name not in IN_BROWSER_CHECKS:
+                raise ValueError("Unsupported condition '%s', must be one of: "
+                                 "%s" % (name, list(IN_BROWSER_CHECKS)))
+
+            if isinstance(locator, dict):
+                locator = utils.translate_arguments(**locator)
+
+            by, value = locator
+            specs.append([IN_BROWSER_CHECKS[name], by, value])
+
+        if ready_state is not None:
+            if ready_state not in READY_STATES:
+                raise ValueError("Unsupported ready_state '%s', must be one "
+                                 "of: %s" % (ready_state, list(READY_STATES)))
+            if self.negate:
+                raise ValueError('ready_state cannot be negated')
+
+            specs.append(['document', None, ready_state])
+
+        return specs
+
+    @staticmethod
+    def _matched(result, conditions):
+        '''build the ConditionMatch of conditions out of a check_all() 
+        result, leaving out the document check'''
+
+        count = len(conditions)
+
+        return ConditionMatch(tuple(i for i in result['matched'] 
+                                    if i < count),
+                              tuple(result['values'][:count]))
+
+    def _mode(self, mode):
+        '''check_all() mode of mode. Negated checks follow De Morgan: none of
+        the conditions holding is all of the negated checks holding, and not
+        all of them holding is any of the negated checks holding.'''
+
+        if self.negate:
+            return 'all' if mode == 'any' else 'any'
+
+        return mode
+
+    def _match(self, mode, conditions, kwargs, ready_state = None):
+        '''evaluate multiple locator conditions together, see any_of() and 
+        all_of().'''
+
+        specs = self._specs(conditions, ready_state)
+        mode = self._mode(mode)
+
+        if kwargs.pop('in_browser', self.in_browser):
+            result = self._observe(specs, mode, **kwargs)
+        else:
+            negate = self.negate
+            condition = lambda driver: driver.execute_script(scripts.EVALUATE,
+                                                             specs, mode,
+                                                             negate)
+
+            # negation is handled by the script itself: always poll until the
+            # script reports a match, even under WaitUntilNot
+            result = WaitUntil.__call__(self, condition, **kwargs)
+
+        return self._matched(result, conditions)
+
+    @telemetry.recorded
+    def any_of(self, *conditions, **kwargs):
+        """An expectation for checking that at least one of multiple locator
+        conditions is met. All conditions are evaluated together, in a single
+        browser call per poll (or a single in-browser wait in in_browser mode).
+
+        Each condition is a (method, locator) tuple, where method is the name
+        of a condition method supporting in-browser evaluation (see
+        IN_BROWSER_CHECKS) and locator is a locator tuple or a dict using the
+        kwargs style location-by shorthand. Eg:
+            WaitUntil.any_of(
+                ('visibility_of_element_located', (By.ID, 'success')),
+                ('visibility_of_element_located', {'css': '.error-toast'}))
+
+        returns a ConditionMatch(fired, elements) tuple, where fired are the
+        indexes of the conditions that were met, and elements the per-condition
+        result (the element, True, or None for conditions not met).
+
+        Arguments
+            conditions (tuple): (method, locator) conditions to wait for
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+            in_browser (bool): evaluate the conditions inside the browser
+            kwargs (dict): any other argument for WebDriverWait() api
+        """
+        return self._match('any', conditions, kwargs)
+
+    @telemetry.recorded
+    def all_of(self, *conditions, ready_state = None, **kwargs):
+        """An expectation for checking that all of multiple locator conditions
+        are met. All conditions are evaluated together, in a single browser 
+        call per poll (or a single in-browser wait in in_browser mode).
+
+        See any_of() for the condition format. Eg:
+            WaitUntil.all_of(
+                ('element_to_be_clickable', {'id': 'submit'}),
+                ('invisibility_of_element_located', {'css': '.spinner'}))
+
+        When ready_state is given, the document must also have reached that
+        document.readyState ('loading', 'interactive' or 'complete'), and 
+        must not be one that is being navigated away from (see 
+        scripts.LEAVE). No conditions are then required.
+
+        returns a ConditionMatch(fired, elements) tuple, where fired are the
+        indexes of all conditions, and elements the per-condition result (the 
+        element or True).
+
+        Arguments
+            conditions (tuple): (method, locator) conditions to wait for
+            ready_state (str): document.readyState to reach as well
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+            in_browser (bool): evaluate the conditions inside the browser
+            kwargs (dict): any other argument for WebDriverWait() api
+        """
+        return self._match('all', conditions, kwargs, ready_state)
+
+    def _count(self, op, number, locator, return_elements, kwargs):
+        '''wait for the number of elements matching locator to compare to
+        number, counting inside the browser using scripts.COUNT.'''
+
+        condition, kwargs = self._count_condition(op, number, locator,
+                                                  return_elements, kwargs)
+
+        # negation is handled by the script itself
+        result = WaitUntil.__call__(self, condition, **kwargs)
+
+        return self._counted(result, return_elements)
+
+    def _count_condition(self, op, number, locator, return_elements, kwargs):
+        locator, kwargs = utils.translate_args_with_passthru(locator, **kwargs)
+        kwargs.pop('in_browser', None)
+
+        by, value = locator
+        limit = return_elements or 0
+        negate = self.negate
+
+        condition = lambda driver: driver.execute_script(scripts.COUNT,
+                                                         by, value, op,
+                                                         number, limit,
+                                                         negate)
+        return condition, kwargs
+
+    @staticmethod
+    def _counted(result, return_elements):
+        if return_elements is None:
+            return result['count']
+
+        return result['elements']
+
+    @telemetry.recorded
+    def number_of_elements_to_be(self, number, locator = None, 
+                                 return_elements = None, **kwargs):
+        """An expectation for the number of elements matching a locator to be
+        exactly number. Elements are counted inside the browser: polls only
+        transfer the count, never the element references.
+
+        returns the element count, or the first return_elements elements
+        when provided.
+
+        This API supports kwargs style location-by shorthand. Eg:
+            WaitUntil.number_of_elements_to_be(10, css = 'tr.row', ...)
+
+        Arguments
+            number (int): expected number of elements
+            locator (tuple): location describing the location by
+            return_elements (int): return (up to) this many elements instead
+                                   of the count, once the condition holds
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+            kwargs (dict): any other argument for WebDriverWait() api
+        """
+        return self._count('eq', number, locator, return_elements, kwargs)
+
+    @telemetry.recorded
+    def number_of_elements_at_least(self, number, locator = None, 
+                                    return_elements = None, **kwargs):
+        """An expectation for at least number elements to match a locator.
+        Elements are counted inside the browser, see 
+        number_of_elements_to_be().
+
+        returns the element count, or the first return_elements elements
+        when provided.
+
+        Arguments
+            number (int): minimum number of elements
+            locator (tuple): location describing the location by
+            return_elements (int): return (up to) this many elements instead
+                                   of the count, once the condition holds
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+            kwargs (dict): any other argument for WebDriverWait() api
+        """
+        return self._count('ge', number, locator, return_elements, kwargs)
+
+    @telemetry.recorded
+    def number_of_elements_less_than(self, number, locator = None, 
+                                     return_elements = None, **kwargs):
+        """An expectation for less than number elements to match a locator.
+        Elements are counted inside the browser, see 
+        number_of_elements_to_be().
+
+        returns the element count, or the first return_elements elements
+        when provided.
+
+        Arguments
+            number (int): number of elements to stay under
+            locator (tuple): location describing the location by
+            return_elements (int): return (up to) this many elements instead
+                                   of the count, once the condition holds
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+            kwargs (dict): any other argument for WebDriverWait() api
+        """
+        return self._count('lt', number, locator, return_elements, kwargs)
+
+    @telemetry.recorded
+    def network_idle(self, quiet_ms = 500, max_inflight = 0, **kwargs):
+        """An expectation for the page network activity to quiet down: no
+        more than max_inflight fetch/XHR requests pending, the document
+        loaded, and no request started/finished nor resource loaded for the
+        last quiet_ms milliseconds.
+
+        Requests are tracked by instrumenting fetch() and XMLHttpRequest in
+        the page on first use, and evaluated inside the browser: the wait
+        returns the moment the page quiets down. Requests started before the
+        first use are only accounted for through resource timing.
+
+        returns True once the network is idle.
+
+        Arguments
+            quiet_ms (int): milliseconds without network activity
+            max_inflight (int): number of pending requests still considered
+                                idle (eg: long-polling connections)
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+        """
+        return self._quiet('network', quiet_ms, max_inflight, kwargs)
+
+    @telemetry.recorded
+    def dom_stable(self, quiet_ms = 500, **kwargs):
+        """An expectation for the page DOM to stop changing: no mutation
+        (nodes, attributes or text) for the last quiet_ms milliseconds.
+
+        Mutations are tracked by a MutationObserver installed in the page on
+        first use, and evaluated inside the browser: the wait returns the
+        moment the DOM settles. The first wait on a page therefore always
+        lasts at least quiet_ms.
+
+        returns True once the DOM is stable.
+
+        Arguments
+            quiet_ms (int): milliseconds without DOM mutations
+            timeout (int): seconds to wait for
+            message (str): message to display if timed out
+        """
+        return self._quiet('dom', quiet_ms, 0, kwargs)
+
+
+    @telemetry.recorded
     def title_is(self, title, **kwargs): 
         """An expectation for checking the title of a page.
         title is the expected title, which must be an exact match
@@ -75,6 +701,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def title_contains(self, title, **kwargs): 
         """An expectation for checking that the title contains a case-sensitive
         substring. title is the fragment of title expected
@@ -91,6 +718,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def presence_of_element_located(self, locator = None, **kwargs):
         """ An expectation for checking that an element is present on the DOM
         of a page. This does not necessarily mean that the element is visible.
@@ -107,15 +735,18 @@ class WaitUntil(object):
             locator (tuple): location describing the location by
             timeout (int): seconds to wait for
             message (str): message to display if timed out
+            in_browser (bool): evaluate the condition inside the browser
             kwargs (dict): any other argument for WebDriverWait() api
         """
 
         locator, kwargs = utils.translate_args_with_passthru(locator, **kwargs)
         condition = EC.presence_of_element_located(locator)
 
-        return self(condition, **kwargs)
+        return self._located('presence_of_element_located', locator, condition,
+                             kwargs)
 
 
+    @telemetry.recorded
     def visibility_of_element_located(self, locator = None, **kwargs):
         """An expectation for checking that an element is present on the DOM of
         a page and visible. Visibility means that the element is not only 
@@ -133,15 +764,18 @@ class WaitUntil(object):
             locator (tuple): location describing the location by
             timeout (int): seconds to wait for
             message (str): message to display if timed out
+            in_browser (bool): evaluate the condition inside the browser
             kwargs (dict): any other argument for WebDriverWait() api
         """
 
         locator, kwargs = utils.translate_args_with_passthru(locator, **kwargs)
         condition = EC.visibility_of_element_located(locator)
 
-        return self(condition, **kwargs)
+        return self._located('visibility_of_element_located', locator, condition,
+                             kwargs)
 
 
+    @telemetry.recorded
     def visibility_of(self, element, **kwargs):
         """ An expectation for checking that an element, known to be present on 
         the DOM of a page, is visible. Visibility means that the element is not 
@@ -160,6 +794,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def presence_of_all_elements_located(self, locator = None, **kwargs):
         """ An expectation for checking that there is at least one element
         present on a web page.
@@ -185,6 +820,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def visibility_of_any_elements_located(self, locator = None, **kwargs):
         """ An expectation for checking that there is at least one element 
         visible on a web page.
@@ -211,6 +847,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def text_to_be_present_in_element(self, 
                                       *,
                                       text, 
@@ -239,6 +876,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def text_to_be_present_in_element_value(self, *,
                                             text, 
                                             locator = None, 
@@ -267,6 +905,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def frame_to_be_available_and_switch_to_it(self, locator = None, **kwargs):
         """ An expectation for checking whether the given frame is available to
         switch to.  If the frame is available it switches the given driver to
@@ -292,6 +931,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def invisibility_of_element_located(self, locator = None, **kwargs):
         """ An Expectation for checking that an element is either invisible 
         or not present on the DOM.
@@ -308,14 +948,17 @@ class WaitUntil(object):
             locator (tuple): location describing the location by
             timeout (int): seconds to wait for
             message (str): message to display if timed out
+            in_browser (bool): evaluate the condition inside the browser
             kwargs (dict): any other argument for WebDriverWait() api
         """
         locator, kwargs = utils.translate_args_with_passthru(locator, **kwargs)
         condition = EC.invisibility_of_element_located(locator)
 
-        return self(condition, **kwargs)
+        return self._located('invisibility_of_element_located', locator, condition,
+                             kwargs)
 
 
+    @telemetry.recorded
     def element_to_be_clickable(self, locator = None, **kwargs):
         """ An Expectation for checking an element is visible and enabled such 
         that you can click it
@@ -330,14 +973,17 @@ class WaitUntil(object):
             locator (tuple): location describing the location by
             timeout (int): seconds to wait for
             message (str): message to display if timed out
+            in_browser (bool): evaluate the condition inside the browser
             kwargs (dict): any other argument for WebDriverWait() api
         """
         locator, kwargs = utils.translate_args_with_passthru(locator, **kwargs)
         condition = EC.element_to_be_clickable(locator)
 
-        return self(condition,**kwargs)
+        return self._located('element_to_be_clickable', locator, condition,
+                             kwargs)
 
 
+    @telemetry.recorded
     def staleness_of(self, element, **kwargs):
         """ Wait until an element is no longer attached to the DOM.
         element is the element to wait for.
@@ -355,6 +1001,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def element_to_be_selected(self, element, **kwargs):
         """ An expectation for checking the selection is selected.
         element is WebElement object
@@ -370,6 +1017,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def element_located_to_be_selected(self, locator = None, **kwargs):
         """An expectation for the element to be located is selected.
         locator is a tuple of (by, path)
@@ -392,6 +1040,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def element_selection_state_to_be(self, element, state, **kwargs):
         """ An expectation for checking if the given element is selected.
         element is WebElement object
@@ -408,6 +1057,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def element_located_selection_state_to_be(self, *,
                                               state, 
                                               locator = None, 
@@ -438,6 +1088,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def number_of_windows_to_be(self, num_windows, **kwargs):
         """ An expectation for the number of windows to be a certain value.
     
@@ -451,6 +1102,7 @@ class WaitUntil(object):
 
         return self(condition, **kwargs)
 
+    @telemetry.recorded
     def new_window_is_opened(self, current_handles, **kwargs):
         """ An expectation that a new window will be opened and have the number
         of windows handles increase
@@ -466,6 +1118,7 @@ class WaitUntil(object):
         return self(condition, **kwargs)
 
 
+    @telemetry.recorded
     def alert_is_present(self, **kwargs):
         """ Expect an alert to be present.
 
@@ -482,8 +1135,9 @@ class WaitUntil(object):
 class WaitUntilNot(WaitUntil):
     '''Class to allow users to perform a wait-until-not'''
 
+    negate = True
+
     def __call__(self, condition, timeout = None, message = '', **kwargs):
 
-        return WebDriverWait(driver = self.driver, 
-                             timeout = timeout or self.timeout, 
-                             **kwargs).until_not(condition, message)
\ No newline at end of file
+        with self._no_implicit_wait():
+            return self._waiter(timeout, kwargs).until_not(condition, message)
\ No newline at end of file
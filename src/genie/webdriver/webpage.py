@@ -1,9 +1,108 @@
+import inspect
+import warnings
+from collections import namedtuple
 from urllib.parse import urljoin
-from . import utils, wait, interact
+from . import utils, wait, interact, polling, element, scripts, telemetry
+from .delegation import DriverDelegation
 
 DEFAULT_TIMEOUT = 10
 
-class WebPage(object):
+# names of the element descriptors prefetched by WebPage.prefetch(): ready
+# to use (found, and cached if enabled), found but not displayed/enabled yet
+# (pending), and not found
+Prefetched = namedtuple('Prefetched', ['found', 'pending', 'missing'])
+
+# WebPage.PAGE_LOAD_STRATEGY values, from the slowest to the fastest, and 
+# the document.readyState open() then waits for, unless the driver session
+# pageLoadStrategy already made driver.get() wait for the complete document
+PAGE_LOAD_STRATEGIES = {
+    'normal': 'complete',
+    'eager': 'interactive',
+    'none': 'loading',
+}
+
+class WebPage(DriverDelegation):
+
+    # evaluate locator based wait conditions inside the browser
+    # (see wait.WaitUntil)
+    IN_BROWSER_WAITS = False
+
+    # default polling strategy for this page's waits (see polling module)
+    POLL_STRATEGY = polling.FixedPolling()
+
+    # telemetry.WaitRecorder recording this page's waits, if any
+    # (eg, telemetry.wait_recorder)
+    WAIT_RECORDER = None
+
+    # timings.TimingStore learning per-locator timeouts of this page's waits,
+    # if any
+    WAIT_TIMINGS = None
+
+    # collect navigation/resource timings on open(), into load_timing (see
+    # telemetry.NavigationTiming)
+    LOAD_TIMING = False
+
+    # telemetry.LoadRecorder aggregating this page's load timings, if any
+    # (eg, telemetry.load_recorder). Implies LOAD_TIMING
+    LOAD_RECORDER = None
+
+    # how TextBox descriptors set values, unless given their own input_mode:
+    # keys, js or auto (see element.TextBox)
+    INPUT_MODE = 'keys'
+
+    # cache elements resolved by element descriptors, per page instance
+    # (see element.ElementCache)
+    ELEMENT_CACHE = False
+
+    # prefetch() all element descriptors when the page is opened (seeding
+    # the element cache if ELEMENT_CACHE is set)
+    PREFETCH = False
+
+    # how open() loads the page, after selenium's page load strategies:
+    #   normal: return once the page and all its resources loaded
+    #   eager: return once the document is interactive (html parsed)
+    #   none: return as soon as the next document is loading
+    # driver.get() follows the pageLoadStrategy of the driver session: the
+    # session must use this strategy (or a faster one) for loads to return
+    # any earlier
+    PAGE_LOAD_STRATEGY = 'normal'
+
+    # open() skips loading the page when the browser already is on its url
+    REUSE_LOADED = False
+
+    # open() changes routes through the History API instead of loading the
+    # page, when the browser is on the same origin (single page applications
+    # with a History API based router). READY should then tell when the new
+    # route is rendered
+    SPA_NAVIGATION = False
+
+    # readiness contract: conditions defining when this page is usable, 
+    # waited for by open() together with the page load, in a single 
+    # combined wait (see wait.WaitUntil.all_of()). Each one is either a
+    # (method, locator) condition, or a locator (tuple or dict) waiting for
+    # its element to be visible
+    READY = ()
+
+    # {name: descriptor} of the element descriptors declared by this page
+    # class and its bases, collected when the class is created
+    element_descriptors = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if cls.PAGE_LOAD_STRATEGY not in PAGE_LOAD_STRATEGIES:
+            raise ValueError("Unsupported PAGE_LOAD_STRATEGY '%s' for %s, "
+                             "must be one of: %s" 
+                             % (cls.PAGE_LOAD_STRATEGY, cls.__name__,
+                                list(PAGE_LOAD_STRATEGIES)))
+
+        cls.element_descriptors = {}
+
+        for name in dir(cls):
+            value = inspect.getattr_static(cls, name)
+
+            if isinstance(value, element.PageElement):
+                cls.element_descriptors[name] = value
 
     @property
     def URL(self):
@@ -16,7 +115,15 @@ class WebPage(object):
                  **urlkwargs):
         self.driver = driver
         self.timeout = timeout
-        self.wait = wait.Wait(self.driver, timeout)
+        self.element_cache = (element.ElementCache() 
+                              if self.ELEMENT_CACHE else None)
+        self.load_timing = None
+        self.wait = wait.Wait(self.driver, timeout,
+                              in_browser = self.IN_BROWSER_WAITS,
+                              poll_strategy = self.POLL_STRATEGY,
+                              recorder = self.WAIT_RECORDER,
+                              timings = self.WAIT_TIMINGS,
+                              owner = self)
         self.interact = interact.Interactions(self.driver, timeout)
         self.base_url = base_url
         self.urlkwargs = urlkwargs
@@ -26,19 +133,256 @@ class WebPage(object):
     def build_url(self):
         return urljoin(self.base_url, self.URL.format(**self.urlkwargs))
 
-    def __getattr__(self, attr):
-        # redirect get attribute to self.driver
-        if hasattr(self.driver, attr):
-            return getattr(self.driver, attr)
+    def deadline(self, seconds):
+        '''context manager sharing a single time budget across all waits
+        and element lookups within it, see wait.Deadline
+
+        Example:
+            with page.deadline(15):
+                page.search_box = 'cisco'
+                page.search_button.click()
+        '''
+        return wait.Deadline(seconds)
+
+    def open(self, reuse = None, spa = None):
+        '''load this page following its PAGE_LOAD_STRATEGY, and return once
+        its READY contract holds (see wait_until_ready()).
+
+        Load timings are only collected for actual page loads, neither for
+        reused pages nor for route changes.
+
+        Arguments
+            reuse (bool): skip loading when the browser already is on this
+                          page url, default to REUSE_LOADED
+            spa (bool): change routes through the History API when the 
+                        browser is on the same origin (see route()), 
+                        default to SPA_NAVIGATION
+
+        Example:
+            # move between routes of a single page application
+            DevicesPage(driver, base_url = url).open(spa = True)
+        '''
+        reuse = self.REUSE_LOADED if reuse is None else reuse
+        spa = self.SPA_NAVIGATION if spa is None else spa
+
+        loaded = False
+
+        if not reuse or utils.normalize_url(self.driver.current_url) != \
+                        utils.normalize_url(self.url):
+            self.invalidate_elements()
+
+            if not spa or not self.route(self.url):
+                self.load(self.url)
+                loaded = True
+
+        self.wait_until_ready()
+
+        if loaded and (self.LOAD_TIMING or self.LOAD_RECORDER is not None):
+            self.collect_load_timing()
+
+        if self.PREFETCH:
+            self.prefetch()
+
+    def load(self, url):
+        '''navigate to url through driver.get(), which returns according to
+        the pageLoadStrategy of the driver session: warns when that strategy
+        is slower than PAGE_LOAD_STRATEGY, as loads then take the time of
+        the session one.
+        '''
+        strategies = list(PAGE_LOAD_STRATEGIES)
+        session = self.session_load_strategy()
+
+        if strategies.index(session) < \
+           strategies.index(self.PAGE_LOAD_STRATEGY):
+            warnings.warn("%s PAGE_LOAD_STRATEGY is '%s', but the driver "
+                          "session pageLoadStrategy '%s' makes driver.get() "
+                          "wait longer" % (type(self).__name__, 
+                                           self.PAGE_LOAD_STRATEGY, session),
+                          RuntimeWarning, stacklevel = 2)
+
+        if session == 'none':
+            # driver.get() may return before the next document replaces this
+            # one: keep readiness checks off the current one
+            wait.Deadline.check()
+            self.driver.execute_script(scripts.LEAVE, url)
+
+        return self.driver.get(url)
+
+    def session_load_strategy(self):
+        '''return the pageLoadStrategy of the driver session, 'normal' (the
+        webdriver default) when unknown'''
+        strategy = self.driver.capabilities.get('pageLoadStrategy')
+
+        return strategy if strategy in PAGE_LOAD_STRATEGIES else 'normal'
+
+    def route(self, url):
+        '''change routes to url through the History API, without loading a
+        new document, for single page applications: url is pushed onto the
+        browser history and a popstate event lets the application router 
+        render it.
+
+        Returns
+            False, without navigating, when url is on another origin than 
+            the current document
+        '''
+        wait.Deadline.check()
+
+        return self.driver.execute_script(scripts.ROUTE, url)
+
+    def collect_load_timing(self, top = telemetry.SLOWEST_RESOURCES):
+        '''read the navigation and resource timings of the current document
+        in a single script call, keep them as load_timing and record them
+        into LOAD_RECORDER, if any.
+
+        Arguments
+            top (int): number of slowest resources to keep
+
+        Returns
+            telemetry.NavigationTiming
+
+        Example:
+            page.open()
+            timing = page.collect_load_timing()
+            print(timing.ttfb, timing.load, timing.slowest)
+        '''
+        self.load_timing = telemetry.NavigationTiming.collect(
+                                                    self.driver, 
+                                                    type(self).__qualname__,
+                                                    top)
+
+        if self.LOAD_RECORDER is not None:
+            self.LOAD_RECORDER.record(self.load_timing)
+
+        return self.load_timing
+
+    def ready_conditions(self):
+        '''return the READY contract of this page as (method, locator) 
+        conditions'''
+
+        conditions = []
+        for ready in self.READY:
+            if not isinstance(ready, dict) and \
+               ready[0] in wait.IN_BROWSER_CHECKS:
+                conditions.append(tuple(ready))
+            else:
+                conditions.append(('visibility_of_element_located', ready))
+
+        return conditions
+
+    def wait_until_ready(self, timeout = None):
+        '''wait for the READY contract of this page to hold, along with the
+        document.readyState its PAGE_LOAD_STRATEGY stops at, in a single 
+        combined wait.
+
+        Arguments
+            timeout (int): seconds to wait for, default to the page timeout
+
+        Returns
+            wait.ConditionMatch of the READY conditions, None when there was
+            nothing to wait for
+
+        Example:
+            class DevicesPage(WebPage):
+                URL = '/devices'
+                PAGE_LOAD_STRATEGY = 'eager'
+                READY = [(By.ID, 'device-table'),
+                         ('invisibility_of_element_located',
+                          {'css': '.spinner'})]
+        '''
+        ready_state = PAGE_LOAD_STRATEGIES[self.PAGE_LOAD_STRATEGY]
+        conditions = self.ready_conditions()
+
+        if self.session_load_strategy() == 'normal':
+            # driver.get() already waited for the complete document
+            ready_state = None
+
+        if not conditions and ready_state is None:
+            return None
+
+        return self.wait.until.all_of(*conditions, 
+                                      ready_state = ready_state,
+                                      timeout = timeout,
+                                      message = '%s not ready' 
+                                                % type(self).__name__)
+
+    def prefetch(self, names = None):
+        '''locate the element descriptors of this page (all of them, or only
+        names) with a single script call, and seed the element cache (when
+        enabled, see ELEMENT_CACHE) with the elements ready to use: 
+        displayed and enabled. Components get their root element cached.
+
+        Arguments
+            names (iterable): names of the element descriptors to prefetch,
+                              default to all of them (element_descriptors)
+
+        Returns
+            Prefetched(found, pending, missing) descriptor names
+
+        Example:
+            prefetched = page.prefetch()
+            assert not prefetched.missing, prefetched.missing
+        '''
+        if names is None:
+            names = [name for name, descriptor 
+                     in self.element_descriptors.items() 
+                     if descriptor.CACHEABLE]
         else:
-            raise AttributeError("'%s' object has no attribute '%s" 
-                                 % (type(self).__name__, attr))
+            names = list(names)
+
+        unknown = set(names) - set(self.element_descriptors)
+        if unknown:
+            raise ValueError('Not element descriptors of %s: %s' 
+                             % (type(self).__name__, sorted(unknown)))
+
+        descriptors = [self.element_descriptors[name] for name in names]
 
-    def __dir__(self):
-        return sorted(super().__dir__() + dir(self.driver))
+        prefetched = Prefetched([], [], [])
+        if not descriptors:
+            return prefetched
 
-    def open(self):
-        self.driver.get(self.url)
+        wait.Deadline.check()
+
+        results = self.driver.execute_script(scripts.PREFETCH, 
+                                             [list(descriptor.locator) 
+                                              for descriptor in descriptors])
+
+        for name, descriptor, result in zip(names, descriptors, results):
+            if result is None:
+                prefetched.missing.append(name)
+            elif isinstance(descriptor, element.Component):
+                getattr(self, name).root = result['element']
+                prefetched.found.append(name)
+            elif result['ready']:
+                if self.element_cache is not None:
+                    self.element_cache.set(descriptor, result['element'])
+                prefetched.found.append(name)
+            else:
+                prefetched.pending.append(name)
+
+        return prefetched
+
+    def invalidate_elements(self):
+        '''drop all cached elements, if element caching is enabled'''
+        if self.element_cache is not None:
+            self.element_cache.invalidate()
+
+    # driver navigation, invalidating cached elements
+
+    def get(self, url):
+        self.invalidate_elements()
+        return self.driver.get(url)
+
+    def back(self):
+        self.invalidate_elements()
+        return self.driver.back()
+
+    def forward(self):
+        self.invalidate_elements()
+        return self.driver.forward()
+
+    def refresh(self):
+        self.invalidate_elements()
+        return self.driver.refresh()
 
     def find_element(self, locator = None, **kwargs):
         locator = utils.translate_arguments(locator, **kwargs)
@@ -50,6 +394,52 @@ class WebPage(object):
 
         return self.driver.find_elements(*locator)
 
+    def snapshot(self, target = None, fields = None, attributes = (), 
+                 **kwargs):
+        '''read many properties of an element in a single script call, and
+        return them as an element.Snapshot record.
+
+        Arguments
+            target (obj): name of a page element descriptor of this page, a 
+                          locator, or a WebElement
+            fields (iterable): fields to read, default to all of them (see
+                               element.SNAPSHOT_FIELDS)
+            attributes (iterable): html attribute names to read
+            kwargs (dict): locator kwargs, instead of target
+
+        Example:
+            state = page.snapshot('login_button')
+            assert state.displayed and state.enabled
+
+            state = page.snapshot(id = 'username', fields = ('value',))
+        '''
+        if isinstance(target, str):
+            return self._page_element(target).snapshot(self, fields, 
+                                                       attributes)
+
+        if target is None or isinstance(target, (tuple, list)):
+            target = list(utils.translate_arguments(target, **kwargs))
+
+        return element.snapshot(self.driver, target, fields, attributes)
+
+    def ensure(self, name, value):
+        '''bring the page element descriptor name of this page to value
+        unless it already is, in a single script call, and return whether 
+        anything changed (see element.PageElement.ensure()).
+
+        Example:
+            page.ensure('remember_me', True)
+        '''
+        return self._page_element(name).ensure(self, value)
+
+    def _page_element(self, name):
+        descriptor = inspect.getattr_static(type(self), name)
+
+        if not isinstance(descriptor, element.PageElement):
+            raise TypeError("'%s' is not a page element" % name)
+
+        return descriptor
+
     def __enter__(self):
         self.open()
         return self